@@ -36,7 +36,7 @@ from integration.repositories import (
     MongoPizzaRepository,
 )
 
-from neuroglia.data.infrastructure.mongo import MotorRepository
+from neuroglia.data.infrastructure.mongo import MongoIndex, MotorRepository
 from neuroglia.eventing.cloud_events.infrastructure import (
     CloudEventIngestor,
     CloudEventMiddleware,
@@ -105,6 +105,7 @@ def create_pizzeria_app(data_dir: Optional[str] = None, port: int = 8080):
         collection_name="orders",
         domain_repository_type=IOrderRepository,
         implementation_type=MongoOrderRepository,
+        indexes=[MongoIndex.create("customer_id"), MongoIndex.create("customer_phone"), MongoIndex.create("status")],
     )
     MotorRepository.configure(
         builder,
@@ -1,8 +1,7 @@
 from decimal import Decimal
 from typing import List
 import uuid
-from multipledispatch import dispatch
-from neuroglia.data.abstractions import AggregateRoot, AggregateState
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, applies
 from neuroglia.mapping.mapper import map_to
 from samples.openbank.domain.events.bank_account import BankAccountCreatedDomainEventV1
 from samples.openbank.domain.events.bank_transaction import BankAccountTransactionRecordedDomainEventV1
@@ -25,15 +24,15 @@ class BankAccountStateV1(AggregateState[str]):
 
     overdraft_limit: Decimal
 
-    @dispatch(BankAccountCreatedDomainEventV1)
-    def on(self, e: BankAccountCreatedDomainEventV1):
+    @applies(BankAccountCreatedDomainEventV1)
+    def _on_created(self, e: BankAccountCreatedDomainEventV1):
         self.id = e.aggregate_id
         self.created_at = e.created_at
         self.owner_id = e.owner_id
         self.overdraft_limit = e.overdraft_limit
 
-    @dispatch(BankAccountTransactionRecordedDomainEventV1)
-    def on(self, e: BankAccountTransactionRecordedDomainEventV1):
+    @applies(BankAccountTransactionRecordedDomainEventV1)
+    def _on_transaction_recorded(self, e: BankAccountTransactionRecordedDomainEventV1):
         self.last_modified = e.created_at
         self.transactions.append(e.transaction)
         self._compute_balance()
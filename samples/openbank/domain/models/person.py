@@ -1,8 +1,7 @@
 import uuid
 from datetime import date
 
-from multipledispatch import dispatch
-from neuroglia.data.abstractions import AggregateRoot, AggregateState
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, applies
 from neuroglia.mapping.mapper import map_to
 from samples.openbank.domain.models import Address
 from samples.openbank.integration import PersonGender
@@ -28,8 +27,8 @@ class PersonStateV1(AggregateState[str]):
 
     address: Address
 
-    @dispatch(PersonRegisteredDomainEventV1)
-    def on(self, e: PersonRegisteredDomainEventV1):
+    @applies(PersonRegisteredDomainEventV1)
+    def _on_registered(self, e: PersonRegisteredDomainEventV1):
         self.id = e.aggregate_id
         self.created_at = e.created_at
         self.first_name = e.first_name
@@ -4,37 +4,88 @@ Provides configurable type scanning instead of hardcoded patterns.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 from neuroglia.core.module_loader import ModuleLoader
 from neuroglia.core.type_finder import TypeFinder
 
 
+def _is_enum_type(t: Any) -> bool:
+    return isinstance(t, type) and issubclass(t, Enum) and t != Enum
+
+
+class EnumIndex:
+    """
+    Represents a reverse index of enum members, used to resolve string values in constant time.
+    Members are indexed by value and by name, the first indexed enum winning on conflicts.
+    """
+
+    def __init__(self, enum_types: Optional[list[type[Enum]]] = None):
+        self._members_by_value: dict[Any, Enum] = {}
+        self._members_by_name: dict[str, Enum] = {}
+        for enum_type in enum_types or []:
+            self.add(enum_type)
+
+    def add(self, enum_type: type[Enum]) -> None:
+        """Indexes the members of the specified enum type"""
+        for enum_member in enum_type:
+            self._members_by_name.setdefault(enum_member.name, enum_member)
+            try:
+                self._members_by_value.setdefault(enum_member.value, enum_member)
+            except TypeError:
+                # Unhashable values can only be matched by name
+                pass
+
+    def find(self, value: str) -> Optional[Enum]:
+        """
+        Finds the enum member matching the specified value, trying, in order, an exact match on value,
+        a lower-cased match on value, an exact match on name and an upper-cased match on name.
+        """
+        enum_member = self._members_by_value.get(value)
+        if enum_member is None:
+            enum_member = self._members_by_value.get(value.lower())
+        if enum_member is None:
+            enum_member = self._members_by_name.get(value)
+        if enum_member is None:
+            enum_member = self._members_by_name.get(value.upper())
+        return enum_member
+
+
 class TypeRegistry:
     """
     Registry for type discovery and caching.
     Allows configurable module scanning instead of hardcoded patterns.
+
+    Enum members are resolved through reverse indexes (value -> member, name -> member), built once
+    for the registered modules and once per target type module, and invalidated when modules are registered.
     """
 
     def __init__(self):
         self._enum_cache: dict[str, type[Enum]] = {}
+        self._enum_index = EnumIndex()
+        self._module_enum_indexes: dict[str, EnumIndex] = {}
         self._registered_modules: list[str] = []
         self._cache_dirty = True
 
     def register_modules(self, module_names: list[str]) -> None:
         """Register modules to scan for types (enums, etc.)"""
         self._registered_modules.extend(module_names)
-        self._cache_dirty = True
+        self._invalidate()
 
     def register_module(self, module_name: str) -> None:
         """Register a single module to scan for types"""
         if module_name not in self._registered_modules:
             self._registered_modules.append(module_name)
-            self._cache_dirty = True
+            self._invalidate()
 
     def clear_cache(self) -> None:
         """Clear the type cache to force re-scanning"""
         self._enum_cache.clear()
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Marks the enum cache and indexes as stale"""
+        self._module_enum_indexes.clear()
         self._cache_dirty = True
 
     def _ensure_cache_populated(self) -> None:
@@ -43,6 +94,7 @@ class TypeRegistry:
             return
 
         self._enum_cache.clear()
+        self._enum_index = EnumIndex()
 
         for module_name in self._registered_modules:
             try:
@@ -50,7 +102,7 @@ class TypeRegistry:
                 # Use TypeFinder to get all Enum types from the module
                 enum_types = TypeFinder.get_types(
                     module,
-                    predicate=lambda t: (isinstance(t, type) and issubclass(t, Enum) and t != Enum),
+                    predicate=_is_enum_type,
                     include_sub_modules=True,
                     include_sub_packages=False,
                 )
@@ -63,8 +115,30 @@ class TypeRegistry:
                 # Silently skip modules that can't be loaded
                 continue
 
+        for enum_type in self._enum_cache.values():
+            self._enum_index.add(enum_type)
+
         self._cache_dirty = False
 
+    def _get_module_enum_index(self, module_name: str) -> EnumIndex:
+        """Gets the index of the enums declared by the specified module, scanning the module on first use only"""
+        index = self._module_enum_indexes.get(module_name)
+        if index is not None:
+            return index
+        try:
+            module = ModuleLoader.load(module_name)
+            local_enums = TypeFinder.get_types(
+                module,
+                predicate=_is_enum_type,
+                include_sub_modules=False,
+                include_sub_packages=False,
+            )
+            index = EnumIndex(local_enums)
+        except (ImportError, AttributeError):
+            index = EnumIndex()
+        self._module_enum_indexes[module_name] = index
+        return index
+
     def find_enum_for_value(self, value: str, target_type: Optional[type] = None) -> Optional[Enum]:
         """
         Find an enum member that matches the given string value.
@@ -79,40 +153,12 @@ class TypeRegistry:
         if target_type:
             target_module_name = getattr(target_type, "__module__", None)
             if target_module_name:
-                try:
-                    target_module = ModuleLoader.load(target_module_name)
-                    local_enums = TypeFinder.get_types(
-                        target_module,
-                        predicate=lambda t: (isinstance(t, type) and issubclass(t, Enum) and t != Enum),
-                        include_sub_modules=False,
-                        include_sub_packages=False,
-                    )
-
-                    for enum_type in local_enums:
-                        enum_member = self._try_match_enum_value(value, enum_type)
-                        if enum_member:
-                            return enum_member
-
-                except (ImportError, AttributeError):
-                    pass
+                enum_member = self._get_module_enum_index(target_module_name).find(value)
+                if enum_member is not None:
+                    return enum_member
 
         # Then try all cached enums
-        for enum_type in self._enum_cache.values():
-            enum_member = self._try_match_enum_value(value, enum_type)
-            if enum_member:
-                return enum_member
-
-        return None
-
-    def _try_match_enum_value(self, value: str, enum_type: type[Enum]) -> Optional[Enum]:
-        """Try to match a string value to an enum member"""
-        try:
-            for enum_member in enum_type:
-                if enum_member.value == value or enum_member.value == value.lower() or enum_member.name == value or enum_member.name == value.upper():
-                    return enum_member
-        except Exception:
-            pass
-        return None
+        return self._enum_index.find(value)
 
     def get_registered_modules(self) -> list[str]:
         """Get list of currently registered modules"""
@@ -12,11 +12,13 @@ from .abstractions import (
     Entity,
     Identifiable,
     VersionedState,
+    applies,
 )
 
 # Exceptions
 from .exceptions import (
     DataAccessException,
+    DuplicateEntityException,
     EntityNotFoundException,
     OptimisticConcurrencyException,
 )
@@ -43,6 +45,7 @@ __all__ = [
     "Identifiable",
     "VersionedState",
     "AggregateState",
+    "applies",
     # Repository patterns
     "Repository",
     "QueryableRepository",
@@ -51,6 +54,7 @@ __all__ = [
     "DataAccessException",
     "OptimisticConcurrencyException",
     "EntityNotFoundException",
+    "DuplicateEntityException",
     # Resource-oriented architecture (commented out to avoid circular imports)
     # "resources"
 ]
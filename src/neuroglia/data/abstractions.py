@@ -1,6 +1,7 @@
 from abc import ABC
 from datetime import datetime, timezone
-from typing import Generic, TypeVar
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
 
 TKey = TypeVar("TKey")
 """ Represents the generic argument used to specify the type of key to use """
@@ -103,6 +104,43 @@ class VersionedState(ABC):
     """ Gets the state's version """
 
 
+def applies(*event_types: type) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that registers the decorated method of an AggregateState as the method applying the specified domain event types.
+
+    The registrations of each state class are compiled once, when the class is defined, into a dispatch table used by
+    AggregateState.on: applying an event costs a dictionary lookup on its type. Events are dispatched to the method
+    registered for their closest base type when their own type has no registration.
+
+    Args:
+        event_types: The types of the domain events applied by the decorated method
+
+    Examples:
+        ```python
+        class AccountState(AggregateState[str]):
+            @applies(AccountOpenedDomainEvent)
+            def _on_opened(self, e: AccountOpenedDomainEvent):
+                self.id = e.aggregate_id
+                self.balance = Decimal(0)
+
+            @applies(MoneyDepositedDomainEvent, InterestPaidDomainEvent)
+            def _on_credited(self, e: DomainEvent):
+                self.balance += e.amount
+
+        account.state.on(account.register_event(MoneyDepositedDomainEvent(account.id(), Decimal(10))))
+        ```
+
+    See Also:
+        - Event Sourcing Guide: https://bvandewe.github.io/pyneuro/patterns/event-sourcing/
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        fn.__applies__ = event_types
+        return fn
+
+    return decorator
+
+
 class AggregateState(Generic[TKey], Identifiable[TKey], VersionedState, ABC):
     """
     Represents an abstraction for aggregate root state management with enhanced tracking capabilities.
@@ -160,6 +198,31 @@ class AggregateState(Generic[TKey], Identifiable[TKey], VersionedState, ABC):
     last_modified: datetime
     """ Gets the date and time, if any, the aggregate was last modified at """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # compile the @applies registrations of the class, honoring overridden methods, into a type/method dispatch table
+        members: dict[str, Any] = {}
+        for base in reversed(cls.__mro__):
+            members.update(vars(base))
+        cls.__event_handlers__ = {event_type: member for member in members.values() for event_type in getattr(member, "__applies__", ())}
+
+    def on(self, e: "DomainEvent") -> None:
+        """Applies the specified domain event, using the method registered with @applies for its type. States can override it to dispatch events themselves"""
+        handler = self.__event_handlers__.get(type(e))
+        if handler is None:
+            handler = type(self)._resolve_event_handler(type(e))
+        handler(self, e)
+
+    @classmethod
+    def _resolve_event_handler(cls, event_type: type) -> Callable[..., Any]:
+        """Resolves the method registered for the closest base of the specified event type, and caches it for the event type"""
+        for base_type in event_type.__mro__[1:]:
+            handler = cls.__event_handlers__.get(base_type)
+            if handler is not None:
+                cls.__event_handlers__[event_type] = handler
+                return handler
+        raise NotImplementedError(f"{cls.__name__} does not apply events of type '{event_type.__name__}': register a method with @applies({event_type.__name__})")
+
 
 TState = TypeVar("TState", bound=AggregateState)
 """ Represents the generic argument used to specify the state of an aggregate root """
@@ -302,12 +365,17 @@ class AggregateRoot(Generic[TState, TKey], Entity[TKey], ABC):
 
     @classmethod
     def _get_state_type(cls):
-        """Resolves the state type declared for the aggregate root."""
+        """Resolves the state type declared for the aggregate root. The type is resolved once per aggregate root type"""
+        state_type = cls.__dict__.get("__state_type__")
+        if state_type is not None:
+            return state_type
         orig_bases = getattr(cls, "__orig_bases__", None)
         if orig_bases:
             base = orig_bases[0]
             if hasattr(base, "__args__") and base.__args__:
-                return base.__args__[0]
+                state_type = base.__args__[0]
+                cls.__state_type__ = state_type
+                return state_type
         raise TypeError(f"{cls.__name__} must specify an AggregateState generic argument")
 
 
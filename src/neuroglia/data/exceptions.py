@@ -111,3 +111,30 @@ class EntityNotFoundException(DataAccessException):
             message = f"{entity_type} '{entity_id}' not found"
 
         super().__init__(message)
+
+
+class DuplicateEntityException(DataAccessException):
+    """
+    Exception raised when an entity cannot be added because an entity with the same key already exists in the data store.
+
+    Attributes:
+        entity_id: The unique identifier of the duplicate entity
+        entity_type: Optional type name of the entity
+    """
+
+    def __init__(self, entity_id: Any, entity_type: Optional[str] = None):
+        """
+        Initialize a duplicate entity exception.
+
+        Args:
+            entity_id: The unique identifier of the duplicate entity
+            entity_type: Optional type name for better error messages
+        """
+        self.entity_id = entity_id
+        self.entity_type = entity_type
+
+        message = f"Entity '{entity_id}' already exists"
+        if entity_type:
+            message = f"{entity_type} '{entity_id}' already exists"
+
+        super().__init__(message)
@@ -215,6 +215,31 @@ class Repository(Generic[TEntity, TKey], ABC):
         if hasattr(entity, "clear_pending_events"):
             entity.clear_pending_events()
 
+    async def _publish_domain_events_batch(self, entities: list[TEntity]) -> None:
+        """
+        Publish the domain events of aggregates persisted together, after their successful persistence, in a single batch.
+
+        Events are published with one Mediator.publish_batch_async call, in the order of the aggregates, and are then
+        cleared from the aggregates. Event publishing failures are logged but do not fail the operation (best-effort).
+
+        Args:
+            entities: The entities that were persisted
+        """
+        if not self._mediator:
+            return  # No mediator configured - skip event publishing
+
+        aggregates = [entity for entity in entities if isinstance(entity, AggregateRoot)]
+        events = [event for aggregate in aggregates for event in aggregate.get_uncommitted_events()]
+        if events:
+            try:
+                await self._mediator.publish_batch_async(events)
+                logger.debug(f"Published a batch of {len(events)} domain events")
+            except Exception as e:
+                logger.error(f"Failed to publish a batch of {len(events)} domain events: {e}", exc_info=True)
+
+        for aggregate in aggregates:
+            aggregate.clear_pending_events()
+
 
 class QueryableRepository(Generic[TEntity, TKey], Repository[TEntity, TKey], ABC):
     """
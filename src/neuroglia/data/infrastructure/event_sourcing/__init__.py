@@ -1,19 +1,31 @@
 """
 Event sourcing infrastructure for Neuroglia.
 
-Provides event store implementations and aggregate root support.
+Provides event store implementations, aggregate root support, aggregate snapshots and projection rebuilds.
 """
 
 from .abstractions import (
     Aggregator,
+    AppendResult,
     EventDescriptor,
     EventRecord,
     EventStore,
     EventStoreOptions,
+    ProjectionCheckpoint,
+    ProjectionCheckpointStore,
+    ProjectionRebuildTarget,
+    Snapshot,
+    SnapshotPolicy,
+    SnapshotStore,
     StreamDescriptor,
     StreamReadDirection,
 )
-from .event_sourcing_repository import EventSourcingRepository
+from .event_sourcing_repository import (
+    EventSourcingRepository,
+    EventSourcingRepositoryOptions,
+)
+from .event_upcaster_registry import EventUpcaster, EventUpcasterRegistry
+from .projection_rebuilder import ProjectionRebuilder, ProjectionRebuildOptions
 from .read_model_reconciliator import (
     ReadModelConciliationOptions,
     ReadModelReconciliator,
@@ -22,12 +34,24 @@ from .read_model_reconciliator import (
 __all__ = [
     "EventStore",
     "EventSourcingRepository",
+    "EventSourcingRepositoryOptions",
     "EventRecord",
     "EventDescriptor",
     "StreamDescriptor",
     "StreamReadDirection",
     "EventStoreOptions",
     "Aggregator",
+    "AppendResult",
+    "EventUpcaster",
+    "EventUpcasterRegistry",
+    "Snapshot",
+    "SnapshotPolicy",
+    "SnapshotStore",
+    "ProjectionCheckpoint",
+    "ProjectionCheckpointStore",
+    "ProjectionRebuildTarget",
+    "ProjectionRebuilder",
+    "ProjectionRebuildOptions",
     "ReadModelConciliationOptions",
     "ReadModelReconciliator",
 ]
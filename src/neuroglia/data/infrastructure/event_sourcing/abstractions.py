@@ -1,7 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
@@ -98,6 +100,9 @@ class EventRecord:
     replayed: bool = False
     """ Gets a boolean indicating whether or not the recorded event is being replayed to its consumer/consumer group """
 
+    link_offset: Optional[int] = None
+    """ Gets the offset, in the category stream the recorded event has been read from, of the link to it, if any """
+
 
 @dataclass
 class AckableEventRecord(EventRecord):
@@ -125,6 +130,25 @@ class StreamReadDirection(Enum):
     """ Indicates a backwards direction """
 
 
+@dataclass
+class AppendResult:
+    """Represents the outcome of the append of events to a stream, as part of a batch of appends"""
+
+    stream_id: str
+    """ Gets the id of the stream events were appended to """
+
+    version: Optional[int] = None
+    """ Gets the version of the stream after the append, if it succeeded """
+
+    error: Optional[Exception] = None
+    """ Gets the exception that caused the append to fail, if any """
+
+    @property
+    def succeeded(self) -> bool:
+        """Gets a boolean indicating whether or not the events have been appended"""
+        return self.error is None
+
+
 @dataclass
 class EventStoreOptions:
     database_name: str
@@ -155,6 +179,36 @@ class EventStore(ABC):
         """Appends a list of events to the specified stream"""
         raise NotImplementedError()
 
+    async def append_many_async(self, appends: dict[str, tuple[list[EventDescriptor], Optional[int]]], max_concurrency: int = 16) -> dict[str, AppendResult]:
+        """
+        Appends events to many streams concurrently, running at most 'max_concurrency' appends at a time.
+
+        Appends are independent: the failure of one, for example because of a concurrency conflict, does not prevent the others.
+
+        Args:
+            appends: A mapping of the id of each stream to append to, to the events to append and the version the stream is expected to be at
+            max_concurrency: The maximum number of appends to run concurrently
+
+        Returns:
+            The outcome of the append of each stream, keyed by stream id, in the order of the specified appends
+        """
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be greater than 0")
+        pending_appends = iter(appends.items())
+        results: dict[str, AppendResult] = {}
+
+        async def run_appends():
+            # workers share the iterator, so that at most 'max_concurrency' appends are in flight
+            for stream_id, (events, expected_version) in pending_appends:
+                try:
+                    await self.append_async(stream_id, events, expected_version)
+                    results[stream_id] = AppendResult(stream_id, (expected_version or 0) + len(events))
+                except Exception as ex:
+                    results[stream_id] = AppendResult(stream_id, error=ex)
+
+        await asyncio.gather(*(run_appends() for _ in range(min(max_concurrency, len(appends)))))
+        return {stream_id: results[stream_id] for stream_id in appends}
+
     @abstractmethod
     async def get_async(self, stream_id: str):
         """Gets information about the specified stream"""
@@ -171,6 +225,37 @@ class EventStore(ABC):
         """Reads recorded events from the specified stream"""
         raise NotImplementedError()
 
+    async def read_stream_async(
+        self,
+        stream_id: str,
+        read_direction: StreamReadDirection = StreamReadDirection.FORWARDS,
+        offset: int = 0,
+        length: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[EventRecord]:
+        """
+        Enumerates the recorded events of the specified stream, reading them in pages of at most 'page_size' events.
+
+        Unlike read_async, at most one page of events is held in memory at a time, and the first event can be processed before the last one is read.
+        The default implementation pages through read_async, assuming offsets are positions within the stream. Implementations should override it when a more efficient read exists.
+        """
+        if page_size < 1:
+            raise ValueError("The page size must be greater than 0")
+        backwards = read_direction == StreamReadDirection.BACKWARDS
+        remaining = length
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = (await self.read_async(stream_id, read_direction, offset, limit))[:limit]
+            for record in page:
+                yield record
+            if len(page) < limit:
+                return
+            if remaining is not None:
+                remaining -= len(page)
+            offset = offset - len(page) if backwards else offset + len(page)
+            if offset < 0:
+                return
+
     async def observe_async(
         self,
         stream_id: Optional[str],
@@ -200,8 +285,149 @@ class EventStore(ABC):
         raise NotImplementedError()
 
 
+@dataclass
+class Snapshot:
+    """Represents a snapshot of the state of an event-sourced aggregate"""
+
+    stream_id: str
+    """ Gets the id of the stream the snapshot has been taken from """
+
+    version: int
+    """ Gets the version of the snapshotted state, which is the number of events it results from """
+
+    schema_version: int
+    """ Gets the version of the schema of the snapshotted state. Snapshots whose schema version differs from the configured one are discarded """
+
+    data: Any
+    """ Gets the snapshotted state, encoded as a JSON-compatible value (dictionaries, lists, strings, numbers and booleans), which stores serialize as they see fit """
+
+    timestamp: datetime
+    """ Gets the date and time at which the snapshot has been taken """
+
+
+@dataclass
+class SnapshotPolicy:
+    """
+    Represents the policy used to determine when to snapshot event-sourced aggregates.
+
+    A snapshot is taken when persisting events makes the aggregate's version cross a multiple of 'every_events',
+    or when at least 'every_seconds' have elapsed since the last snapshot of the aggregate.
+
+    Examples:
+        ```python
+        # Snapshot every 100 events
+        policy = SnapshotPolicy(every_events=100)
+
+        # Snapshot at most every 5 minutes, discarding snapshots taken before the state's schema changed
+        policy = SnapshotPolicy(every_seconds=300, schema_version=2)
+        ```
+    """
+
+    every_events: Optional[int] = None
+    """ Gets/sets the number of events after which to snapshot aggregates, if any """
+
+    every_seconds: Optional[float] = None
+    """ Gets/sets the minimum number of seconds between two snapshots of an aggregate, if any """
+
+    schema_version: int = 1
+    """ Gets/sets the version of the schema of snapshotted states. Must be incremented whenever the state's shape changes incompatibly """
+
+    def is_due(self, previous_version: int, current_version: int, last_taken_at: Optional[datetime] = None) -> bool:
+        """Determines whether or not a snapshot should be taken after the aggregate's version changed from 'previous_version' to 'current_version'"""
+        if current_version <= previous_version:
+            return False
+        if self.every_events is not None and self.every_events > 0 and current_version // self.every_events > previous_version // self.every_events:
+            return True
+        if self.every_seconds is not None:
+            return last_taken_at is None or (datetime.now(timezone.utc) - last_taken_at).total_seconds() >= self.every_seconds
+        return False
+
+
+class SnapshotStore(ABC):
+    """
+    Represents a store of aggregate snapshots.
+
+    Snapshots allow event-sourced repositories to load aggregates from their latest snapshot, then to replay only the events recorded after it.
+    """
+
+    @abstractmethod
+    async def get_async(self, stream_id: str) -> Optional[Snapshot]:
+        """Gets the latest snapshot, if any, taken from the specified stream"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save_async(self, snapshot: Snapshot) -> None:
+        """Saves the specified snapshot, replacing the one previously taken from the same stream, if any"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_async(self, stream_id: str) -> None:
+        """Deletes the snapshot, if any, taken from the specified stream"""
+        raise NotImplementedError()
+
+
+@dataclass
+class ProjectionCheckpoint:
+    """Represents the position up to which the events of a stream have been projected into a read model"""
+
+    projection: str
+    """ Gets the name of the checkpointed projection """
+
+    position: int
+    """ Gets the offset, in the projected stream, of the next event to project """
+
+    timestamp: datetime
+    """ Gets the date and time at which the checkpoint has been saved """
+
+
+class ProjectionCheckpointStore(ABC):
+    """
+    Represents a store of projection checkpoints.
+
+    Checkpoints allow projection rebuilds to resume from the last committed position after a crash, instead of replaying the whole stream.
+    """
+
+    @abstractmethod
+    async def get_async(self, projection: str) -> Optional[ProjectionCheckpoint]:
+        """Gets the checkpoint, if any, of the specified projection"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save_async(self, checkpoint: ProjectionCheckpoint) -> None:
+        """Saves the specified checkpoint, replacing the one previously saved for the same projection, if any"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_async(self, projection: str) -> None:
+        """Deletes the checkpoint, if any, of the specified projection"""
+        raise NotImplementedError()
+
+
+class ProjectionRebuildTarget(ABC):
+    """
+    Represents the store of a read model rebuilt into a shadow copy, which is swapped in once the rebuild completes.
+
+    Rebuilding into a shadow copy keeps the live read model queryable, and untouched, for the whole duration of the rebuild.
+    """
+
+    @abstractmethod
+    async def prepare_async(self, resume: bool) -> None:
+        """Prepares the shadow copy of the read model, clearing it unless the rebuild is resumed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def redirect(self) -> AbstractContextManager:
+        """Redirects the writes issued by the current context to the shadow copy of the read model, until the returned context manager exits"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def swap_async(self) -> None:
+        """Atomically replaces the live read model with its shadow copy"""
+        raise NotImplementedError()
+
+
 class Aggregator:
-    def aggregate(self, events: list, aggregate_type: type):
+    def aggregate(self, events: Iterable[EventRecord], aggregate_type: type, state: Optional[Any] = None):
         """
         Reconstitutes an aggregate from a list of domain events.
 
@@ -212,14 +438,41 @@ class Aggregator:
         Args:
             events: List of event records to replay
             aggregate_type: The aggregate root class to instantiate
+            state: The state, if any, to replay events onto, typically restored from a snapshot. Defaults to a new state
+
+        Returns:
+            Reconstituted aggregate with replayed state
+        """
+        aggregate = self._create_aggregate(aggregate_type, state)
+        for e in events:
+            self._apply(aggregate, e)
+        return aggregate
+
+    async def aggregate_async(self, events: AsyncIterable[EventRecord], aggregate_type: type, state: Optional[Any] = None):
+        """
+        Reconstitutes an aggregate by folding domain events as they are read, for example from EventStore.read_stream_async.
+
+        Args:
+            events: The event records to replay
+            aggregate_type: The aggregate root class to instantiate
+            state: The state, if any, to replay events onto, typically restored from a snapshot. Defaults to a new state
 
         Returns:
             Reconstituted aggregate with replayed state
         """
+        aggregate = self._create_aggregate(aggregate_type, state)
+        async for e in events:
+            self._apply(aggregate, e)
+        return aggregate
+
+    def _create_aggregate(self, aggregate_type: type, state: Optional[Any]) -> AggregateRoot:
+        """Creates a new aggregate of the specified type, without invoking its constructor"""
         aggregate: AggregateRoot = object.__new__(aggregate_type)
-        aggregate.state = aggregate.__orig_bases__[0].__args__[0]()
+        aggregate.state = aggregate_type._get_state_type()() if state is None else state
         aggregate._pending_events = list()  # Initialize _pending_events to prevent AttributeError
-        for e in events:
-            aggregate.state.on(e.data)
-            aggregate.state.state_version = e.data.aggregate_version
         return aggregate
+
+    def _apply(self, aggregate: AggregateRoot, e: EventRecord) -> None:
+        """Applies the specified recorded event to the state of the specified aggregate"""
+        aggregate.state.on(e.data)
+        aggregate.state.state_version = e.data.aggregate_version
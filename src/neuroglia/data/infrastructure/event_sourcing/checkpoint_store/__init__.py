@@ -0,0 +1,13 @@
+"""
+Checkpoint store implementations for projections.
+
+Provides in-memory and MongoDB implementations of the ProjectionCheckpointStore abstraction.
+"""
+
+from .in_memory_checkpoint_store import InMemoryProjectionCheckpointStore
+from .mongo_checkpoint_store import MongoProjectionCheckpointStore
+
+__all__ = [
+    "InMemoryProjectionCheckpointStore",
+    "MongoProjectionCheckpointStore",
+]
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    ProjectionCheckpoint,
+    ProjectionCheckpointStore,
+)
+
+
+class InMemoryProjectionCheckpointStore(ProjectionCheckpointStore):
+    """Represents an in-memory implementation of the ProjectionCheckpointStore class, typically used for testing and prototyping"""
+
+    def __init__(self):
+        self._checkpoints: dict[str, ProjectionCheckpoint] = {}
+
+    _checkpoints: dict[str, ProjectionCheckpoint]
+    """ Gets a name/value mapping of the stored checkpoints, keyed by projection name """
+
+    async def get_async(self, projection: str) -> Optional[ProjectionCheckpoint]:
+        return self._checkpoints.get(projection)
+
+    async def save_async(self, checkpoint: ProjectionCheckpoint) -> None:
+        self._checkpoints[checkpoint.projection] = checkpoint
+
+    async def delete_async(self, projection: str) -> None:
+        self._checkpoints.pop(projection, None)
@@ -0,0 +1,67 @@
+from datetime import timezone
+from typing import TYPE_CHECKING, Optional
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    MOTOR_AVAILABLE = True
+except ImportError:
+    MOTOR_AVAILABLE = False
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    ProjectionCheckpoint,
+    ProjectionCheckpointStore,
+)
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+class MongoProjectionCheckpointStore(ProjectionCheckpointStore):
+    """
+    Represents a MongoDB implementation of the ProjectionCheckpointStore class, based on the Motor async driver.
+
+    Each projection's checkpoint is stored as a document whose id is the projection name, and is replaced on save.
+
+    Examples:
+        ```python
+        client = AsyncIOMotorClient("mongodb://localhost:27017")
+        checkpoint_store = MongoProjectionCheckpointStore(client, "bank")
+        ```
+    """
+
+    def __init__(self, client: "AsyncIOMotorClient", database_name: str, collection_name: str = "projection_checkpoints"):
+        """
+        Initializes a new MongoProjectionCheckpointStore.
+
+        Args:
+            client: Async Motor MongoDB client instance
+            database_name: Name of the MongoDB database
+            collection_name: Name of the collection to store checkpoints in
+        """
+        if not MOTOR_AVAILABLE:
+            raise ImportError("motor is required for MongoDB checkpoint storage. Install with: pip install motor")
+        self._client = client
+        self._database_name = database_name
+        self._collection_name = collection_name
+
+    def _get_collection(self) -> "AsyncIOMotorCollection":
+        """Gets the collection used to store checkpoints"""
+        return self._client[self._database_name][self._collection_name]
+
+    async def get_async(self, projection: str) -> Optional[ProjectionCheckpoint]:
+        document = await self._get_collection().find_one({"_id": projection})
+        if document is None:
+            return None
+        timestamp = document["timestamp"]
+        if timestamp.tzinfo is None:
+            # BSON dates are stored in UTC and decoded as naive datetimes by default
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return ProjectionCheckpoint(projection, document["position"], timestamp)
+
+    async def save_async(self, checkpoint: ProjectionCheckpoint) -> None:
+        document = {"position": checkpoint.position, "timestamp": checkpoint.timestamp}
+        await self._get_collection().replace_one({"_id": checkpoint.projection}, document, upsert=True)
+
+    async def delete_async(self, projection: str) -> None:
+        await self._get_collection().delete_one({"_id": projection})
@@ -1,20 +1,34 @@
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Generic, Optional
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Generic, Optional
 
 from neuroglia.data.abstractions import DomainEvent, TAggregate, TKey
 from neuroglia.data.infrastructure.abstractions import Repository
 from neuroglia.data.infrastructure.event_sourcing.abstractions import (
     Aggregator,
+    AppendResult,
     DeleteMode,
     EventDescriptor,
     EventStore,
+    Snapshot,
+    SnapshotPolicy,
+    SnapshotStore,
     StreamReadDirection,
 )
 from neuroglia.hosting.abstractions import ApplicationBuilderBase
+from neuroglia.serialization.json import JsonSerializer
 
 if TYPE_CHECKING:
     from neuroglia.mediation.mediator import Mediator
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class EventSourcingRepositoryOptions(Generic[TAggregate, TKey]):
@@ -39,6 +53,14 @@ class EventSourcingRepositoryOptions(Generic[TAggregate, TKey]):
         options = EventSourcingRepositoryOptions[Task, str](
             delete_mode=DeleteMode.HARD
         )
+
+        # Snapshot aggregates every 100 events
+        options = EventSourcingRepositoryOptions[Account, str](
+            snapshot_policy=SnapshotPolicy(every_events=100)
+        )
+
+        # Fold events into aggregates while reading them, 1000 at a time
+        options = EventSourcingRepositoryOptions[Account, str](read_page_size=1000)
         ```
     """
 
@@ -57,6 +79,25 @@ class EventSourcingRepositoryOptions(Generic[TAggregate, TKey]):
     Only used when delete_mode is SOFT.
     """
 
+    snapshot_policy: Optional[SnapshotPolicy] = field(default=None)
+    """
+    The policy used to determine when to snapshot aggregates, if any.
+    Snapshots are only taken and loaded when both a policy and a SnapshotStore are configured.
+    """
+
+    snapshot_time_cache_size: int = field(default=10_000)
+    """
+    The maximum number of aggregates whose last snapshot time is remembered, to apply the policy's 'every_seconds'.
+    The least recently snapshotted or loaded aggregates are forgotten first, and snapshotted on their next update.
+    """
+
+    read_page_size: Optional[int] = field(default=None)
+    """
+    The number of events to read per page when loading aggregates, if any.
+    When set, events are read with EventStore.read_stream_async and folded into the aggregate as they arrive,
+    bounding the memory used to load long streams. Defaults to reading whole streams with EventStore.read_async.
+    """
+
 
 class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate, TKey]):
     """
@@ -87,6 +128,14 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         repo = EventSourcingRepository[Task, str](
             eventstore, aggregator, options=options
         )
+
+        # With snapshots, loading replays only the events recorded after the latest snapshot
+        options = EventSourcingRepositoryOptions[Account, str](
+            snapshot_policy=SnapshotPolicy(every_events=100)
+        )
+        repo = EventSourcingRepository[Account, str](
+            eventstore, aggregator, options=options, snapshot_store=InMemorySnapshotStore()
+        )
         ```
     """
 
@@ -96,12 +145,17 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         aggregator: Aggregator,
         mediator: Optional["Mediator"] = None,
         options: Optional[EventSourcingRepositoryOptions[TAggregate, TKey]] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
+        serializer: Optional[JsonSerializer] = None,
     ):
         """Initialize a new event sourcing repository"""
         super().__init__(mediator)  # Pass mediator to base class for event publishing
         self._eventstore = eventstore
         self._aggregator = aggregator
         self._options = options or EventSourcingRepositoryOptions[TAggregate, TKey]()
+        self._snapshot_store = snapshot_store
+        self._serializer = serializer or JsonSerializer()
+        self._snapshots_taken_at: OrderedDict[str, datetime] = OrderedDict()
 
     _eventstore: EventStore
     """ Gets the underlying event store """
@@ -109,25 +163,158 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
     _aggregator: Aggregator
     """ Gets the underlying event store """
 
+    _snapshot_store: Optional[SnapshotStore]
+    """ Gets the store used to persist aggregate snapshots, if any """
+
+    _serializer: JsonSerializer
+    """ Gets the service used to serialize snapshotted states """
+
     async def contains_async(self, id: TKey) -> bool:
-        return self._eventstore.contains_stream(self._build_stream_id_for(id))
+        return await self._eventstore.contains_async(self._build_stream_id_for(id))
 
     async def get_async(self, id: TKey) -> Optional[TAggregate]:
         """
         Gets the aggregate with the specified id, if any.
 
+        When snapshots are enabled, the aggregate is restored from its latest compatible snapshot and only
+        the events recorded after it are replayed.
+
         Returns None if the stream does not exist.
         """
+        return await self._load_async(id)
+
+    async def get_many_async(
+        self,
+        ids: Iterable[TKey],
+        max_concurrency: int = 16,
+        executor: Optional[Executor] = None,
+        offload_threshold: int = 10_000,
+    ) -> dict[TKey, Optional[TAggregate]]:
+        """
+        Gets the aggregates with the specified ids, loading at most 'max_concurrency' of them at a time so that their reads overlap.
+
+        Replaying events is CPU-bound: when an executor, typically a ProcessPoolExecutor, is specified, the replay of streams
+        of at least 'offload_threshold' events is offloaded to it, while shorter streams are replayed on the event loop.
+        Offloaded events, states and aggregates must be picklable. Offloading does not apply to paged reads (see
+        EventSourcingRepositoryOptions.read_page_size), whose events are folded as they are read.
+
+        Args:
+            ids: The ids of the aggregates to get
+            max_concurrency: The maximum number of aggregates to load concurrently
+            executor: The executor, if any, to offload the replay of long streams to
+            offload_threshold: The minimum number of events of the streams whose replay is offloaded to the executor
+
+        Returns:
+            The aggregate with each specified id, or None if it does not exist, in the order of the specified ids
+        """
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be greater than 0")
+        ids = list(dict.fromkeys(ids))
+        pending_ids = iter(ids)
+        aggregates: dict[TKey, Optional[TAggregate]] = {}
+
+        async def load_aggregates():
+            # loaders share the iterator, so that at most 'max_concurrency' aggregates are loaded at a time
+            for id in pending_ids:
+                aggregates[id] = await self._load_async(id, executor, offload_threshold)
+
+        await asyncio.gather(*(load_aggregates() for _ in range(min(max_concurrency, len(ids)))))
+        return {id: aggregates[id] for id in ids}
+
+    async def _load_async(self, id: TKey, executor: Optional[Executor] = None, offload_threshold: int = 0) -> Optional[TAggregate]:
+        """Loads the aggregate with the specified id, if any, offloading its replay to the specified executor, if any, when its stream has at least 'offload_threshold' events"""
         stream_id = self._build_stream_id_for(id)
         try:
-            events = await self._eventstore.read_async(stream_id, StreamReadDirection.FORWARDS, 0)
-            if not events:
-                return None
-            return self._aggregator.aggregate(events, self.__orig_class__.__args__[0])
+            aggregate_type = self.__orig_class__.__args__[0]
+            snapshot = await self._get_snapshot_async(stream_id)
+            state = None if snapshot is None else self._restore_snapshot_state(snapshot, aggregate_type)
+            if self._options.read_page_size is not None:
+                return await self._aggregate_stream_async(stream_id, aggregate_type, snapshot, state)
+            if state is None:
+                events = await self._eventstore.read_async(stream_id, StreamReadDirection.FORWARDS, 0)
+                if not events:
+                    return None
+                arguments = (events, aggregate_type)
+            else:
+                events = await self._eventstore.read_async(stream_id, StreamReadDirection.FORWARDS, snapshot.version)
+                state.state_version = snapshot.version
+                arguments = (events, aggregate_type, state)
+            if executor is not None and len(events) >= offload_threshold:
+                return await asyncio.get_running_loop().run_in_executor(executor, self._aggregator.aggregate, *arguments)
+            return self._aggregator.aggregate(*arguments)
         except Exception:
             # If stream doesn't exist or any other error occurs, return None
             return None
 
+    async def add_many_async(self, aggregates: list[TAggregate], max_concurrency: int = 16) -> dict[TKey, AppendResult]:
+        """
+        Adds the specified aggregates, appending their streams concurrently with at most 'max_concurrency' appends in flight.
+
+        Appends are independent: aggregates whose append failed keep their pending events, so that they can be retried.
+
+        Returns:
+            The outcome of the append of each aggregate, keyed by aggregate id
+        """
+        return await self._append_many_async(aggregates, max_concurrency, False)
+
+    async def update_many_async(self, aggregates: list[TAggregate], max_concurrency: int = 16) -> dict[TKey, AppendResult]:
+        """
+        Persists the changes made to the specified aggregates, appending their streams concurrently with at most 'max_concurrency' appends in flight.
+
+        Appends are independent: aggregates whose append failed, typically because of a concurrency conflict, keep their
+        pending events and version.
+
+        Returns:
+            The outcome of the append of each aggregate, keyed by aggregate id
+        """
+        return await self._append_many_async(aggregates, max_concurrency, True)
+
+    async def _append_many_async(self, aggregates: list[TAggregate], max_concurrency: int, existing: bool) -> dict[TKey, AppendResult]:
+        """Appends the pending events of the specified aggregates in a single batch, then completes the aggregates whose append succeeded"""
+        appends: dict[str, tuple[list[EventDescriptor], Optional[int]]] = {}
+        aggregates_by_stream: dict[str, TAggregate] = {}
+        for aggregate in aggregates:
+            stream_id = self._build_stream_id_for(aggregate.id())
+            if stream_id in aggregates_by_stream:
+                raise ValueError(f"The aggregate with id '{aggregate.id()}' cannot be persisted more than once per batch")
+            events = aggregate._pending_events
+            if len(events) < 1:
+                raise Exception("No pending events to persist")
+            appends[stream_id] = ([self._encode_event(e) for e in events], aggregate.state.state_version if existing else None)
+            aggregates_by_stream[stream_id] = aggregate
+        results = await self._eventstore.append_many_async(appends, max_concurrency)
+        for stream_id, result in results.items():
+            if not result.succeeded:
+                continue
+            aggregate = aggregates_by_stream[stream_id]
+            previous_version = aggregate.state.state_version if existing else 0
+            aggregate.state.state_version = aggregate._pending_events[-1].aggregate_version
+            await self._take_snapshot_if_due_async(stream_id, aggregate, previous_version)
+            await self._publish_domain_events(aggregate)
+        return {aggregates_by_stream[stream_id].id(): result for stream_id, result in results.items()}
+
+    async def _aggregate_stream_async(self, stream_id: str, aggregate_type: type, snapshot: Optional[Snapshot], state: Optional[Any]) -> Optional[TAggregate]:
+        """Folds the events of the specified stream into a new aggregate while they are read, page by page, from the specified snapshot, if any"""
+        offset = 0 if state is None else snapshot.version
+        events = self._eventstore.read_stream_async(stream_id, StreamReadDirection.FORWARDS, offset, page_size=self._options.read_page_size)
+        if state is None:
+            # an empty stream has no aggregate: peek at the first event before folding
+            try:
+                first_event = await events.__anext__()
+            except StopAsyncIteration:
+                return None
+            events = self._prepend_async(first_event, events)
+        else:
+            state.state_version = snapshot.version
+        return await self._aggregator.aggregate_async(events, aggregate_type, state)
+
+    @staticmethod
+    async def _prepend_async(first: Any, others: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Enumerates the specified item, then the specified items"""
+        yield first
+        async for item in others:
+            yield item
+
     async def _do_add_async(self, aggregate: TAggregate) -> TAggregate:
         """Adds and persists the specified aggregate"""
         stream_id = self._build_stream_id_for(aggregate.id())
@@ -137,6 +324,7 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         encoded_events = [self._encode_event(e) for e in events]
         await self._eventstore.append_async(stream_id, encoded_events)
         aggregate.state.state_version = events[-1].aggregate_version
+        await self._take_snapshot_if_due_async(stream_id, aggregate, 0)
         # DON'T clear pending events here - let base class do it after publishing!
         # aggregate.clear_pending_events()
         return aggregate
@@ -148,8 +336,10 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         if len(events) < 1:
             raise Exception("No pending events to persist")
         encoded_events = [self._encode_event(e) for e in events]
-        await self._eventstore.append_async(stream_id, encoded_events, aggregate.state.state_version)
+        previous_version = aggregate.state.state_version
+        await self._eventstore.append_async(stream_id, encoded_events, previous_version)
         aggregate.state.state_version = events[-1].aggregate_version
+        await self._take_snapshot_if_due_async(stream_id, aggregate, previous_version)
         # DON'T clear pending events here - let base class do it after publishing!
         # aggregate.clear_pending_events()
         return aggregate
@@ -238,6 +428,9 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         """
         stream_id = self._build_stream_id_for(id)
         await self._eventstore.delete_async(stream_id)
+        if self._snapshot_store is not None:
+            await self._snapshot_store.delete_async(stream_id)
+            self._snapshots_taken_at.pop(stream_id, None)
 
     async def _publish_domain_events(self, entity: TAggregate) -> None:
         """
@@ -257,6 +450,58 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         """
         # Do nothing - ReadModelReconciliator handles event publishing from EventStore
 
+    async def _get_snapshot_async(self, stream_id: str) -> Optional[Snapshot]:
+        """Gets the latest snapshot of the specified stream, if snapshots are enabled and the snapshot's schema version is the configured one"""
+        policy = self._options.snapshot_policy
+        if policy is None or self._snapshot_store is None:
+            return None
+        snapshot = await self._snapshot_store.get_async(stream_id)
+        if snapshot is None:
+            return None
+        if snapshot.schema_version != policy.schema_version:
+            log.info(f"Discarding the snapshot of stream '{stream_id}': its schema version {snapshot.schema_version} differs from the expected version {policy.schema_version}")
+            await self._snapshot_store.delete_async(stream_id)
+            return None
+        if stream_id not in self._snapshots_taken_at:
+            self._remember_snapshot_time(stream_id, snapshot.timestamp)
+        return snapshot
+
+    def _restore_snapshot_state(self, snapshot: Snapshot, aggregate_type: type) -> Optional[Any]:
+        """Deserializes the state of the specified snapshot, or returns None if it cannot be restored"""
+        state_type = aggregate_type._get_state_type()
+        try:
+            state = self._serializer.deserialize_from_value(snapshot.data, state_type)
+            if not isinstance(state, state_type):
+                raise TypeError(f"expected a '{state_type.__name__}' state, got '{type(state).__name__}'")
+            return state
+        except Exception as ex:
+            log.warning(f"Failed to restore the snapshot of stream '{snapshot.stream_id}', falling back to a full replay: {ex}")
+            return None
+
+    async def _take_snapshot_if_due_async(self, stream_id: str, aggregate: TAggregate, previous_version: int) -> None:
+        """Snapshots the state of the specified aggregate if required by the configured snapshot policy. Failing to snapshot does not fail the persistence of events"""
+        policy = self._options.snapshot_policy
+        if policy is None or self._snapshot_store is None:
+            return
+        current_version = aggregate.state.state_version
+        if not policy.is_due(previous_version, current_version, self._snapshots_taken_at.get(stream_id)):
+            return
+        timestamp = datetime.now(timezone.utc)
+        try:
+            state = json.loads(self._serializer.serialize_to_text(aggregate.state))
+            snapshot = Snapshot(stream_id, current_version, policy.schema_version, state, timestamp)
+            await self._snapshot_store.save_async(snapshot)
+            self._remember_snapshot_time(stream_id, timestamp)
+        except Exception as ex:
+            log.warning(f"Failed to snapshot stream '{stream_id}' at version {current_version}: {ex}")
+
+    def _remember_snapshot_time(self, stream_id: str, timestamp: datetime) -> None:
+        """Remembers when the specified stream has last been snapshotted, forgetting the least recently used streams when the cache is full"""
+        self._snapshots_taken_at[stream_id] = timestamp
+        self._snapshots_taken_at.move_to_end(stream_id)
+        while len(self._snapshots_taken_at) > self._options.snapshot_time_cache_size:
+            self._snapshots_taken_at.popitem(last=False)
+
     def _build_stream_id_for(self, aggregate_id: TKey):
         """Builds a new stream id for the specified aggregate"""
         aggregate_name = self.__orig_class__.__args__[0].__name__
@@ -268,11 +513,34 @@ class EventSourcingRepository(Generic[TAggregate, TKey], Repository[TAggregate,
         return EventDescriptor(event_type, e)
 
     @staticmethod
-    def configure(builder: ApplicationBuilderBase, entity_type: type, key_type: type) -> ApplicationBuilderBase:
-        """Configures the specified application to use an event sourcing based repository implementation to manage the specified type of entity"""
-        builder.services.try_add_singleton(
-            EventSourcingRepositoryOptions[entity_type, key_type],
-            singleton=EventSourcingRepositoryOptions[entity_type, key_type](),
-        )
-        builder.services.try_add_singleton(Repository[entity_type, key_type], EventSourcingRepository[entity_type, key_type])
+    def configure(builder: ApplicationBuilderBase, entity_type: type, key_type: type, snapshot_policy: Optional[SnapshotPolicy] = None) -> ApplicationBuilderBase:
+        """
+        Configures the specified application to use an event sourcing based repository implementation to manage the specified type of entity
+
+        Args:
+            builder: The application builder to configure
+            entity_type: The type of aggregate to manage
+            key_type: The type of the aggregate's key
+            snapshot_policy: The policy used to snapshot aggregates, if any. Requires a SnapshotStore to be registered
+        """
+        if snapshot_policy is None:
+            builder.services.try_add_singleton(
+                EventSourcingRepositoryOptions[entity_type, key_type],
+                singleton=EventSourcingRepositoryOptions[entity_type, key_type](),
+            )
+            builder.services.try_add_singleton(Repository[entity_type, key_type], EventSourcingRepository[entity_type, key_type])
+            return builder
+        options = EventSourcingRepositoryOptions[entity_type, key_type](snapshot_policy=snapshot_policy)
+        builder.services.try_add_singleton(EventSourcingRepositoryOptions[entity_type, key_type], singleton=options)
+
+        def create_repository(provider) -> EventSourcingRepository:
+            return EventSourcingRepository[entity_type, key_type](
+                provider.get_required_service(EventStore),
+                provider.get_required_service(Aggregator),
+                options=provider.get_required_service(EventSourcingRepositoryOptions[entity_type, key_type]),
+                snapshot_store=provider.get_required_service(SnapshotStore),
+                serializer=provider.get_service(JsonSerializer),
+            )
+
+        builder.services.try_add_singleton(Repository[entity_type, key_type], implementation_factory=create_repository)
         return builder
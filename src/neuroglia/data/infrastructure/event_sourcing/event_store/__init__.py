@@ -0,0 +1,14 @@
+"""
+Event store implementations.
+
+The ESEventStore (KurrentDB/EventStoreDB) is imported from its own module, so that the local implementations do not require a database client.
+"""
+
+from .file_event_store import FileEventStore
+from .in_memory_event_store import ConsumerGroup, InMemoryEventStore
+
+__all__ = [
+    "ConsumerGroup",
+    "FileEventStore",
+    "InMemoryEventStore",
+]
@@ -1,13 +1,20 @@
 import asyncio
-import inspect
 import logging
 import sys
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 import rx
 from kurrentdbclient import AsyncKurrentDBClient as AsyncClientFactory
 from kurrentdbclient import NewEvent, RecordedEvent, StreamState
 from kurrentdbclient.exceptions import AlreadyExistsError as AlreadyExists
+from kurrentdbclient.exceptions import (
+    NotFoundError,
+    StreamIsDeletedError,
+    WrongCurrentVersionError,
+)
 from rx.core.observable.observable import Observable
 from rx.disposable.disposable import Disposable
 from rx.subject.subject import Subject
@@ -23,6 +30,9 @@ from neuroglia.data.infrastructure.event_sourcing.abstractions import (
     StreamDescriptor,
     StreamReadDirection,
 )
+from neuroglia.data.infrastructure.event_sourcing.event_upcaster_registry import (
+    EventUpcasterRegistry,
+)
 from neuroglia.hosting.abstractions import ApplicationBuilderBase
 from neuroglia.serialization.json import JsonSerializer
 
@@ -33,6 +43,9 @@ class ESEventStore(EventStore):
     _metadata_type = "type"
     """ Gets the name of the metadata attribute used to store the qualified name of the recorded event's type ('{module_name}.{type_name}')  """
 
+    _metadata_schema_version = "schema_version"
+    """ Gets the name of the metadata attribute used to store the version of the recorded event's type, when greater than 1 """
+
     _eventstore_options: EventStoreOptions
     """ Gets the options used to configure the EventStore """
 
@@ -45,14 +58,36 @@ class ESEventStore(EventStore):
     _serializer: JsonSerializer
     """ Gets the service used to serialize/deserialize objects to/from JSON"""
 
+    _event_types: dict[str, type]
+    """ Gets a mapping of the qualified names of the event types resolved so far to the types they resolve to """
+
+    _event_type_names: dict[type, str]
+    """ Gets a mapping of the event types appended or resolved so far to their qualified names """
+
+    _stream_heads: OrderedDict[str, int]
+    """ Gets a LRU cache of the revisions of the last event of the most recently used streams, keyed by qualified stream name """
+
+    _stream_head_cache_size: int
+    """ Gets the maximum number of stream heads to cache """
+
+    _upcasters: Optional[EventUpcasterRegistry]
+    """ Gets the registry of the upcasters used to decode events recorded with previous versions of their type, if any """
+
     def __init__(
         self,
         options: EventStoreOptions,
         connection_string_or_client: str | Any,  # Can be connection string or pre-initialized client (for testing)
         serializer: JsonSerializer,
+        stream_head_cache_size: int = 10_000,
+        upcasters: Optional[EventUpcasterRegistry] = None,
     ):
         self._eventstore_options = options
         self._serializer = serializer
+        self._event_types = {}
+        self._event_type_names = {}
+        self._stream_heads = OrderedDict()
+        self._stream_head_cache_size = stream_head_cache_size
+        self._upcasters = upcasters
 
         # Check if we got a connection string or an already-initialized client
         if isinstance(connection_string_or_client, str):
@@ -76,7 +111,27 @@ class ESEventStore(EventStore):
         return self._eventstore_client
 
     async def contains_async(self, stream_id: str) -> bool:
-        return await self.get_async(stream_id) is not None
+        return await self.get_stream_head_async(stream_id) is not None
+
+    async def get_stream_head_async(self, stream_id: str) -> Optional[int]:
+        """
+        Gets the revision of the last event of the specified stream, or None if the stream does not exist.
+
+        Stream heads are served from a LRU cache, which is updated by the appends of this event store, and otherwise
+        resolved by reading the last event of the stream only. Cached heads may lag behind appends made by other
+        processes: optimistic concurrency checks performed when appending remain authoritative.
+        """
+        stream_name = self._get_stream_name(stream_id)
+        revision = self._stream_heads.get(stream_name)
+        if revision is not None:
+            self._stream_heads.move_to_end(stream_name)
+            return revision
+        client = await self._ensure_client()
+        revision = await client.get_current_version(stream_name=stream_name)
+        if revision == StreamState.NO_STREAM:
+            return None
+        self._cache_stream_head(stream_name, revision)
+        return revision
 
     async def append_async(self, stream_id: str, events: list[EventDescriptor], expected_version: Optional[int] = None):
         client = await self._ensure_client()
@@ -95,36 +150,27 @@ class ESEventStore(EventStore):
                     metadata=bytes(self._serializer.serialize(self._build_event_metadata(e.data, e.metadata))),
                 )
             )
-        await client.append_to_stream(stream_name=stream_name, current_version=stream_state, events=formatted_events)
+        try:
+            await client.append_to_stream(stream_name=stream_name, current_version=stream_state, events=formatted_events)
+        except WrongCurrentVersionError:
+            self._stream_heads.pop(stream_name, None)
+            raise
+        self._cache_stream_head(stream_name, (-1 if expected_version is None else expected_version) + len(formatted_events))
 
     async def get_async(self, stream_id: str) -> Optional[StreamDescriptor]:
         client = await self._ensure_client()
         stream_name = self._get_stream_name(stream_id)
-        metadata, metadata_version = await client.get_stream_metadata(stream_name)
-        if metadata_version == StreamState.NO_STREAM:
+        try:
+            read_response = await client.read_stream(stream_name=stream_name, backwards=True, limit=1)
+            recorded_events = [event async for event in read_response]
+        except (NotFoundError, StreamIsDeletedError):
+            self._stream_heads.pop(stream_name, None)
             return None
-        truncate_before = metadata.get("$tb")
-        offset = 0 if truncate_before is None else truncate_before
-        read_response = await client.read_stream(
-            stream_name=stream_name,
-            stream_position=offset,
-            backwards=False,
-            resolve_links=True,
-            limit=1,
-        )
-        recorded_events = [event async for event in read_response]
-        read_response = await client.read_stream(
-            stream_name=stream_name,
-            stream_position=offset,
-            backwards=True,
-            resolve_links=True,
-            limit=1,
-        )
-        recorded_events = [event async for event in read_response]
         if not recorded_events:
             return None
         last_event = recorded_events[0]
-        return StreamDescriptor(stream_id, last_event.stream_position, None, None)  # todo: esdbclient does not provide timestamps
+        self._cache_stream_head(stream_name, last_event.stream_position)
+        return StreamDescriptor(stream_id, last_event.stream_position + 1, None, last_event.recorded_at)  # todo: reading the first event's timestamp would cost another round trip
 
     async def read_async(
         self,
@@ -142,8 +188,45 @@ class ESEventStore(EventStore):
             resolve_links=True,
             limit=sys.maxsize if length is None else length,
         )
-        recorded_events = [event async for event in read_response]
-        return [self._decode_recorded_event(stream_id, recorded_event) for recorded_event in recorded_events]
+        return [self._decode_recorded_event(stream_id, recorded_event) async for recorded_event in read_response]
+
+    async def read_stream_async(
+        self,
+        stream_id: str,
+        read_direction: StreamReadDirection = StreamReadDirection.FORWARDS,
+        offset: int = 0,
+        length: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[EventRecord]:
+        if page_size < 1:
+            raise ValueError("The page size must be greater than 0")
+        client = await self._ensure_client()
+        stream_name = self._get_stream_name(stream_id)
+        backwards = read_direction == StreamReadDirection.BACKWARDS
+        remaining = length
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            read_response = await client.read_stream(
+                stream_name=stream_name,
+                stream_position=offset,
+                backwards=backwards,
+                resolve_links=True,
+                limit=limit,
+            )
+            count = 0
+            recorded_event: Optional[RecordedEvent] = None
+            async for recorded_event in read_response:
+                count += 1
+                yield self._decode_recorded_event(stream_id, recorded_event)
+            if count < limit or recorded_event is None:
+                return
+            if remaining is not None:
+                remaining -= count
+            # resolved links (i.e. '$ce-' category streams) are positioned by their link, not by the event they resolve to
+            last_position = (recorded_event.link or recorded_event).stream_position
+            offset = last_position - 1 if backwards else last_position + 1
+            if offset < 0:
+                return
 
     async def observe_async(
         self,
@@ -189,12 +272,12 @@ class ESEventStore(EventStore):
         return rx.using(lambda: Disposable(lambda: asyncio.create_task(stop_subscription())), lambda s: subject)
 
     def _build_event_metadata(self, e: DomainEvent, additional_metadata: Optional[Any]) -> dict[str, Any]:
-        module = inspect.getmodule(e)
-        if module is None:
-            raise ValueError(f"Cannot determine module for event type {type(e).__name__}")
-        module_name = module.__name__
-        type_name = type(e).__name__
-        metadata = {self._metadata_type: f"{module_name}.{type_name}"}
+        type_name = self._get_event_type_name(type(e))
+        metadata = {self._metadata_type: type_name}
+        if self._upcasters is not None:
+            version = self._upcasters.get_version(type_name)
+            if version > 1:
+                metadata[self._metadata_schema_version] = version
         if additional_metadata is not None:
             if isinstance(additional_metadata, dict):
                 metadata.update(additional_metadata)
@@ -207,19 +290,20 @@ class ESEventStore(EventStore):
     def _decode_recorded_event(self, stream_id: str, e: RecordedEvent) -> EventRecord:
         text = e.metadata.decode()
         metadata = self._serializer.deserialize_from_text(text)
-        type_qualified_name_parts = metadata[self._metadata_type].split(".")
-        module_name = ".".join(type_qualified_name_parts[:-1])
-        type_name = type_qualified_name_parts[-1]
-        module = __import__(module_name, fromlist=[type_name])
-        expected_type = getattr(module, type_name)
+        type_name = metadata[self._metadata_type]
+        expected_type = self._resolve_event_type(type_name)
         text = e.data.decode()
-        data = None if text is None or text.isspace() else self._serializer.deserialize_from_text(text, expected_type)
+        upcaster = None if self._upcasters is None else self._upcasters.get_chain(type_name, metadata.get(self._metadata_schema_version, 1))
+        if text is None or text.isspace():
+            data = None
+        elif upcaster is None:
+            data = self._serializer.deserialize_from_text(text, expected_type)
+        else:
+            data = self._serializer.deserialize_from_value(upcaster(self._serializer.deserialize_from_text(text)), expected_type)
         if isinstance(data, Dict) and not isinstance(data, expected_type):
             typed_data = expected_type.__new__(expected_type)
             typed_data.__dict__ = data
             data = typed_data
-        from datetime import datetime, timezone
-
         return EventRecord(
             stream_id=stream_id,
             id=str(e.id),
@@ -229,8 +313,36 @@ class ESEventStore(EventStore):
             type=e.type,
             data=data,
             metadata=metadata,
+            link_offset=e.link.stream_position if getattr(e, "link", None) is not None else None,
         )
 
+    def _get_event_type_name(self, event_type: type) -> str:
+        """Gets the qualified name ('{module_name}.{type_name}') of the specified event type, which is computed only once per type"""
+        type_name = self._event_type_names.get(event_type)
+        if type_name is None:
+            type_name = f"{event_type.__module__}.{event_type.__name__}"
+            self._event_type_names[event_type] = type_name
+            self._event_types[type_name] = event_type
+        return type_name
+
+    def _resolve_event_type(self, type_name: str) -> type:
+        """Resolves the event type with the specified qualified name, importing its module only the first time the type is encountered"""
+        event_type = self._event_types.get(type_name)
+        if event_type is None:
+            module_name, _, name = type_name.rpartition(".")
+            module = __import__(module_name, fromlist=[name])
+            event_type = getattr(module, name)
+            self._event_types[type_name] = event_type
+            self._event_type_names[event_type] = type_name
+        return event_type
+
+    def _cache_stream_head(self, stream_name: str, revision: int) -> None:
+        """Caches the revision of the last event of the specified stream, evicting the least recently used stream heads when the cache is full"""
+        self._stream_heads[stream_name] = revision
+        self._stream_heads.move_to_end(stream_name)
+        while len(self._stream_heads) > self._stream_head_cache_size:
+            self._stream_heads.popitem(last=False)
+
     def _get_stream_name(self, stream_id: str) -> str:
         """Converts the specified stream id to a qualified stream id, which is prefixed with the current database name, if any"""
         return stream_id if self._eventstore_options.database_name is None or stream_id.startswith("$ce-") else f"{self._eventstore_options.database_name}-{stream_id}"
@@ -321,6 +433,7 @@ class ESEventStore(EventStore):
                         data=decoded_event.data,
                         metadata=decoded_event.metadata,
                         replayed=decoded_event.replayed,
+                        link_offset=decoded_event.link_offset,
                         _ack_delegate=ack_delegate,
                         _nack_delegate=nack_delegate,
                     )
@@ -354,14 +467,17 @@ class ESEventStore(EventStore):
             await client.delete_stream(stream_name=stream_name, current_version=StreamState.ANY)
         except Exception as ex:
             raise Exception(f"Failed to delete stream '{stream_name}': {ex}") from ex
+        finally:
+            self._stream_heads.pop(stream_name, None)
 
     @staticmethod
-    def configure(builder: ApplicationBuilderBase, options: EventStoreOptions) -> ApplicationBuilderBase:
+    def configure(builder: ApplicationBuilderBase, options: EventStoreOptions, upcasters: Optional[EventUpcasterRegistry] = None) -> ApplicationBuilderBase:
         """Registers and configures an EventStore implementation of the EventStore class.
 
         Args:
             builder: The application builder to configure
             options: EventStore configuration options
+            upcasters: The registry of the upcasters used to decode events recorded with previous versions of their type, if any
         """
         connection_string_name = "eventstore"
         connection_string = builder.settings.connection_strings.get(connection_string_name, None)
@@ -371,13 +487,15 @@ class ESEventStore(EventStore):
         # Register dependencies
         builder.services.try_add_singleton(Aggregator)
         builder.services.try_add_singleton(EventStoreOptions, singleton=options)
+        if upcasters is not None:
+            builder.services.try_add_singleton(EventUpcasterRegistry, singleton=upcasters)
 
         # Factory function to create ESEventStore with connection string
         def create_event_store(service_provider) -> ESEventStore:
             from neuroglia.serialization.json import JsonSerializer
 
             serializer = service_provider.get_service(JsonSerializer)
-            return ESEventStore(options, connection_string, serializer)
+            return ESEventStore(options, connection_string, serializer, upcasters=service_provider.get_service(EventUpcasterRegistry))
 
         builder.services.try_add_singleton(EventStore, implementation_factory=create_event_store)
         return builder
@@ -0,0 +1,255 @@
+"""
+File system implementation of the EventStore abstraction.
+
+Extends the InMemoryEventStore with durability: recorded events are appended as JSON lines to segment files,
+which are rolled over every 'segment_size' events and replayed into memory when the store is created. Consumer
+group checkpoints are persisted as well, so that consumer groups resume where they left off after a restart.
+Files are written in a worker thread, so that the event loop is not blocked, and are fsynced before appends
+complete. A torn last entry, left by a crash during an append, is truncated when segments are replayed.
+Events recorded with previous versions of their type are upcast once, when segments are replayed.
+
+Storage layout:
+    - {directory}/segments/00000000.jsonl: recorded events and stream deletions, in recording order
+    - {directory}/checkpoints.json: the checkpoint of each consumer group, keyed by stream name and group name
+
+Examples:
+    ```python
+    # Service registration
+    FileEventStore.configure(builder, EventStoreOptions("bank", "bank-read-model"), directory="data/eventstore")
+    ```
+
+See Also:
+    - Event Sourcing Guide: https://bvandewe.github.io/pyneuro/patterns/event-sourcing/
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventRecord,
+    EventStore,
+    EventStoreOptions,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store.in_memory_event_store import (
+    ConsumerGroup,
+    InMemoryEventStore,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_upcaster_registry import (
+    EventUpcasterRegistry,
+)
+from neuroglia.hosting.abstractions import ApplicationBuilderBase
+from neuroglia.serialization.json import JsonSerializer
+
+log = logging.getLogger(__name__)
+
+
+class FileEventStore(InMemoryEventStore):
+    """Represents an append-only, segmented file implementation of the EventStore class"""
+
+    _deletion_key = "$deleted"
+    """ Gets the key of the entries used to record the deletion of a stream """
+
+    def __init__(
+        self,
+        options: Optional[EventStoreOptions] = None,
+        directory: str = "eventstore",
+        serializer: Optional[JsonSerializer] = None,
+        segment_size: int = 10_000,
+        upcasters: Optional[EventUpcasterRegistry] = None,
+    ):
+        """
+        Initializes a new FileEventStore, loading the events previously recorded in the specified directory, if any.
+
+        Args:
+            options: EventStore configuration options
+            directory: The directory to store segments and checkpoints in
+            serializer: Optional custom serializer (defaults to JsonSerializer)
+            segment_size: The maximum number of entries per segment file
+            upcasters: The registry of the upcasters used to decode events recorded with previous versions of their type, if any
+        """
+        super().__init__(options)
+        self.directory = Path(directory)
+        self.serializer = serializer or JsonSerializer()
+        self.segment_size = segment_size
+        self.upcasters = upcasters
+        self._segments_directory = self.directory / "segments"
+        self._segments_directory.mkdir(parents=True, exist_ok=True)
+        self._checkpoints_file = self.directory / "checkpoints.json"
+        self._checkpoints: dict[str, dict[str, int]] = json.loads(self._checkpoints_file.read_text()) if self._checkpoints_file.exists() else {}
+        self._checkpoints_changed = False
+        self._checkpoints_save_task: Optional[asyncio.Task] = None
+        self._types: dict[str, type] = {}
+        self._type_names: dict[type, str] = {}
+        self._segment_index = 0
+        self._segment_length = 0
+        self._load_segments()
+
+    def _load_segments(self) -> None:
+        """Replays the entries of all segment files into memory"""
+        segment_files = sorted(self._segments_directory.glob("*.jsonl"))
+        for segment_file in segment_files:
+            self._segment_length = 0
+            with open(segment_file, "rb") as file:
+                lines = file.readlines()
+            end_offset = 0
+            for line_number, line in enumerate(lines, 1):
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("the entry is not terminated")
+                    entry = json.loads(line) if line.strip() else None
+                except ValueError as ex:
+                    if segment_file != segment_files[-1] or line_number != len(lines):
+                        raise ValueError(f"Failed to load the event store segment '{segment_file}': line {line_number} is corrupted") from ex
+                    # a crash while appending leaves a torn last entry, which has never been acknowledged
+                    log.warning(f"Truncating the torn last entry of the event store segment '{segment_file}': {ex}")
+                    with open(segment_file, "r+b") as file:
+                        file.truncate(end_offset)
+                        os.fsync(file.fileno())
+                    break
+                end_offset += len(line)
+                if entry is None:
+                    continue
+                self._segment_length += 1
+                stream_name = entry.pop("stream_name")
+                if entry.get(self._deletion_key):
+                    self._remove_stream(stream_name)
+                else:
+                    self._index_record(stream_name, self._decode_record(entry))
+        if segment_files:
+            self._segment_index = int(segment_files[-1].stem)
+
+    async def _persist_records_async(self, stream_name: str, records: list[EventRecord]) -> None:
+        lines = [self._encode_record(stream_name, record) for record in records]
+        await asyncio.to_thread(self._write_entries, lines)
+
+    async def _persist_deletion_async(self, stream_name: str) -> None:
+        await asyncio.to_thread(self._write_entries, [json.dumps({"stream_name": stream_name, self._deletion_key: True})])
+
+    def _write_entries(self, lines: list[str]) -> None:
+        """Appends the specified lines to the current segment file, rolling over to new segments when full, and flushes them to disk"""
+        while lines:
+            if self._segment_length >= self.segment_size:
+                self._segment_index += 1
+                self._segment_length = 0
+            count = min(len(lines), self.segment_size - self._segment_length)
+            with open(self._segments_directory / f"{self._segment_index:08d}.jsonl", "a", encoding="utf-8") as file:
+                file.write("".join(f"{line}\n" for line in lines[:count]))
+                file.flush()
+                os.fsync(file.fileno())
+            self._segment_length += count
+            lines = lines[count:]
+
+    def _encode_record(self, stream_name: str, record: EventRecord) -> str:
+        """Encodes the specified record into a new segment entry"""
+        data_type = type(record.data)
+        data_type_name = self._type_names.get(data_type)
+        if data_type_name is None:
+            data_type_name = f"{data_type.__module__}.{data_type.__name__}"
+            self._type_names[data_type] = data_type_name
+        entry = {
+            "stream_name": stream_name,
+            "stream_id": record.stream_id,
+            "id": record.id,
+            "offset": record.offset,
+            "position": record.position,
+            "timestamp": record.timestamp,
+            "type": record.type,
+            "data_type": data_type_name,
+            "data": record.data,
+            "metadata": record.metadata,
+        }
+        if self.upcasters is not None:
+            version = self.upcasters.get_version(data_type_name)
+            if version > 1:
+                entry["schema_version"] = version
+        return self.serializer.serialize_to_text(entry)
+
+    def _decode_record(self, entry: dict[str, Any]) -> EventRecord:
+        """Decodes the specified segment entry into a new record"""
+        data_type = self._resolve_type(entry["data_type"])
+        data = entry["data"]
+        if self.upcasters is not None:
+            data = self.upcasters.upcast(entry["data_type"], entry.get("schema_version", 1), data)
+        return EventRecord(
+            stream_id=entry["stream_id"],
+            id=entry["id"],
+            offset=entry["offset"],
+            position=entry["position"],
+            timestamp=datetime.fromisoformat(entry["timestamp"]),
+            type=entry["type"],
+            data=self.serializer.deserialize_from_value(data, data_type),
+            metadata=entry.get("metadata"),
+        )
+
+    def _resolve_type(self, qualified_name: str) -> type:
+        """Resolves the type with the specified qualified name, importing its module only once"""
+        resolved_type = self._types.get(qualified_name)
+        if resolved_type is None:
+            module_name, _, type_name = qualified_name.rpartition(".")
+            module = __import__(module_name, fromlist=[type_name])
+            resolved_type = getattr(module, type_name)
+            self._types[qualified_name] = resolved_type
+            self._type_names[resolved_type] = qualified_name
+        return resolved_type
+
+    def _load_checkpoint(self, stream_name: str, consumer_group: str) -> int:
+        return self._checkpoints.get(stream_name, {}).get(consumer_group, 0)
+
+    def _on_checkpoint_changed(self, stream_name: str, group: ConsumerGroup) -> None:
+        checkpoints = self._checkpoints.setdefault(stream_name, {})
+        checkpoint = group.checkpoint
+        if checkpoints.get(group.name) == checkpoint:
+            return
+        checkpoints[group.name] = checkpoint
+        self._checkpoints_changed = True
+        if self._checkpoints_save_task is None:
+            # coalesce the acks received while checkpoints are being written into a single write
+            self._checkpoints_save_task = asyncio.get_event_loop().create_task(self._save_checkpoints_async())
+
+    async def _save_checkpoints_async(self) -> None:
+        """Writes the checkpoints of all consumer groups until they stop changing"""
+        try:
+            while self._checkpoints_changed:
+                self._checkpoints_changed = False
+                await asyncio.to_thread(self._write_checkpoints, json.dumps(self._checkpoints))
+        except Exception as ex:
+            log.error(f"Failed to save the consumer group checkpoints to '{self._checkpoints_file}': {ex}", exc_info=True)
+        finally:
+            self._checkpoints_save_task = None
+
+    def _write_checkpoints(self, text: str) -> None:
+        """Atomically writes the specified checkpoints, flushing them to disk"""
+        temporary_file = self._checkpoints_file.with_suffix(".tmp")
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_file, self._checkpoints_file)
+
+    @staticmethod
+    def configure(builder: ApplicationBuilderBase, options: EventStoreOptions, directory: str = "eventstore", segment_size: int = 10_000, upcasters: Optional[EventUpcasterRegistry] = None) -> ApplicationBuilderBase:
+        """Registers and configures a file system implementation of the EventStore class.
+
+        Args:
+            builder: The application builder to configure
+            options: EventStore configuration options
+            directory: The directory to store segments and checkpoints in
+            segment_size: The maximum number of entries per segment file
+            upcasters: The registry of the upcasters used to decode events recorded with previous versions of their type, if any
+        """
+        builder.services.try_add_singleton(Aggregator)
+        builder.services.try_add_singleton(EventStoreOptions, singleton=options)
+        builder.services.try_add_singleton(JsonSerializer)
+        if upcasters is not None:
+            builder.services.try_add_singleton(EventUpcasterRegistry, singleton=upcasters)
+        builder.services.try_add_singleton(
+            EventStore,
+            implementation_factory=lambda provider: FileEventStore(options, directory, provider.get_required_service(JsonSerializer), segment_size, provider.get_service(EventUpcasterRegistry)),
+        )
+        return builder
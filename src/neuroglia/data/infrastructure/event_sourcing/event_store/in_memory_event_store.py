@@ -0,0 +1,411 @@
+"""
+In-memory implementation of the EventStore abstraction.
+
+Provides a fast and deterministic event store that requires no database server, typically used for tests,
+benchmarks, load tests and local runs. It mirrors the semantics of the ESEventStore:
+
+- Streams are named '{database_name}-{stream_id}', and grouped in '$ce-{category}' category streams, where the
+  category is the part of the stream name preceding its first '-'
+- append_async performs optimistic concurrency checks: a None expected version requires the stream not to exist
+- read_async reads streams and category streams forwards or backwards, from an offset
+- observe_async tails streams: catch-up subscriptions replay the stream from an offset then emit live events,
+  while consumer groups share the events of a stream between their consumers and redeliver nacked events
+
+Examples:
+    ```python
+    # Service registration
+    InMemoryEventStore.configure(builder, EventStoreOptions("bank", "bank-read-model"))
+
+    # Usage
+    await eventstore.append_async("account-1", [EventDescriptor("accountopened", event)])
+    events = await eventstore.read_async("account-1", StreamReadDirection.FORWARDS, 0)
+    ```
+
+See Also:
+    - Event Sourcing Guide: https://bvandewe.github.io/pyneuro/patterns/event-sourcing/
+"""
+
+import asyncio
+import dataclasses
+import logging
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import rx
+from rx.core.observable.observable import Observable
+from rx.disposable.disposable import Disposable
+
+from neuroglia.data.exceptions import OptimisticConcurrencyException
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    AckableEventRecord,
+    Aggregator,
+    EventDescriptor,
+    EventRecord,
+    EventStore,
+    EventStoreOptions,
+    StreamDescriptor,
+    StreamReadDirection,
+)
+from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+log = logging.getLogger(__name__)
+
+CATEGORY_STREAM_PREFIX = "$ce-"
+""" Gets the prefix of category streams """
+
+
+class ConsumerGroup:
+    """
+    Represents a group of consumers sharing the events of a stream, in the fashion of persistent subscriptions.
+
+    Events are dispatched once to one of the group's consumers, which must ack or nack them. Each consumer has at
+    most 'buffer_size' unacknowledged events. Nacked events are redelivered until they have been retried
+    'max_retry_count' times, after which they are parked.
+    """
+
+    def __init__(self, name: str, checkpoint: int = 0, max_retry_count: int = 10, buffer_size: int = 500):
+        self.name = name
+        self.max_retry_count = max_retry_count
+        self.buffer_size = buffer_size
+        self.parked: list[int] = []
+        self._next_index = checkpoint
+        self._retries: deque[int] = deque()
+        self._retry_counts: dict[int, int] = {}
+        self._in_flight: dict[int, object] = {}
+        self._in_flight_counts: dict[object, int] = {}
+
+    name: str
+    """ Gets the name of the consumer group """
+
+    max_retry_count: int
+    """ Gets the maximum number of times an event is redelivered before being parked """
+
+    buffer_size: int
+    """ Gets the maximum number of unacknowledged events dispatched to a consumer """
+
+    parked: list[int]
+    """ Gets the indexes of the events that have been parked """
+
+    @property
+    def checkpoint(self) -> int:
+        """Gets the index of the first event that has not been acked, skipped or parked yet"""
+        return min([self._next_index, *self._retries, *self._in_flight])
+
+    def take(self, length: int, consumer: object) -> Optional[tuple[int, bool]]:
+        """Takes the index of the next event to dispatch to the specified consumer, and whether or not it is being redelivered, if any"""
+        if self._in_flight_counts.get(consumer, 0) >= self.buffer_size:
+            return None
+        if self._retries:
+            index, replayed = self._retries.popleft(), True
+        elif self._next_index < length:
+            index, replayed = self._next_index, False
+            self._next_index += 1
+        else:
+            return None
+        self._in_flight[index] = consumer
+        self._in_flight_counts[consumer] = self._in_flight_counts.get(consumer, 0) + 1
+        return index, replayed
+
+    def ack(self, index: int) -> None:
+        """Acks the event at the specified index"""
+        if self._release(index) is not None:
+            self._retry_counts.pop(index, None)
+
+    def nack(self, index: int, action: str = "retry") -> None:
+        """Nacks the event at the specified index. Supported actions are 'retry' (default), 'park' and 'skip'"""
+        if self._release(index) is None:
+            return
+        retry_count = self._retry_counts.get(index, 0) + 1
+        if action == "skip":
+            self._retry_counts.pop(index, None)
+        elif action == "park" or retry_count > self.max_retry_count:
+            self._retry_counts.pop(index, None)
+            self.parked.append(index)
+        else:
+            self._retry_counts[index] = retry_count
+            self._retries.append(index)
+
+    def release(self, consumer: object) -> None:
+        """Releases the events dispatched to the specified consumer that have not been acked yet, so that they are redelivered"""
+        for index in [index for index, owner in self._in_flight.items() if owner is consumer]:
+            self._release(index)
+            self._retries.append(index)
+        self._in_flight_counts.pop(consumer, None)
+
+    def _release(self, index: int) -> Optional[object]:
+        """Releases the specified in-flight event and returns the consumer it was dispatched to, if any"""
+        consumer = self._in_flight.pop(index, None)
+        if consumer is not None:
+            self._in_flight_counts[consumer] -= 1
+        return consumer
+
+
+class InMemoryEventStore(EventStore):
+    """Represents an in-memory implementation of the EventStore class"""
+
+    _eventstore_options: EventStoreOptions
+    """ Gets the options used to configure the EventStore """
+
+    _streams: dict[str, list[EventRecord]]
+    """ Gets a name/records mapping of all streams, keyed by qualified stream name """
+
+    _categories: dict[str, list[EventRecord]]
+    """ Gets a category/records mapping of all category streams, in recording order """
+
+    _consumer_groups: dict[tuple[str, str], ConsumerGroup]
+    """ Gets all consumer groups, keyed by qualified stream name and group name """
+
+    batch_size: int = 500
+    """ Gets/sets the number of events emitted to a subscriber before yielding control to the event loop """
+
+    def __init__(self, options: Optional[EventStoreOptions] = None):
+        self._eventstore_options = options or EventStoreOptions(None, None)
+        self._streams = {}
+        self._categories = {}
+        self._consumer_groups = {}
+        self._deleted_event_ids: set[str] = set()
+        self._position = 0
+        self._appended: Optional[asyncio.Event] = None
+        self._write_lock = asyncio.Lock()
+
+    async def contains_async(self, stream_id: str) -> bool:
+        return self._get_stream_name(stream_id) in self._streams
+
+    async def append_async(self, stream_id: str, events: list[EventDescriptor], expected_version: Optional[int] = None):
+        async with self._write_lock:
+            stream_name = self._get_stream_name(stream_id)
+            stream = self._streams.get(stream_name)
+            actual_version = None if stream is None else len(stream)
+            if (expected_version is None and actual_version is not None) or (expected_version is not None and expected_version != (actual_version or 0)):
+                message = f"Failed to append events to stream '{stream_id}': expected the stream not to exist, but found version {actual_version}" if expected_version is None else None
+                raise OptimisticConcurrencyException(stream_id, 0 if expected_version is None else expected_version, actual_version or 0, message)
+            for e in events:
+                if e.data is None:
+                    raise ValueError(f"Event of type '{e.type}' has no data. Events must contain a DomainEvent.")
+            timestamp = datetime.now(timezone.utc)
+            records = []
+            offset = actual_version or 0
+            for e in events:
+                records.append(EventRecord(stream_id, str(uuid.uuid4()), offset, self._position, timestamp, e.type, e.data, e.metadata))
+                offset += 1
+                self._position += 1
+            await self._persist_records_async(stream_name, records)
+            for record in records:
+                self._index_record(stream_name, record)
+            self._notify_appended()
+
+    async def get_async(self, stream_id: str) -> Optional[StreamDescriptor]:
+        records = self._get_records(stream_id)
+        if not records:
+            return None
+        return StreamDescriptor(stream_id, len(records), records[0].timestamp, records[-1].timestamp)
+
+    async def read_async(
+        self,
+        stream_id: str,
+        read_direction: StreamReadDirection,
+        offset: int,
+        length: Optional[int] = None,
+    ) -> list[EventRecord]:
+        records = self._get_records(stream_id)
+        if stream_id.startswith(CATEGORY_STREAM_PREFIX):
+            indexes = range(len(records))
+            if read_direction == StreamReadDirection.BACKWARDS:
+                indexes = indexes[offset::-1] if offset >= 0 else indexes[::-1]
+            else:
+                indexes = indexes[offset:]
+            records = [self._link_record(records[index], index) for index in indexes if records[index].id not in self._deleted_event_ids]
+        elif read_direction == StreamReadDirection.BACKWARDS:
+            records = records[offset::-1] if offset >= 0 else records[::-1]
+        else:
+            records = records[offset:]
+        return records if length is None else records[:length]
+
+    async def read_stream_async(
+        self,
+        stream_id: str,
+        read_direction: StreamReadDirection = StreamReadDirection.FORWARDS,
+        offset: int = 0,
+        length: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[EventRecord]:
+        if page_size < 1:
+            raise ValueError("The page size must be greater than 0")
+        records = self._get_records(stream_id)
+        if read_direction == StreamReadDirection.BACKWARDS:
+            indexes = range(min(offset, len(records) - 1) if offset >= 0 else len(records) - 1, -1, -1)
+        else:
+            indexes = range(offset, len(records))
+        is_category = stream_id.startswith(CATEGORY_STREAM_PREFIX)
+        count = 0
+        for index in indexes:
+            if length is not None and count >= length:
+                return
+            record = records[index]
+            if is_category:
+                if record.id in self._deleted_event_ids:
+                    continue
+                record = self._link_record(record, index)
+            yield record
+            count += 1
+            if count % page_size == 0:
+                # yield control to the event loop between pages, as a remote event store would
+                await asyncio.sleep(0)
+
+    async def observe_async(
+        self,
+        stream_id: Optional[str],
+        consumer_group: Optional[str] = None,
+        offset: Optional[int] = None,
+    ) -> Observable:
+        if stream_id is None:
+            raise ValueError("stream_id cannot be None")
+        stream_name = self._get_stream_name(stream_id)
+        group = None
+        if consumer_group is not None:
+            group = self._consumer_groups.get((stream_name, consumer_group))
+            if group is None:
+                group = ConsumerGroup(consumer_group, self._load_checkpoint(stream_name, consumer_group))
+                self._consumer_groups[(stream_name, consumer_group)] = group
+
+        def subscribe(observer, scheduler=None):
+            task = asyncio.get_event_loop().create_task(self._consume_events_async(stream_id, observer, offset or 0, group))
+            return Disposable(task.cancel)
+
+        return rx.create(subscribe)
+
+    async def delete_async(self, stream_id: str) -> None:
+        stream_name = self._get_stream_name(stream_id)
+        async with self._write_lock:
+            if stream_name not in self._streams:
+                raise Exception(f"Failed to delete stream '{stream_name}': the stream does not exist")
+            await self._persist_deletion_async(stream_name)
+            self._remove_stream(stream_name)
+
+    def get_consumer_group(self, stream_id: str, consumer_group: str) -> Optional[ConsumerGroup]:
+        """Gets the specified consumer group of the specified stream, if any"""
+        return self._consumer_groups.get((self._get_stream_name(stream_id), consumer_group))
+
+    def _get_stream_name(self, stream_id: str) -> str:
+        """Converts the specified stream id to a qualified stream id, which is prefixed with the current database name, if any"""
+        return stream_id if self._eventstore_options.database_name is None or stream_id.startswith(CATEGORY_STREAM_PREFIX) else f"{self._eventstore_options.database_name}-{stream_id}"
+
+    def _get_records(self, stream_id: str) -> list[EventRecord]:
+        """Gets the records of the specified stream or category stream"""
+        if stream_id.startswith(CATEGORY_STREAM_PREFIX):
+            return self._categories.get(stream_id[len(CATEGORY_STREAM_PREFIX) :], [])
+        return self._streams.get(self._get_stream_name(stream_id), [])
+
+    def _index_record(self, stream_name: str, record: EventRecord) -> None:
+        """Adds the specified record to its stream and category stream"""
+        self._streams.setdefault(stream_name, []).append(record)
+        self._categories.setdefault(stream_name.split("-", 1)[0], []).append(record)
+        self._position = max(self._position, record.position + 1)
+
+    def _remove_stream(self, stream_name: str) -> None:
+        """Removes the specified stream. Its records are excluded from category streams, whose offsets are left unchanged"""
+        self._deleted_event_ids.update(record.id for record in self._streams.pop(stream_name, []))
+
+    async def _persist_records_async(self, stream_name: str, records: list[EventRecord]) -> None:
+        """Persists the specified records before they are indexed. Writes are serialized. Does nothing by default"""
+
+    async def _persist_deletion_async(self, stream_name: str) -> None:
+        """Persists the deletion of the specified stream. Does nothing by default"""
+
+    def _load_checkpoint(self, stream_name: str, consumer_group: str) -> int:
+        """Loads the checkpoint of the specified consumer group. Defaults to the beginning of the stream"""
+        return 0
+
+    def _on_checkpoint_changed(self, stream_name: str, group: ConsumerGroup) -> None:
+        """Handles the acknowledgement of events by the specified consumer group. Does nothing by default"""
+
+    def _notify_appended(self) -> None:
+        """Wakes up the subscriptions waiting for new events"""
+        if self._appended is not None:
+            self._appended.set()
+            self._appended = None
+
+    async def _wait_for_events_async(self) -> None:
+        """Waits until new events are appended"""
+        if self._appended is None:
+            self._appended = asyncio.Event()
+        await self._appended.wait()
+
+    async def _consume_events_async(self, stream_id: str, observer, offset: int, group: Optional[ConsumerGroup]) -> None:
+        """Emits the events of the specified stream to the specified observer, from the specified offset or consumer group checkpoint, then tails the stream"""
+        consumer = object()
+        emitted = 0
+        try:
+            while True:
+                records = self._get_records(stream_id)
+                if group is None:
+                    if offset >= len(records):
+                        await self._wait_for_events_async()
+                        continue
+                    record = records[offset]
+                    offset += 1
+                    if record.id in self._deleted_event_ids:
+                        continue
+                    observer.on_next(self._link_record(record, offset - 1) if stream_id.startswith(CATEGORY_STREAM_PREFIX) else record)
+                else:
+                    dispatch = group.take(len(records), consumer)
+                    if dispatch is None:
+                        await self._wait_for_events_async()
+                        continue
+                    index, replayed = dispatch
+                    record = records[index]
+                    if record.id in self._deleted_event_ids:
+                        group.ack(index)
+                        continue
+                    observer.on_next(self._build_ackable_record(stream_id, record, group, index, replayed))
+                emitted += 1
+                if emitted % self.batch_size == 0:
+                    await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            pass
+        except Exception as ex:
+            log.error(f"An exception occurred while consuming events from stream '{stream_id}': {ex}")
+            observer.on_error(ex)
+        finally:
+            if group is not None:
+                group.release(consumer)
+                self._notify_appended()
+
+    def _build_ackable_record(self, stream_id: str, record: EventRecord, group: ConsumerGroup, index: int, replayed: bool) -> AckableEventRecord:
+        """Wraps the specified record dispatched to a consumer group into a new AckableEventRecord"""
+        stream_name = self._get_stream_name(stream_id)
+
+        async def ack_delegate():
+            group.ack(index)
+            self._on_checkpoint_changed(stream_name, group)
+            self._notify_appended()
+
+        async def nack_delegate(action: str = "retry"):
+            group.nack(index, action)
+            self._on_checkpoint_changed(stream_name, group)
+            self._notify_appended()
+
+        fields: dict[str, Any] = {name: getattr(record, name) for name in ("stream_id", "id", "offset", "position", "timestamp", "type", "data", "metadata")}
+        link_offset = index if stream_id.startswith(CATEGORY_STREAM_PREFIX) else None
+        return AckableEventRecord(**fields, replayed=replayed, link_offset=link_offset, _ack_delegate=ack_delegate, _nack_delegate=nack_delegate)
+
+    @staticmethod
+    def _link_record(record: EventRecord, link_offset: int) -> EventRecord:
+        """Copies the specified record read from a category stream, setting the offset of its link in the category stream"""
+        return dataclasses.replace(record, link_offset=link_offset)
+
+    @staticmethod
+    def configure(builder: ApplicationBuilderBase, options: EventStoreOptions) -> ApplicationBuilderBase:
+        """Registers and configures an in-memory implementation of the EventStore class.
+
+        Args:
+            builder: The application builder to configure
+            options: EventStore configuration options
+        """
+        builder.services.try_add_singleton(Aggregator)
+        builder.services.try_add_singleton(EventStoreOptions, singleton=options)
+        builder.services.try_add_singleton(EventStore, singleton=InMemoryEventStore(options))
+        return builder
@@ -0,0 +1,114 @@
+"""
+Upcasting of recorded domain events.
+
+Events are immutable: once recorded, their payload keeps the shape of the event type at the time they were appended.
+Upcasters transform the decoded payload of an old version of an event type into the shape of the next version, so
+that old streams can be read into the current event types without migrating the event store.
+
+Versions start at 1, and the current version of an event type is the version following the last registered upcaster.
+Event stores record the current version of the events they append alongside them, and apply the chain of upcasters
+bringing the recorded version up to the current one when decoding events. Chains are composed once per recorded
+type and version, then cached.
+
+Examples:
+    ```python
+    upcasters = EventUpcasterRegistry()
+    upcasters.register(OrderPlacedDomainEvent, 1, lambda data: {**data, "currency": "EUR"})
+    upcasters.register(OrderPlacedDomainEvent, 2, lambda data: {"order_id": data["order_id"], "total": {"amount": data["total"], "currency": data["currency"]}})
+
+    ESEventStore.configure(builder, EventStoreOptions("mario_pizzeria", "pizzeria-api-v1"), upcasters)
+    ```
+
+See Also:
+    - Event Sourcing: https://bvandewe.github.io/pyneuro/patterns/event-sourcing/
+"""
+
+from collections.abc import Callable
+from typing import Any, Optional
+
+EventUpcaster = Callable[[dict[str, Any]], dict[str, Any]]
+""" Represents a function that transforms the decoded payload of a version of an event type into the payload of the next version """
+
+
+class EventUpcasterRegistry:
+    """Represents a registry of the upcasters used to read events recorded with previous versions of their type"""
+
+    _upcasters: dict[str, dict[int, EventUpcaster]]
+    """ Gets a mapping of the qualified names of event types to their upcasters, keyed by the version they upcast from """
+
+    _versions: dict[str, int]
+    """ Gets a mapping of the qualified names of the event types with upcasters to their current version """
+
+    _chains: dict[tuple[str, int], Optional[EventUpcaster]]
+    """ Gets a cache of the upcaster chains composed so far, keyed by qualified type name and recorded version. None when no upcasting is needed """
+
+    def __init__(self):
+        self._upcasters = {}
+        self._versions = {}
+        self._chains = {}
+
+    def register(self, event_type: type | str, version: int, upcaster: EventUpcaster) -> "EventUpcasterRegistry":
+        """
+        Registers an upcaster.
+
+        Args:
+            event_type: The event type, or the qualified name ('{module_name}.{type_name}') it has been recorded under
+            version: The version the upcaster transforms payloads from, into the next version
+            upcaster: The function that transforms payloads
+
+        Returns:
+            The registry, to allow chaining registrations
+        """
+        if version < 1:
+            raise ValueError("Event versions start at 1")
+        type_name = self._get_type_name(event_type)
+        upcasters = self._upcasters.setdefault(type_name, {})
+        if version in upcasters:
+            raise ValueError(f"An upcaster from version {version} of event type '{type_name}' is already registered")
+        upcasters[version] = upcaster
+        self._versions[type_name] = max(self._versions.get(type_name, 1), version + 1)
+        self._chains.clear()
+        return self
+
+    def get_version(self, event_type: type | str) -> int:
+        """Gets the current version of the specified event type"""
+        return self._versions.get(self._get_type_name(event_type), 1)
+
+    def get_chain(self, type_name: str, version: int) -> Optional[EventUpcaster]:
+        """Gets the function that upcasts payloads recorded with the specified version of the specified event type to its current version, or None if they are up to date"""
+        key = (type_name, version)
+        try:
+            return self._chains[key]
+        except KeyError:
+            chain = self._chains[key] = self._compose_chain(type_name, version)
+            return chain
+
+    def upcast(self, type_name: str, version: int, data: dict[str, Any]) -> dict[str, Any]:
+        """Upcasts the specified payload, recorded with the specified version of the specified event type, to the type's current version"""
+        chain = self.get_chain(type_name, version)
+        return data if chain is None else chain(data)
+
+    def _compose_chain(self, type_name: str, version: int) -> Optional[EventUpcaster]:
+        """Composes the upcasters bringing the specified version of the specified event type up to its current version"""
+        current_version = self._versions.get(type_name, 1)
+        if version >= current_version:
+            return None
+        upcasters = self._upcasters[type_name]
+        missing_versions = [v for v in range(version, current_version) if v not in upcasters]
+        if missing_versions:
+            raise ValueError(f"Cannot upcast version {version} of event type '{type_name}': no upcaster is registered from version(s) {', '.join(map(str, missing_versions))}")
+        steps = [upcasters[v] for v in range(version, current_version)]
+        if len(steps) == 1:
+            return steps[0]
+
+        def chain(data: dict[str, Any]) -> dict[str, Any]:
+            for step in steps:
+                data = step(data)
+            return data
+
+        return chain
+
+    @staticmethod
+    def _get_type_name(event_type: type | str) -> str:
+        """Gets the qualified name ('{module_name}.{type_name}') event stores record the specified event type under"""
+        return event_type if isinstance(event_type, str) else f"{event_type.__module__}.{event_type.__name__}"
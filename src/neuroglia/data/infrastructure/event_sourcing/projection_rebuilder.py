@@ -0,0 +1,199 @@
+"""
+Projection rebuilds for event-sourced read models.
+
+Rebuilding a read model replays the category stream of the event store to the application's event handlers,
+bypassing the persistent subscription used by the ReadModelReconciliator:
+
+- Events are read in large pages, then dispatched in batches. Within a batch, the events of an aggregate are handled
+  sequentially, while the events of distinct aggregates are handled concurrently
+- The offset, in the replayed stream, following the last event of each batch is checkpointed after it, so that an
+  interrupted rebuild resumes where it stopped
+- The read model can be rebuilt into a shadow copy, swapped in atomically once the rebuild completes. The events recorded
+  after the last read of the rebuild, which the live projection may have written to the replaced read model, are then
+  replayed into the swapped in read model
+
+Events are delivered at least once: after a crash, the events of the batch being dispatched are replayed, so handlers
+must be idempotent, which upserts typically are.
+
+Examples:
+    ```python
+    rebuilder = ProjectionRebuilder(
+        mediator,
+        event_store_options,
+        event_store,
+        MongoProjectionCheckpointStore(client, "bank"),
+        ProjectionRebuildOptions("accounts", batch_size=1000),
+        MotorShadowCollection(client, "bank", "accounts"),
+    )
+    dispatched = await rebuilder.rebuild_async()
+    ```
+
+See Also:
+    - Event Sourcing: https://bvandewe.github.io/pyneuro/patterns/event-sourcing/
+    - Read Model Projections: https://bvandewe.github.io/pyneuro/patterns/cqrs/
+"""
+
+import asyncio
+import logging
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    EventRecord,
+    EventStore,
+    EventStoreOptions,
+    ProjectionCheckpoint,
+    ProjectionCheckpointStore,
+    ProjectionRebuildTarget,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.read_model_reconciliator import (
+    extract_aggregate_id,
+    get_stream_offset,
+)
+from neuroglia.mediation.mediator import Mediator
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ProjectionRebuildOptions:
+    """Represents the options used to configure the rebuild of a projection"""
+
+    projection: str
+    """ Gets the name of the projection to rebuild, under which its checkpoint is stored """
+
+    stream_id: Optional[str] = field(default=None)
+    """ Gets the id of the stream to replay. Defaults to the category stream of the event store's database """
+
+    page_size: int = field(default=1000)
+    """ Gets the number of events to read from the event store per round trip """
+
+    batch_size: int = field(default=500)
+    """ Gets the number of events to dispatch between two checkpoints """
+
+    max_concurrency: int = field(default=32)
+    """ Gets the maximum number of aggregates whose events are dispatched concurrently """
+
+
+class ProjectionRebuilder:
+    """
+    Represents the service used to rebuild a read model by replaying the events of the event store to the application's event handlers.
+
+    Examples:
+        ```python
+        rebuilder = ProjectionRebuilder(mediator, event_store_options, event_store, InMemoryProjectionCheckpointStore(), ProjectionRebuildOptions("orders"))
+
+        # Resumes from the last checkpoint, if any
+        await rebuilder.rebuild_async()
+
+        # Replays the whole stream, regardless of any checkpoint
+        await rebuilder.rebuild_async(resume=False)
+        ```
+    """
+
+    _mediator: Mediator
+    """ Gets the mediator used to dispatch events to their handlers """
+
+    _event_store_options: EventStoreOptions
+    """ Gets the options used to configure the event store """
+
+    _event_store: EventStore
+    """ Gets the service used to read the events to replay """
+
+    _checkpoint_store: ProjectionCheckpointStore
+    """ Gets the store used to persist the position of the rebuild """
+
+    _options: ProjectionRebuildOptions
+    """ Gets the options used to configure the rebuild """
+
+    _target: Optional[ProjectionRebuildTarget]
+    """ Gets the shadow copy of the read model to rebuild into, if any. When not set, the live read model is written to directly """
+
+    def __init__(
+        self,
+        mediator: Mediator,
+        event_store_options: EventStoreOptions,
+        event_store: EventStore,
+        checkpoint_store: ProjectionCheckpointStore,
+        options: ProjectionRebuildOptions,
+        target: Optional[ProjectionRebuildTarget] = None,
+    ):
+        if options.page_size < 1 or options.batch_size < 1 or options.max_concurrency < 1:
+            raise ValueError("The page size, batch size and maximum concurrency must be greater than 0")
+        self._mediator = mediator
+        self._event_store_options = event_store_options
+        self._event_store = event_store
+        self._checkpoint_store = checkpoint_store
+        self._options = options
+        self._target = target
+
+    async def rebuild_async(self, resume: bool = True) -> int:
+        """
+        Rebuilds the projection, then deletes its checkpoint.
+
+        Args:
+            resume: A boolean indicating whether or not to resume from the projection's last checkpoint, if any
+
+        Returns:
+            The number of events dispatched by this run
+        """
+        checkpoint = await self._checkpoint_store.get_async(self._options.projection) if resume else None
+        position = checkpoint.position if checkpoint is not None else 0
+        if checkpoint is not None:
+            log.info(f"Resuming the rebuild of projection '{self._options.projection}' from position {position}")
+        if self._target is not None:
+            await self._target.prepare_async(checkpoint is not None)
+
+        stream_id = self._options.stream_id or f"$ce-{self._event_store_options.database_name}"
+        with self._target.redirect() if self._target is not None else nullcontext():
+            position, dispatched = await self._replay_async(stream_id, position)
+
+        if self._target is not None:
+            await self._target.swap_async()
+        await self._checkpoint_store.delete_async(self._options.projection)
+        if self._target is not None:
+            # the live projection may have written the events recorded since the last read to the replaced read model.
+            # they are not checkpointed: there is no shadow copy left to resume into
+            position, caught_up = await self._replay_async(stream_id, position, checkpoint=False)
+            dispatched += caught_up
+        log.info(f"Rebuilt projection '{self._options.projection}' up to position {position}, {dispatched} events of which have been dispatched by this run")
+        return dispatched
+
+    async def _replay_async(self, stream_id: str, position: int, checkpoint: bool = True) -> tuple[int, int]:
+        """Dispatches the events of the specified stream from the specified position to its end, returning the position reached and the number of dispatched events"""
+        dispatched = 0
+        batch: list[EventRecord] = []
+        async for e in self._event_store.read_stream_async(stream_id, StreamReadDirection.FORWARDS, position, page_size=self._options.page_size):
+            batch.append(e)
+            if len(batch) >= self._options.batch_size:
+                position = await self._dispatch_batch_async(batch, position, checkpoint)
+                dispatched += len(batch)
+                batch = []
+        if batch:
+            position = await self._dispatch_batch_async(batch, position, checkpoint)
+            dispatched += len(batch)
+        return position, dispatched
+
+    async def _dispatch_batch_async(self, batch: list[EventRecord], position: int, checkpoint: bool = True) -> int:
+        """Dispatches the specified batch of events, then checkpoints, if required, the offset following its last event, which is returned"""
+        events_per_aggregate: dict[str, list[EventRecord]] = {}
+        for e in batch:
+            events_per_aggregate.setdefault(extract_aggregate_id(e), []).append(e)
+        pending_aggregates = iter(events_per_aggregate.values())
+
+        async def dispatch_events():
+            # workers share the iterator, so that at most 'max_concurrency' aggregates are dispatched concurrently
+            for events in pending_aggregates:
+                for e in events:
+                    await self._mediator.publish_async(e.data)
+
+        await asyncio.gather(*(dispatch_events() for _ in range(min(self._options.max_concurrency, len(events_per_aggregate)))))
+        # offsets of category streams skip the events of deleted streams: the checkpoint is not a count of dispatched events
+        offset = get_stream_offset(batch[-1])
+        position = offset + 1 if offset is not None else position + len(batch)
+        if checkpoint:
+            await self._checkpoint_store.save_async(ProjectionCheckpoint(self._options.projection, position, datetime.now(timezone.utc)))
+        return position
@@ -1,9 +1,12 @@
 import asyncio
 import logging
-from collections import defaultdict
-from collections.abc import Callable, Coroutine
+import time
+import zlib
+from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Optional
+from weakref import WeakSet
 
 from rx.core.typing import Disposable
 
@@ -11,6 +14,9 @@ from neuroglia.data.infrastructure.event_sourcing.abstractions import (
     EventRecord,
     EventStore,
     EventStoreOptions,
+    ProjectionCheckpoint,
+    ProjectionCheckpointStore,
+    StreamReadDirection,
 )
 from neuroglia.dependency_injection.service_provider import ServiceProviderBase
 from neuroglia.hosting.abstractions import HostedService
@@ -19,6 +25,13 @@ from neuroglia.reactive import AsyncRx
 
 log = logging.getLogger(__name__)
 
+try:
+    from opentelemetry.metrics import CallbackOptions, Counter, Observation, get_meter
+
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
 
 @dataclass
 class ReadModelConciliationOptions:
@@ -29,6 +42,13 @@ class ReadModelConciliationOptions:
         sequential_processing: If True, events are processed sequentially per aggregate to maintain
             causal ordering. Events from different aggregates can still be processed in parallel.
             Default is True to prevent race conditions in projections.
+        worker_count: The number of worker shards aggregate ids are hashed onto, when processing sequentially
+        queue_capacity: The maximum number of events queued per worker shard, and handed over by the subscription
+        batch_size: The maximum number of events handled per batch. Batching is disabled when not set
+        batch_window: The maximum number of seconds to wait for a batch to fill up before handling it
+        catch_up: If True, the events recorded since the last checkpoint are projected with paged reads before subscribing
+        catch_up_page_size: The number of events read and published at once while catching up
+        checkpoint_interval: The number of events projected live between two checkpoints, when catching up is enabled
 
     Examples:
         ```python
@@ -37,6 +57,27 @@ class ReadModelConciliationOptions:
             consumer_group="my-read-model"
         )
 
+        # Sequential processing by 64 workers, each queuing at most 500 events
+        options = ReadModelConciliationOptions(
+            consumer_group="my-read-model",
+            worker_count=64,
+            queue_capacity=500
+        )
+
+        # Batches of up to 200 events, handled at most 50ms after their first event has been received
+        options = ReadModelConciliationOptions(
+            consumer_group="my-read-model",
+            batch_size=200,
+            batch_window=0.05
+        )
+
+        # Catch up from the last checkpoint with paged reads, then switch to the live subscription
+        options = ReadModelConciliationOptions(
+            consumer_group="my-read-model",
+            catch_up=True,
+            catch_up_page_size=1000
+        )
+
         # Parallel processing (for independent handlers only)
         options = ReadModelConciliationOptions(
             consumer_group="my-read-model",
@@ -58,6 +99,82 @@ class ReadModelConciliationOptions:
     race conditions if projection handlers have dependencies on prior events being processed.
     """
 
+    worker_count: int = field(default=16)
+    """ Gets the number of worker shards processing the events of distinct aggregates concurrently, when processing events sequentially """
+
+    queue_capacity: int = field(default=1000)
+    """
+    Gets the maximum number of events queued per worker shard, beyond which the subscription is pushed back on. Also bounds
+    the number of events handed over by the subscription and waiting to be dispatched, and, when processing events in
+    parallel, the number of events being handled at once.
+    """
+
+    batch_size: Optional[int] = field(default=None)
+    """
+    Gets the maximum number of events handled per batch. When set, events are published in batches, in the order
+    they have been received, and handlers overriding handle_batch_async can persist a whole batch at once.
+    Batches are handled one after another, which also preserves the order of each aggregate's events.
+    Batching is disabled by default.
+    """
+
+    batch_window: float = field(default=0.05)
+    """ Gets the maximum number of seconds to wait for a batch to fill up, from the receipt of its first event, before handling it """
+
+    catch_up: bool = field(default=False)
+    """
+    Gets a boolean indicating whether or not to catch up before subscribing. When enabled, the events recorded since the
+    last checkpoint are read in pages and published in batches, without scheduling a task per event, then the live
+    subscription is started. Catching up runs in the background, so that it does not hold back the start of the host.
+    Events the subscription delivers that have already been projected while catching up are acknowledged without being
+    published again. Requires a projection checkpoint store.
+    """
+
+    catch_up_page_size: int = field(default=1000)
+    """ Gets the number of events read from the event store and published at once while catching up """
+
+    checkpoint_interval: int = field(default=1000)
+    """ Gets the number of events projected live between two checkpoints, when catching up is enabled """
+
+
+def extract_aggregate_id(e: EventRecord) -> str:
+    """
+    Extract the aggregate ID from an event record, used to group the events that must be processed sequentially.
+
+    Tries multiple strategies to find the aggregate ID:
+    1. From event data's aggregate_id attribute
+    2. From event record's stream_id (format: aggregatetype-aggregateid)
+    3. Falls back to "unknown" if not found
+    """
+    # Try to get from event data
+    if hasattr(e, "data") and e.data is not None and hasattr(e.data, "aggregate_id"):
+        agg_id = getattr(e.data, "aggregate_id", None)
+        if agg_id is not None:
+            return str(agg_id)
+
+    # Try to get from stream ID (format: aggregatetype-aggregateid)
+    if hasattr(e, "stream_id") and e.stream_id:
+        parts = str(e.stream_id).split("-", 1)
+        if len(parts) > 1:
+            return parts[1]
+
+    # Fallback - all events go to same queue (fully sequential)
+    log.debug(f"Could not extract aggregate_id from event {type(e.data).__name__}")
+    return "unknown"
+
+
+def _get_position(e: EventRecord) -> int:
+    """Gets the commit position of the specified event record, or -1 if it is unknown"""
+    position = getattr(e, "position", None)
+    return position if isinstance(position, int) else -1
+
+
+def get_stream_offset(e: EventRecord) -> Optional[int]:
+    """Gets the offset of the specified event record in the stream it has been read from, which is the offset of its link when read from a category stream, if it is known"""
+    offset = getattr(e, "link_offset", None)
+    if offset is None:
+        offset = getattr(e, "offset", None)
+    return offset if isinstance(offset, int) else None
+
 
 class AggregateEventQueue:
     """
@@ -72,75 +189,210 @@ class AggregateEventQueue:
     3. EventB handler updates that document
     4. Without ordering, EventB handler may run before EventA completes
 
+    Aggregate ids are hashed onto a fixed pool of worker shards, each processing its own
+    bounded queue in order: memory and task count stay constant regardless of the number
+    of aggregates. When a shard's queue is full, enqueueing waits until the shard catches
+    up, so that events are not acknowledged, and the subscription does not deliver more
+    of them, faster than they are processed.
+
     Attributes:
-        _queues: Maps aggregate_id to its event queue
-        _processors: Maps aggregate_id to its processing task
-        _lock: Protects concurrent access to queues and processors
+        _queues: The bounded queue of each worker shard
+        _workers: The processing task of each worker shard, started on first enqueue
+        _heads: The monotonic time at which the event being processed by each shard, if any, was enqueued
     """
 
-    def __init__(self):
-        self._queues: dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
-        self._processors: dict[str, Optional[asyncio.Task]] = {}
-        self._lock = asyncio.Lock()
+    _instances: "WeakSet[AggregateEventQueue]" = WeakSet()
+    """ Gets the live queues, observed by the queue depth and lag gauges """
+
+    _gauges_initialized = False
+
+    def __init__(self, worker_count: int = 16, capacity: int = 1000, name: str = "default"):
+        """
+        Initialize the queue.
+
+        Args:
+            worker_count: The number of worker shards processing events concurrently
+            capacity: The maximum number of events queued per worker shard
+            name: The name of the queue, used to label its metrics
+        """
+        if worker_count < 1 or capacity < 1:
+            raise ValueError("The worker count and capacity must be greater than 0")
+        self.name = name
+        self._queues: list[asyncio.Queue] = [asyncio.Queue(capacity) for _ in range(worker_count)]
+        self._workers: list[asyncio.Task] = []
+        self._heads: list[Optional[float]] = [None] * worker_count
+        AggregateEventQueue._instances.add(self)
+        AggregateEventQueue._initialize_gauges()
+
+    @property
+    def depth(self) -> int:
+        """Gets the number of events waiting to be processed"""
+        return sum(queue.qsize() for queue in self._queues)
+
+    @property
+    def lag(self) -> float:
+        """Gets the number of seconds the oldest event being processed has been waiting for since it was enqueued"""
+        heads = [head for head in self._heads if head is not None]
+        return time.monotonic() - min(heads) if heads else 0.0
 
     async def enqueue(self, aggregate_id: str, event_record: Any, process_func: Callable[[Any], Coroutine[Any, Any, None]]) -> None:
         """
-        Enqueue an event for sequential processing.
+        Enqueue an event for sequential processing, waiting for room in the queue of the aggregate's shard if it is full.
 
         Args:
             aggregate_id: The aggregate identifier to group events by
             event_record: The event record to process (must have 'data' attribute)
             process_func: Async function to call for processing the event
         """
-        async with self._lock:
-            await self._queues[aggregate_id].put((event_record, process_func))
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._process_queue(shard)) for shard in range(len(self._queues))]
+        # crc32 rather than hash(), which is salted per process, so that shards are stable across restarts
+        queue = self._queues[zlib.crc32(aggregate_id.encode()) % len(self._queues)]
+        await queue.put((event_record, process_func, time.monotonic()))
 
-            # Start processor for this aggregate if not already running
-            if aggregate_id not in self._processors or self._processors[aggregate_id] is None:
-                self._processors[aggregate_id] = asyncio.create_task(self._process_queue(aggregate_id))
+    async def drain_async(self) -> None:
+        """Waits until all enqueued events have been processed"""
+        await asyncio.gather(*(queue.join() for queue in self._queues))
 
-    async def _process_queue(self, aggregate_id: str) -> None:
+    async def _process_queue(self, shard: int) -> None:
         """
-        Process events from an aggregate's queue sequentially.
+        Process events from a shard's queue sequentially.
 
         This ensures causal ordering: each event completes before the next begins.
         """
-        queue = self._queues[aggregate_id]
-
+        queue = self._queues[shard]
         while True:
+            event_record, process_func, enqueued_at = await queue.get()
+            self._heads[shard] = enqueued_at
             try:
-                # Wait for next event with timeout to allow cleanup
-                try:
-                    event_record, process_func = await asyncio.wait_for(queue.get(), timeout=30.0)
-                except asyncio.TimeoutError:
-                    # No events for this aggregate in 30 seconds, clean up
-                    async with self._lock:
-                        if queue.empty():
-                            self._processors[aggregate_id] = None
-                            return
-                    continue
-
-                # Process the event sequentially (await completion)
-                try:
-                    await process_func(event_record)
-                except Exception as ex:
-                    log.error(f"Error processing event for aggregate {aggregate_id}: {ex}", exc_info=True)
-
+                await process_func(event_record)
+            except asyncio.CancelledError:
+                log.debug(f"Event processor for shard {shard} cancelled")
+                raise
+            except Exception as ex:
+                log.error(f"Error processing event for aggregate {extract_aggregate_id(event_record)}: {ex}", exc_info=True)
+            finally:
+                self._heads[shard] = None
                 queue.task_done()
 
+    async def shutdown(self) -> None:
+        """Cancel all processing tasks during shutdown."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        AggregateEventQueue._instances.discard(self)
+
+    @classmethod
+    def _initialize_gauges(cls) -> None:
+        """Registers the queue depth and lag gauges, once, if OpenTelemetry is available"""
+        if not OTEL_AVAILABLE or cls._gauges_initialized:
+            return
+        meter = get_meter(__name__)
+        meter.create_observable_gauge(name="neuroglia.read_model.queue.depth", callbacks=[cls._observe_depth], unit="events", description="Number of events waiting to be projected into the read model")
+        meter.create_observable_gauge(name="neuroglia.read_model.queue.lag", callbacks=[cls._observe_lag], unit="s", description="Time the oldest event being projected into the read model has been waiting for")
+        cls._gauges_initialized = True
+
+    @classmethod
+    def _observe_depth(cls, options: "CallbackOptions") -> Iterable["Observation"]:
+        return [Observation(queue.depth, {"queue": queue.name}) for queue in list(cls._instances)]
+
+    @classmethod
+    def _observe_lag(cls, options: "CallbackOptions") -> Iterable["Observation"]:
+        return [Observation(queue.lag, {"queue": queue.name}) for queue in list(cls._instances)]
+
+
+class EventBatchQueue:
+    """
+    Manages the processing of events in batches.
+
+    Events are queued in the order they have been received, and processed by a single worker, one batch after another.
+    A batch is processed as soon as it contains the maximum number of events, or once the batch window elapsed since its
+    first event has been dequeued, whichever comes first. When the queue is full, enqueueing waits until the worker catches up.
+
+    Attributes:
+        _queue: The bounded queue of the events waiting to be batched
+        _worker: The batching task, started on first enqueue
+    """
+
+    def __init__(self, batch_size: int, window: float = 0.05, capacity: int = 1000, name: str = "default"):
+        """
+        Initialize the queue.
+
+        Args:
+            batch_size: The maximum number of events per batch
+            window: The maximum number of seconds to wait for a batch to fill up
+            capacity: The maximum number of events queued
+            name: The name of the queue
+        """
+        if batch_size < 1 or capacity < 1:
+            raise ValueError("The batch size and capacity must be greater than 0")
+        if window < 0:
+            raise ValueError("The batch window must not be negative")
+        self.name = name
+        self.batch_size = batch_size
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue(capacity)
+        self._worker: Optional[asyncio.Task] = None
+        self._process_func: Optional[Callable[[list[Any]], Coroutine[Any, Any, None]]] = None
+
+    @property
+    def depth(self) -> int:
+        """Gets the number of events waiting to be batched"""
+        return self._queue.qsize()
+
+    async def enqueue(self, event_record: Any, process_func: Callable[[list[Any]], Coroutine[Any, Any, None]]) -> None:
+        """
+        Enqueue an event for batched processing, waiting for room in the queue if it is full.
+
+        Args:
+            event_record: The event record to process
+            process_func: Async function to call for processing a batch of events
+        """
+        self._process_func = process_func
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._process_queue())
+        await self._queue.put(event_record)
+
+    async def drain_async(self) -> None:
+        """Waits until all enqueued events have been processed"""
+        await self._queue.join()
+
+    async def _process_queue(self) -> None:
+        """Collect events into batches, and process them one after another"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            try:
+                while len(batch) < self.batch_size:
+                    # drain what is already queued without waiting, which spares a timer per event under load
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._process_func(batch)
             except asyncio.CancelledError:
-                log.debug(f"Event processor for aggregate {aggregate_id} cancelled")
-                break
+                log.debug(f"Event batch processor '{self.name}' cancelled")
+                raise
             except Exception as ex:
-                log.error(f"Unexpected error in event processor: {ex}", exc_info=True)
+                log.error(f"Error processing a batch of {len(batch)} events: {ex}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
     async def shutdown(self) -> None:
-        """Cancel all processing tasks during shutdown."""
-        async with self._lock:
-            for task in self._processors.values():
-                if task is not None:
-                    task.cancel()
-            self._processors.clear()
+        """Cancel the batching task during shutdown."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
 
 
 class ReadModelReconciliator(HostedService):
@@ -161,11 +413,29 @@ class ReadModelReconciliator(HostedService):
         Without sequential processing, step 2 might run before step 1 completes,
         causing "document not found" errors.
 
+    **Batched Processing**:
+        Events are published in batches of up to `batch_size` events, collected for at most
+        `batch_window` seconds, and acknowledged once their batch has been handled. Handlers
+        overriding `handle_batch_async` can persist a whole batch with a single bulk write.
+
     **Parallel Processing**:
         Events are processed concurrently for higher throughput. Only use this mode
         if your projection handlers are independent and don't rely on prior events
         being processed.
 
+    **Catching Up**:
+        When `catch_up` is enabled, the reconciliator starts in 'catch-up' mode: the events
+        recorded since its last checkpoint are read in pages and published in batches, and the
+        checkpoint is saved after each page. Once the end of the stream has been reached, it
+        switches to 'live' mode and subscribes. Catching up runs in a background task, so that
+        the host does not wait for it to start. The lag of the read model, in commit positions,
+        and the number of events being handled are exported as OpenTelemetry gauges, and the
+        number of events projected as an OpenTelemetry counter.
+
+        The checkpoint is the offset, in the category stream, following the last event of the
+        contiguous run of events the subscription delivered and the reconciliator settled, by
+        projecting them or by handing them back to the subscription, which retries or parks them.
+
     Attributes:
         _service_provider: The current service provider for dependency resolution
         _mediator: The mediator for publishing events to handlers
@@ -173,7 +443,12 @@ class ReadModelReconciliator(HostedService):
         _event_store: The event store service for reading events
         _options: Configuration options for read model reconciliation
         _event_queue: Queue for sequential event processing per aggregate
+        _batch_queue: Queue for batched event processing
+        _checkpoint_store: The store used to persist the position reached in the category stream, when catching up
         _subscription: The event store subscription handle
+        _catch_up_task: The task catching up then subscribing, when catching up is enabled
+        _handoff: The bounded queue of the events handed over by the subscription, drained by a single dispatcher task
+        mode: The current processing mode, either 'catch-up' or 'live'
 
     Examples:
         ```python
@@ -209,58 +484,283 @@ class ReadModelReconciliator(HostedService):
     _event_queue: Optional[AggregateEventQueue]
     """ Queue for sequential event processing per aggregate """
 
+    _batch_queue: Optional[EventBatchQueue]
+    """ Queue for batched event processing, if batching is enabled """
+
+    _checkpoint_store: Optional[ProjectionCheckpointStore]
+    """ Gets the store used to persist the offset, in the category stream, of the next event to project, when catching up """
+
     _subscription: Optional[Disposable]
 
-    def __init__(self, service_provider: ServiceProviderBase, mediator: Mediator, event_store_options: EventStoreOptions, event_store: EventStore, options: Optional[ReadModelConciliationOptions] = None):
+    _catch_up_task: Optional[asyncio.Task]
+    """ Gets the task catching up then subscribing, if any """
+
+    _handoff: asyncio.Queue
+    """ Gets the bounded queue of the events handed over by the subscription, waiting to be dispatched """
+
+    _dispatcher: Optional[asyncio.Task]
+    """ Gets the task dispatching the events handed over by the subscription, one after another, if subscribed """
+
+    _instances: "WeakSet[ReadModelReconciliator]" = WeakSet()
+    """ Gets the live reconciliators, observed by the lag and in-flight gauges """
+
+    _projected_events_counter: Optional["Counter"] = None
+    """ Gets the counter of the events projected into the read model, if OpenTelemetry is available """
+
+    _gauges_initialized = False
+
+    def __init__(
+        self,
+        service_provider: ServiceProviderBase,
+        mediator: Mediator,
+        event_store_options: EventStoreOptions,
+        event_store: EventStore,
+        options: Optional[ReadModelConciliationOptions] = None,
+        checkpoint_store: Optional[ProjectionCheckpointStore] = None,
+    ):
         self._service_provider = service_provider
         self._mediator = mediator
         self._event_store_options = event_store_options
         self._event_store = event_store
         self._options = options or ReadModelConciliationOptions(consumer_group=event_store_options.consumer_group if hasattr(event_store_options, "consumer_group") else "default")
-        self._event_queue = AggregateEventQueue() if self._options.sequential_processing else None
+        if self._options.catch_up and checkpoint_store is None:
+            raise ValueError("Catching up requires a projection checkpoint store")
+        if self._options.catch_up_page_size < 1 or self._options.checkpoint_interval < 1:
+            raise ValueError("The catch-up page size and checkpoint interval must be greater than 0")
+        self._checkpoint_store = checkpoint_store
+        self._batch_queue = EventBatchQueue(self._options.batch_size, self._options.batch_window, self._options.queue_capacity, self._options.consumer_group) if self._options.batch_size else None
+        self._event_queue = AggregateEventQueue(self._options.worker_count, self._options.queue_capacity, self._options.consumer_group) if self._options.sequential_processing and self._batch_queue is None else None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._subscription = None
+        self._catch_up_task = None
+        self._handoff = asyncio.Queue(self._options.queue_capacity)
+        self._dispatcher = None
+        self._parallel_slots = asyncio.Semaphore(self._options.queue_capacity)
+        self._parallel_tasks: set[asyncio.Task] = set()
+        self.mode = "live"
+        self._caught_up_from: Optional[int] = None
+        self._caught_up_position: Optional[int] = None
+        self._checkpoint_offset = 0
+        self._pending_offsets: dict[int, bool] = {}
+        self._unsaved_events = 0
+        self._head_position = -1
+        self._projected_position = -1
+        self._projected_events = 0
+        self._in_flight = 0
+        ReadModelReconciliator._instances.add(self)
+        ReadModelReconciliator._initialize_gauges()
+
+    @property
+    def lag(self) -> int:
+        """Gets the difference between the commit position of the last event known to have been recorded and the one of the last event projected"""
+        return max(self._head_position - self._projected_position, 0)
+
+    @property
+    def in_flight(self) -> int:
+        """Gets the number of events being handled"""
+        return self._in_flight
 
     async def start_async(self):
         """Start the read model reconciliator and begin processing events."""
         self._loop = asyncio.get_event_loop()
-        await self.subscribe_async()
-        log.info(f"ReadModelReconciliator started with " f"{'sequential' if self._options.sequential_processing else 'parallel'} processing")
+        if self._options.catch_up:
+            # the host awaits hosted services before serving requests: catching up, which may take long, must not hold it back
+            self._catch_up_task = asyncio.create_task(self._catch_up_and_subscribe_async())
+        else:
+            await self.subscribe_async()
+        log.info(f"ReadModelReconciliator started with " f"{'batched' if self._batch_queue else 'sequential' if self._options.sequential_processing else 'parallel'} processing")
+
+    async def _catch_up_and_subscribe_async(self) -> None:
+        """Catches up, then subscribes to the category stream"""
+        try:
+            await self.catch_up_async()
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            # the events that could not be projected are delivered by the subscription, which retries or parks them
+            log.error(f"Failed to catch up, resuming from the live subscription: {ex}", exc_info=True)
+            self.mode = "live"
+        try:
+            await self.subscribe_async()
+        except Exception as ex:
+            log.error(f"Failed to subscribe to the category stream after catching up: {ex}", exc_info=True)
 
     async def stop_async(self):
         """Stop the read model reconciliator and clean up resources."""
+        if self._catch_up_task is not None:
+            self._catch_up_task.cancel()
+            await asyncio.gather(self._catch_up_task, return_exceptions=True)
+            self._catch_up_task = None
         if self._subscription is not None:
             self._subscription.dispose()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, *self._parallel_tasks, return_exceptions=True)
+            self._dispatcher = None
         if self._event_queue:
             await self._event_queue.shutdown()
+        if self._batch_queue:
+            await self._batch_queue.shutdown()
+        if self._checkpoint_store is not None and self._unsaved_events:
+            await self._save_checkpoint_async()
+        ReadModelReconciliator._instances.discard(self)
         log.info("ReadModelReconciliator stopped")
 
+    async def catch_up_async(self) -> int:
+        """
+        Projects the events recorded in the category stream since the last checkpoint, reading them in pages and publishing them in batches.
+
+        Returns:
+            The number of events projected
+        """
+        stream_id = f"$ce-{self._event_store_options.database_name}"
+        checkpoint = await self._checkpoint_store.get_async(self._options.consumer_group)
+        start_offset = self._checkpoint_offset = checkpoint.position if checkpoint is not None else 0
+        self.mode = "catch-up"
+        self._head_position = max(self._head_position, await self._read_head_position_async(stream_id))
+        log.info(f"Catching up from event {start_offset} of stream '{stream_id}'")
+        page: list[EventRecord] = []
+        projected_events = 0
+        async for e in self._event_store.read_stream_async(stream_id, StreamReadDirection.FORWARDS, start_offset, page_size=self._options.catch_up_page_size):
+            page.append(e)
+            if len(page) >= self._options.catch_up_page_size:
+                await self._catch_up_page_async(page)
+                projected_events += len(page)
+                page = []
+        if page:
+            await self._catch_up_page_async(page)
+            projected_events += len(page)
+        self.mode = "live"
+        log.info(f"Caught up with stream '{stream_id}' after projecting {projected_events} events")
+        return projected_events
+
+    async def _catch_up_page_async(self, page: list[EventRecord]) -> None:
+        """Publishes the specified page of events in one batch, then checkpoints the offset following its last event"""
+        self._in_flight += len(page)
+        try:
+            await self._mediator.publish_batch_async([e.data for e in page])
+        finally:
+            self._in_flight -= len(page)
+        self._on_projected(page)
+        if self._caught_up_from is None:
+            self._caught_up_from = _get_position(page[0])
+        self._caught_up_position = self._projected_position
+        offset = get_stream_offset(page[-1])
+        if offset is not None:
+            self._checkpoint_offset = max(self._checkpoint_offset, offset + 1)
+        await self._save_checkpoint_async()
+
+    async def _read_head_position_async(self, stream_id: str) -> int:
+        """Reads the commit position of the last event of the specified stream, or -1 if it is empty or cannot be read"""
+        try:
+            descriptor = await self._event_store.get_async(stream_id)
+            if descriptor is None or not descriptor.length:
+                return -1
+            records = await self._event_store.read_async(stream_id, StreamReadDirection.BACKWARDS, descriptor.length - 1, 1)
+            return records[0].position if records else -1
+        except Exception as ex:
+            log.debug(f"Could not read the head position of stream '{stream_id}': {ex}")
+            return -1
+
+    async def _save_checkpoint_async(self) -> None:
+        """Saves the offset, in the category stream, of the next event to project"""
+        self._unsaved_events = 0
+        await self._checkpoint_store.save_async(ProjectionCheckpoint(self._options.consumer_group, self._checkpoint_offset, datetime.now(timezone.utc)))
+
+    def _on_projected(self, records: list[EventRecord]) -> None:
+        """Records the projection of the specified events"""
+        self._projected_events += len(records)
+        self._projected_position = max(self._projected_position, *(_get_position(e) for e in records))
+        if ReadModelReconciliator._projected_events_counter is not None:
+            ReadModelReconciliator._projected_events_counter.add(len(records), self._get_metric_attributes())
+
     async def subscribe_async(self):
-        """Subscribe to the event store's category stream."""
+        """
+        Subscribe to the event store's category stream.
+
+        Events are handed over to a single dispatcher task through a bounded queue, rather than each being handled by a task
+        of its own: when a worker shard is full, the dispatcher waits, the events it has not dispatched are not acknowledged,
+        and the subscription stops delivering more of them once its own limit of unacknowledged events is reached.
+        """
         observable = await self._event_store.observe_async(f"$ce-{self._event_store_options.database_name}", self._event_store_options.consumer_group)
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch_events_async())
 
         def on_next(e: EventRecord):
-            """Schedule the async handler on the main event loop without closing it."""
+            """Hand the event over to the dispatcher, on the main event loop without closing it."""
             try:
                 if self._loop is None:
                     log.warning("Event loop not initialized, skipping event")
                     return
 
-                # Use call_soon_threadsafe to schedule the coroutine on the main loop
+                # Use call_soon_threadsafe to hand the event over on the main loop
                 # This prevents creating/closing new event loops which breaks Motor
-                self._loop.call_soon_threadsafe(lambda: asyncio.create_task(self._handle_event_async(e)))
+                self._loop.call_soon_threadsafe(self._hand_over_event, e)
             except RuntimeError as ex:
                 log.warning(f"Event loop closed, skipping event: " f"{type(e.data).__name__ if hasattr(e, 'data') else 'unknown'} - {ex}")
 
         self._subscription = AsyncRx.subscribe(observable, on_next)
 
+    def _hand_over_event(self, e: EventRecord) -> None:
+        """Queues the specified event for dispatch, handing it back to the subscription if the dispatch queue is full"""
+        try:
+            self._handoff.put_nowait(e)
+        except asyncio.QueueFull:
+            # the subscription delivered more unacknowledged events than the dispatch queue holds: the surplus is redelivered
+            if hasattr(e, "nack_async") and callable(getattr(e, "nack_async", None)):
+                log.warning(f"The dispatch queue of the read model is full, handing an event of type '{type(e.data).__name__}' back to the subscription")
+                asyncio.create_task(e.nack_async())
+            else:
+                log.error(f"The dispatch queue of the read model is full, dropping an event of type '{type(e.data).__name__}'")
+
+    async def _dispatch_events_async(self) -> None:
+        """Dispatches the events handed over by the subscription, one after another, waiting while their worker shard is full"""
+        while True:
+            e = await self._handoff.get()
+            try:
+                if self._batch_queue is None and self._event_queue is None:
+                    # parallel processing: events are handled concurrently, but no more than 'queue_capacity' at once
+                    await self._parallel_slots.acquire()
+                    task = asyncio.create_task(self._handle_event_async(e))
+                    self._parallel_tasks.add(task)
+                    task.add_done_callback(self._on_parallel_task_done)
+                else:
+                    await self._handle_event_async(e)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                log.error(f"An exception occurred while dispatching an event of type '{type(e.data).__name__}': {ex}", exc_info=True)
+            finally:
+                self._handoff.task_done()
+
+    def _on_parallel_task_done(self, task: asyncio.Task) -> None:
+        """Releases the slot of the specified task handling an event in parallel"""
+        self._parallel_tasks.discard(task)
+        self._parallel_slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"An exception occurred while handling an event: {task.exception()}")
+
     async def _handle_event_async(self, e: EventRecord) -> None:
         """
         Handle an incoming event record.
 
-        Routes to either sequential or parallel processing based on configuration.
+        Routes to either batched, sequential or parallel processing based on configuration.
+        Events that have already been projected while catching up are acknowledged without being published. Events
+        preceding the ones projected while catching up, such as redelivered or replayed parked events, are published.
         """
-        if self._options.sequential_processing and self._event_queue:
+        position = _get_position(e)
+        self._head_position = max(self._head_position, position)
+        if self._caught_up_position is not None and 0 <= self._caught_up_from <= position <= self._caught_up_position:
+            if hasattr(e, "ack_async") and callable(getattr(e, "ack_async", None)):
+                await e.ack_async()
+            return
+        offset = get_stream_offset(e)
+        if self._checkpoint_store is not None and offset is not None and offset >= self._checkpoint_offset:
+            # remembers the order in which events are delivered, which is the order in which they are checkpointed
+            self._pending_offsets.setdefault(offset, False)
+        if self._batch_queue:
+            await self._batch_queue.enqueue(e, self.on_event_record_batch_async)
+        elif self._options.sequential_processing and self._event_queue:
             # Extract aggregate ID from the event for grouping
             aggregate_id = self._extract_aggregate_id(e)
             await self._event_queue.enqueue(aggregate_id, e, self.on_event_record_stream_next_async)
@@ -269,29 +769,8 @@ class ReadModelReconciliator(HostedService):
             await self.on_event_record_stream_next_async(e)
 
     def _extract_aggregate_id(self, e: EventRecord) -> str:
-        """
-        Extract the aggregate ID from an event record for sequential processing grouping.
-
-        Tries multiple strategies to find the aggregate ID:
-        1. From event data's aggregate_id attribute
-        2. From event record's stream_id (format: aggregatetype-aggregateid)
-        3. Falls back to "unknown" if not found
-        """
-        # Try to get from event data
-        if hasattr(e, "data") and e.data is not None and hasattr(e.data, "aggregate_id"):
-            agg_id = getattr(e.data, "aggregate_id", None)
-            if agg_id is not None:
-                return str(agg_id)
-
-        # Try to get from stream ID (format: aggregatetype-aggregateid)
-        if hasattr(e, "stream_id") and e.stream_id:
-            parts = str(e.stream_id).split("-", 1)
-            if len(parts) > 1:
-                return parts[1]
-
-        # Fallback - all events go to same queue (fully sequential)
-        log.debug(f"Could not extract aggregate_id from event {type(e.data).__name__}")
-        return "unknown"
+        """Extract the aggregate ID from an event record for sequential processing grouping."""
+        return extract_aggregate_id(e)
 
     async def on_event_record_stream_next_async(self, e: EventRecord):
         """
@@ -303,6 +782,7 @@ class ReadModelReconciliator(HostedService):
         Args:
             e: The event record to process
         """
+        self._in_flight += 1
         try:
             # Publish the event through the mediator
             await self._mediator.publish_async(e.data)
@@ -321,8 +801,89 @@ class ReadModelReconciliator(HostedService):
             # Use duck typing to support both AckableEventRecord and mock objects
             if hasattr(e, "nack_async") and callable(getattr(e, "nack_async", None)):
                 await e.nack_async()
+            await self._on_live_settled_async([e], projected=False)
+            return
+        finally:
+            self._in_flight -= 1
+        await self._on_live_settled_async([e], projected=True)
+
+    async def on_event_record_batch_async(self, batch: list[EventRecord]):
+        """
+        Process a batch of event records by publishing them through the mediator, in one go.
+
+        The events of the batch are acknowledged once all of them have been handled, or negatively acknowledged
+        if any of their handlers failed.
+
+        Args:
+            batch: The event records to process
+        """
+        self._in_flight += len(batch)
+        try:
+            await self._mediator.publish_batch_async([e.data for e in batch])
+            acks = [e.ack_async() for e in batch if hasattr(e, "ack_async") and callable(getattr(e, "ack_async", None))]
+            if acks:
+                await asyncio.gather(*acks)
+            log.debug(f"Successfully processed a batch of {len(batch)} events")
+
+        except Exception as ex:
+            log.error(f"An exception occurred while publishing a batch of {len(batch)} events: {ex}", exc_info=True)
+            nacks = [e.nack_async() for e in batch if hasattr(e, "nack_async") and callable(getattr(e, "nack_async", None))]
+            if nacks:
+                await asyncio.gather(*nacks, return_exceptions=True)
+            await self._on_live_settled_async(batch, projected=False)
+            return
+        finally:
+            self._in_flight -= len(batch)
+        await self._on_live_settled_async(batch, projected=True)
+
+    async def _on_live_settled_async(self, records: list[EventRecord], projected: bool) -> None:
+        """
+        Records the settlement of the specified events delivered by the subscription, which have either been projected or
+        handed back to the subscription, and checkpoints the offset following the contiguous run of settled events every
+        'checkpoint_interval' events, when catching up is enabled.
+        """
+        if projected:
+            self._on_projected(records)
+        if self._checkpoint_store is None:
+            return
+        for e in records:
+            offset = get_stream_offset(e)
+            if offset in self._pending_offsets:
+                self._pending_offsets[offset] = True
+        while self._pending_offsets:
+            offset, settled = next(iter(self._pending_offsets.items()))
+            if not settled:
+                break
+            del self._pending_offsets[offset]
+            self._checkpoint_offset = max(self._checkpoint_offset, offset + 1)
+            self._unsaved_events += 1
+        if self._unsaved_events >= self._options.checkpoint_interval:
+            await self._save_checkpoint_async()
 
     async def on_event_record_stream_error(self, ex: Exception):
         """Handle errors from the event record stream by resubscribing."""
         log.error(f"Event stream error, resubscribing: {ex}")
         await self.subscribe_async()
+
+    @classmethod
+    def _initialize_gauges(cls) -> None:
+        """Registers the lag and in-flight gauges, and the projected events counter, once, if OpenTelemetry is available"""
+        if not OTEL_AVAILABLE or cls._gauges_initialized:
+            return
+        meter = get_meter(__name__)
+        meter.create_observable_gauge(name="neuroglia.read_model.position.lag", callbacks=[cls._observe_lag], unit="1", description="Difference between the commit position of the last event recorded and the one of the last event projected into the read model")
+        # a monotonic counter, from which backends derive the throughput, rather than a rate sampled by whichever reader collects first
+        cls._projected_events_counter = meter.create_counter(name="neuroglia.read_model.projected_events", unit="events", description="Number of events projected into the read model")
+        meter.create_observable_gauge(name="neuroglia.read_model.handlers.in_flight", callbacks=[cls._observe_in_flight], unit="events", description="Number of events being handled by the read model's handlers")
+        cls._gauges_initialized = True
+
+    def _get_metric_attributes(self) -> dict[str, str]:
+        return {"consumer_group": self._options.consumer_group, "mode": self.mode}
+
+    @classmethod
+    def _observe_lag(cls, options: "CallbackOptions") -> Iterable["Observation"]:
+        return [Observation(reconciliator.lag, reconciliator._get_metric_attributes()) for reconciliator in list(cls._instances)]
+
+    @classmethod
+    def _observe_in_flight(cls, options: "CallbackOptions") -> Iterable["Observation"]:
+        return [Observation(reconciliator.in_flight, reconciliator._get_metric_attributes()) for reconciliator in list(cls._instances)]
@@ -0,0 +1,17 @@
+"""
+Snapshot store implementations for event-sourced aggregates.
+
+Provides in-memory, file system, MongoDB and Redis implementations of the SnapshotStore abstraction.
+"""
+
+from .file_snapshot_store import FileSnapshotStore
+from .in_memory_snapshot_store import InMemorySnapshotStore
+from .mongo_snapshot_store import MongoSnapshotStore
+from .redis_snapshot_store import RedisSnapshotStore
+
+__all__ = [
+    "FileSnapshotStore",
+    "InMemorySnapshotStore",
+    "MongoSnapshotStore",
+    "RedisSnapshotStore",
+]
@@ -0,0 +1,61 @@
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Snapshot,
+    SnapshotStore,
+)
+from neuroglia.serialization.abstractions import Serializer
+from neuroglia.serialization.json import JsonSerializer
+
+
+class FileSnapshotStore(SnapshotStore):
+    """
+    Represents a file system implementation of the SnapshotStore class.
+
+    Each stream's latest snapshot is stored in a file named after the stream, and is replaced atomically. Snapshots are
+    stored as JSON files by default, or in the binary format of the serializer the store is configured with, such as
+    the MessagePackSerializer.
+
+    Examples:
+        ```python
+        snapshot_store = FileSnapshotStore("data/snapshots")
+
+        # Compact binary snapshots
+        snapshot_store = FileSnapshotStore("data/snapshots", MessagePackSerializer())
+        ```
+    """
+
+    def __init__(self, directory: str = "snapshots", serializer: Optional[Serializer] = None):
+        """
+        Initializes a new FileSnapshotStore.
+
+        Args:
+            directory: The directory to store snapshots in
+            serializer: Optional custom serializer (defaults to JsonSerializer). Files are named '*.json' when it is a JsonSerializer, '*.snapshot' otherwise
+        """
+        self.directory = Path(directory)
+        self.serializer = serializer or JsonSerializer()
+        self._file_extension = ".json" if isinstance(self.serializer, JsonSerializer) else ".snapshot"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    async def get_async(self, stream_id: str) -> Optional[Snapshot]:
+        file_path = self._get_file_path(stream_id)
+        if not file_path.exists():
+            return None
+        return self.serializer.deserialize(bytearray(file_path.read_bytes()), Snapshot)
+
+    async def save_async(self, snapshot: Snapshot) -> None:
+        file_path = self._get_file_path(snapshot.stream_id)
+        temporary_file_path = file_path.with_suffix(".tmp")
+        temporary_file_path.write_bytes(self.serializer.serialize(snapshot))
+        os.replace(temporary_file_path, file_path)
+
+    async def delete_async(self, stream_id: str) -> None:
+        self._get_file_path(stream_id).unlink(missing_ok=True)
+
+    def _get_file_path(self, stream_id: str) -> Path:
+        """Gets the path of the file used to store the snapshot of the specified stream"""
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9._-]', '_', stream_id)}{self._file_extension}"
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Snapshot,
+    SnapshotStore,
+)
+
+
+class InMemorySnapshotStore(SnapshotStore):
+    """Represents an in-memory implementation of the SnapshotStore class, typically used for testing and prototyping"""
+
+    def __init__(self):
+        self._snapshots: dict[str, Snapshot] = {}
+
+    _snapshots: dict[str, Snapshot]
+    """ Gets a name/value mapping of the stored snapshots, keyed by stream id """
+
+    async def get_async(self, stream_id: str) -> Optional[Snapshot]:
+        return self._snapshots.get(stream_id)
+
+    async def save_async(self, snapshot: Snapshot) -> None:
+        self._snapshots[snapshot.stream_id] = snapshot
+
+    async def delete_async(self, stream_id: str) -> None:
+        self._snapshots.pop(stream_id, None)
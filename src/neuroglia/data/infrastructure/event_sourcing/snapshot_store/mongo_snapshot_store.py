@@ -0,0 +1,67 @@
+from datetime import timezone
+from typing import TYPE_CHECKING, Optional
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    MOTOR_AVAILABLE = True
+except ImportError:
+    MOTOR_AVAILABLE = False
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Snapshot,
+    SnapshotStore,
+)
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+class MongoSnapshotStore(SnapshotStore):
+    """
+    Represents a MongoDB implementation of the SnapshotStore class, based on the Motor async driver.
+
+    Each stream's latest snapshot is stored as a document whose id is the stream id, and is replaced on save.
+
+    Examples:
+        ```python
+        client = AsyncIOMotorClient("mongodb://localhost:27017")
+        snapshot_store = MongoSnapshotStore(client, "bank")
+        ```
+    """
+
+    def __init__(self, client: "AsyncIOMotorClient", database_name: str, collection_name: str = "snapshots"):
+        """
+        Initializes a new MongoSnapshotStore.
+
+        Args:
+            client: Async Motor MongoDB client instance
+            database_name: Name of the MongoDB database
+            collection_name: Name of the collection to store snapshots in
+        """
+        if not MOTOR_AVAILABLE:
+            raise ImportError("motor is required for MongoDB snapshot storage. Install with: pip install motor")
+        self._client = client
+        self._database_name = database_name
+        self._collection_name = collection_name
+
+    def _get_collection(self) -> "AsyncIOMotorCollection":
+        """Gets the collection used to store snapshots"""
+        return self._client[self._database_name][self._collection_name]
+
+    async def get_async(self, stream_id: str) -> Optional[Snapshot]:
+        document = await self._get_collection().find_one({"_id": stream_id})
+        if document is None:
+            return None
+        timestamp = document["timestamp"]
+        if timestamp.tzinfo is None:
+            # BSON dates are stored in UTC and decoded as naive datetimes by default
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return Snapshot(stream_id, document["version"], document["schema_version"], document["data"], timestamp)
+
+    async def save_async(self, snapshot: Snapshot) -> None:
+        document = {"version": snapshot.version, "schema_version": snapshot.schema_version, "data": snapshot.data, "timestamp": snapshot.timestamp}
+        await self._get_collection().replace_one({"_id": snapshot.stream_id}, document, upsert=True)
+
+    async def delete_async(self, stream_id: str) -> None:
+        await self._get_collection().delete_one({"_id": stream_id})
@@ -0,0 +1,66 @@
+from typing import TYPE_CHECKING, Optional
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Snapshot,
+    SnapshotStore,
+)
+from neuroglia.serialization.abstractions import Serializer
+from neuroglia.serialization.json import JsonSerializer
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+class RedisSnapshotStore(SnapshotStore):
+    """
+    Represents a Redis implementation of the SnapshotStore class.
+
+    Each stream's latest snapshot is stored under the '{key_prefix}{stream_id}' key, as JSON by default, or in the binary
+    format of the serializer the store is configured with, such as the MessagePackSerializer.
+
+    Examples:
+        ```python
+        client = redis.Redis(host="localhost", port=6379)
+        snapshot_store = RedisSnapshotStore(client, key_prefix="bank:snapshots:")
+
+        # Compact binary snapshots, which require a client that does not decode responses
+        snapshot_store = RedisSnapshotStore(client, key_prefix="bank:snapshots:", serializer=MessagePackSerializer())
+        ```
+    """
+
+    def __init__(self, client: "redis.Redis", key_prefix: str = "snapshots:", serializer: Optional[Serializer] = None):
+        """
+        Initializes a new RedisSnapshotStore.
+
+        Args:
+            client: Async Redis client instance
+            key_prefix: The prefix of the keys snapshots are stored under
+            serializer: Optional custom serializer (defaults to JsonSerializer)
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis is required for Redis snapshot storage. Install with: pip install redis")
+        self._client = client
+        self._key_prefix = key_prefix
+        self._serializer = serializer or JsonSerializer()
+
+    async def get_async(self, stream_id: str) -> Optional[Snapshot]:
+        value = await self._client.get(f"{self._key_prefix}{stream_id}")
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # clients configured to decode responses return text
+            value = value.encode("utf-8")
+        return self._serializer.deserialize(bytearray(value), Snapshot)
+
+    async def save_async(self, snapshot: Snapshot) -> None:
+        await self._client.set(f"{self._key_prefix}{snapshot.stream_id}", bytes(self._serializer.serialize(snapshot)))
+
+    async def delete_async(self, stream_id: str) -> None:
+        await self._client.delete(f"{self._key_prefix}{stream_id}")
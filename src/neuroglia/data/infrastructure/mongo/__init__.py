@@ -5,6 +5,8 @@ Provides MongoDB repository implementations:
 - MongoRepository: Sync PyMongo-based repository with queryable support
 - MotorRepository: Async Motor-based repository for async applications (recommended)
 - EnhancedMongoRepository: Advanced operations with enhanced features
+- MotorShadowCollection: Shadow collection swapped in once a projection rebuild completes
+- MotorIndexProvisioner: Hosted service ensuring the indexes declared for a collection at startup
 
 For async applications (FastAPI, asyncio), use MotorRepository.
 For sync applications, use MongoRepository or EnhancedMongoRepository.
@@ -18,8 +20,15 @@ Note:
 from typing import TYPE_CHECKING
 
 # Eagerly import async/motor-based components (no pymongo dependency)
+from .motor_indexes import (
+    MongoIndex,
+    MongoIndexDrift,
+    MotorIndexProvisioner,
+    mongo_index,
+)
 from .motor_query import MotorQuery, MotorQueryBuilder, MotorQueryProvider
-from .motor_repository import MotorRepository
+from .motor_repository import MotorBulkWriteResult, MotorRepository
+from .motor_shadow_collection import MotorShadowCollection
 from .serialization_helper import MongoSerializationHelper
 from .typed_mongo_query import TypedMongoQuery, with_typed_mongo_query
 
@@ -35,10 +44,18 @@ if TYPE_CHECKING:
 __all__ = [
     # Async repository (recommended for FastAPI/asyncio)
     "MotorRepository",
+    "MotorBulkWriteResult",
     # Async query support
     "MotorQuery",
     "MotorQueryBuilder",
     "MotorQueryProvider",
+    # Async projection rebuild support
+    "MotorShadowCollection",
+    # Index provisioning
+    "MongoIndex",
+    "MongoIndexDrift",
+    "MotorIndexProvisioner",
+    "mongo_index",
     # Sync repositories (lazy-loaded, require pymongo)
     "MongoRepository",
     "MongoQueryProvider",
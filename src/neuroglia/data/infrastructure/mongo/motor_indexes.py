@@ -0,0 +1,212 @@
+"""
+Declarative index provisioning for MongoDB collections managed by MotorRepository.
+
+Indexes are declared on entity or aggregate state types with the `mongo_index` decorator, or passed to
+`MotorRepository.configure`. They are ensured at host startup by a MotorIndexProvisioner, which creates
+the missing indexes and reports, without altering them, the existing indexes that drifted from their declaration.
+
+Example:
+    ```python
+    @mongo_index("customer_id", "-created_at")
+    @mongo_index("expires_at", expire_after_seconds=0)
+    class OrderState(AggregateState[str]):
+        ...
+
+    MotorRepository.configure(builder, Order, str, "mario_pizzeria", indexes=[MongoIndex.create("status")])
+    ```
+
+See Also:
+    - MongoDB Indexes: https://www.mongodb.com/docs/manual/indexes/
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from neuroglia.data.abstractions import AggregateRoot
+from neuroglia.hosting.abstractions import HostedService
+
+log = logging.getLogger(__name__)
+
+IndexKey = Union[str, tuple[str, int]]
+""" Represents the key of an index: either a field name, prefixed with '-' to sort it in descending order, or a (field name, direction) pair """
+
+
+@dataclass
+class MongoIndex:
+    """Represents the declaration of a MongoDB index"""
+
+    keys: list[tuple[str, int]]
+    """ Gets the (field name, direction) pairs the index is made of """
+
+    name: str = ""
+    """ Gets the name of the index. Defaults to the name MongoDB generates, i.e. 'customer_id_1_created_at_-1' """
+
+    unique: bool = False
+    """ Gets a boolean indicating whether or not the index rejects documents with duplicate keys """
+
+    sparse: bool = False
+    """ Gets a boolean indicating whether or not the index skips documents that do not have the indexed fields """
+
+    expire_after_seconds: Optional[int] = None
+    """ Gets the number of seconds after which documents are removed, based on the date of the indexed field, if the index is a TTL index """
+
+    def __post_init__(self):
+        if not self.keys:
+            raise ValueError("An index must have at least one key")
+        if self.expire_after_seconds is not None and (len(self.keys) != 1 or self.expire_after_seconds < 0):
+            raise ValueError("A TTL index must have a single key and a positive or zero expiration")
+        if not self.name:
+            self.name = "_".join(f"{field_name}_{direction}" for field_name, direction in self.keys)
+
+    @staticmethod
+    def create(*keys: IndexKey, name: str = "", unique: bool = False, sparse: bool = False, expire_after_seconds: Optional[int] = None) -> "MongoIndex":
+        """Creates a new MongoIndex with the specified keys, prefixing field names with '-' to sort them in descending order"""
+        return MongoIndex([MongoIndex._parse_key(key) for key in keys], name, unique, sparse, expire_after_seconds)
+
+    def to_index_model(self) -> IndexModel:
+        """Converts the index into the model used to create it"""
+        options: dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.sparse:
+            options["sparse"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return IndexModel(self.keys, **options)
+
+    def get_drift(self, information: dict[str, Any]) -> Optional[str]:
+        """Describes how the specified existing index, as returned by 'index_information', differs from the declaration, if it does"""
+        differences = list[str]()
+        existing_keys = [(field_name, int(direction)) for field_name, direction in information.get("key", [])]
+        if existing_keys != self.keys:
+            differences.append(f"keys {existing_keys} instead of {self.keys}")
+        if bool(information.get("unique", False)) != self.unique:
+            differences.append(f"unique={not self.unique}")
+        if bool(information.get("sparse", False)) != self.sparse:
+            differences.append(f"sparse={not self.sparse}")
+        expire_after_seconds = information.get("expireAfterSeconds")
+        if (None if expire_after_seconds is None else int(expire_after_seconds)) != self.expire_after_seconds:
+            differences.append(f"expire_after_seconds={expire_after_seconds} instead of {self.expire_after_seconds}")
+        return ", ".join(differences) if differences else None
+
+    @staticmethod
+    def _parse_key(key: IndexKey) -> tuple[str, int]:
+        if isinstance(key, tuple):
+            return key
+        return (key[1:], DESCENDING) if key.startswith("-") else (key, ASCENDING)
+
+
+@dataclass
+class MongoIndexDrift:
+    """Represents a difference between the indexes declared for a collection and the ones it actually has"""
+
+    collection_name: str
+    """ Gets the name of the collection the drift has been detected on """
+
+    index_name: str
+    """ Gets the name of the drifted index """
+
+    reason: str
+    """ Gets a description of the drift """
+
+
+def mongo_index(*keys: IndexKey, name: str = "", unique: bool = False, sparse: bool = False, expire_after_seconds: Optional[int] = None):
+    """Represents a decorator used to declare a MongoDB index on the documents an entity or aggregate state type is persisted as"""
+
+    def decorator(cls):
+        # prepends the index, so that stacked decorators are declared top to bottom
+        cls.__mongo_indexes__ = [MongoIndex.create(*keys, name=name, unique=unique, sparse=sparse, expire_after_seconds=expire_after_seconds), *getattr(cls, "__mongo_indexes__", [])]
+        return cls
+
+    return decorator
+
+
+def get_declared_indexes(entity_type: type) -> list[MongoIndex]:
+    """Gets the indexes declared on the specified entity type, on its state type if it is an aggregate root, starting with the unique index on 'id'"""
+    declared_types = [entity_type]
+    if isinstance(entity_type, type) and issubclass(entity_type, AggregateRoot):
+        try:
+            declared_types.append(entity_type._get_state_type())
+        except TypeError:
+            pass
+    indexes = [MongoIndex.create("id", unique=True)]
+    for declared_type in declared_types:
+        indexes.extend(getattr(declared_type, "__mongo_indexes__", []))
+    return indexes
+
+
+class MotorIndexProvisioner(HostedService):
+    """
+    Represents the hosted service used to ensure, at startup, the indexes declared for a MongoDB collection.
+
+    Ensuring indexes is idempotent: missing indexes are created, and existing indexes that differ from their declaration,
+    or that are not declared at all, are reported as drifts and logged. Drifted indexes are never dropped nor rebuilt,
+    as doing so on a large collection must be planned.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, database_name: str, collection_name: str, indexes: list[MongoIndex]):
+        """
+        Initializes a new MotorIndexProvisioner.
+
+        Args:
+            client: Async Motor MongoDB client instance
+            database_name: Name of the MongoDB database
+            collection_name: Name of the collection to ensure the indexes of
+            indexes: The indexes declared for the collection. Indexes with the same name are declared once, the first declaration winning
+        """
+        self._client = client
+        self._database_name = database_name
+        self._collection_name = collection_name
+        self.indexes = list[MongoIndex]()
+        for index in indexes:
+            if all(declared_index.name != index.name for declared_index in self.indexes):
+                self.indexes.append(index)
+        self.drifts = list[MongoIndexDrift]()
+
+    indexes: list[MongoIndex]
+    """ Gets the indexes declared for the collection """
+
+    drifts: list[MongoIndexDrift]
+    """ Gets the drifts detected the last time indexes have been ensured """
+
+    async def start_async(self):
+        try:
+            await self.ensure_indexes_async()
+        except Exception as ex:
+            log.error(f"Failed to ensure the indexes of collection '{self._database_name}.{self._collection_name}': {ex}", exc_info=True)
+
+    async def ensure_indexes_async(self) -> list[MongoIndexDrift]:
+        """Creates the declared indexes the collection does not have, and reports the drifts of the existing ones"""
+        collection = self._client[self._database_name][self._collection_name]
+        existing_indexes: dict[str, dict[str, Any]] = await collection.index_information()
+        matched_index_names = {"_id_"}
+        missing_indexes = list[MongoIndex]()
+        drifts = list[MongoIndexDrift]()
+        for index in self.indexes:
+            existing_index_name = index.name if index.name in existing_indexes else None
+            if existing_index_name is None:
+                # an index with the same definition may have been created by hand, under another name
+                existing_index_name = next((n for n, i in existing_indexes.items() if n not in matched_index_names and index.get_drift(i) is None), None)
+            if existing_index_name is None:
+                missing_indexes.append(index)
+                continue
+            matched_index_names.add(existing_index_name)
+            drift = index.get_drift(existing_indexes[existing_index_name])
+            if drift is not None:
+                drifts.append(MongoIndexDrift(self._collection_name, index.name, drift))
+        for index in missing_indexes:
+            try:
+                await collection.create_indexes([index.to_index_model()])
+                log.info(f"Created index '{index.name}' on collection '{self._database_name}.{self._collection_name}'")
+            except Exception as ex:
+                drifts.append(MongoIndexDrift(self._collection_name, index.name, f"missing, and could not be created: {ex}"))
+        for index_name in existing_indexes.keys() - matched_index_names:
+            drifts.append(MongoIndexDrift(self._collection_name, index_name, "not declared"))
+        for drift in drifts:
+            log.warning(f"Index '{drift.index_name}' of collection '{self._database_name}.{drift.collection_name}' drifted from its declaration: {drift.reason}")
+        self.drifts = drifts
+        return drifts
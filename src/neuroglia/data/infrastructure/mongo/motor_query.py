@@ -32,7 +32,10 @@ See Also:
 """
 
 import ast
+import json
+import logging
 from ast import NodeVisitor, expr
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Generic, List, Optional
 
 import pymongo
@@ -42,10 +45,13 @@ from neuroglia.data.queryable import Queryable, QueryProvider, T
 from neuroglia.expressions.javascript_expression_translator import (
     JavaScriptExpressionTranslator,
 )
+from neuroglia.expressions.mongo_expression_translator import MongoExpressionTranslator
 
 if TYPE_CHECKING:
     from neuroglia.serialization import JsonSerializer
 
+log = logging.getLogger(__name__)
+
 
 class MotorQuery(Generic[T], Queryable[T]):
     """
@@ -142,14 +148,19 @@ class MotorQueryBuilder(NodeVisitor):
     The builder walks the Python AST tree and translates method calls like
     .where(), .order_by(), .skip(), .take() into corresponding Motor operations.
 
+    Predicates are translated into native MongoDB query operators, which can use indexes.
+    Predicates that cannot be translated natively fall back to a JavaScript '$where' clause,
+    evaluated against each document, and a warning is logged.
+
     Attributes:
         _collection: Motor collection to query
-        _translator: JavaScript expression translator
+        _translator: JavaScript expression translator, used for selectors and as a fallback for predicates
+        _filter_translator: Native MongoDB query translator for predicates
         _order_by_clauses: Sort specifications
         _select_clause: Field projection
         _skip_clause: Documents to skip
         _take_clause: Maximum documents to return
-        _where_clauses: Filter conditions
+        _where_clauses: Filter conditions, as MongoDB query filters
 
     Example:
         ```python
@@ -157,25 +168,27 @@ class MotorQueryBuilder(NodeVisitor):
         query.where(lambda x: x.price > 10).order_by(lambda x: x.name).take(5)
 
         # Gets translated to Motor operations:
-        collection.find({"$where": "this.price > 10"}).sort("name", 1).limit(5)
+        collection.find({"price": {"$gt": 10}}).sort("name", 1).limit(5)
         ```
     """
 
-    def __init__(self, collection: AsyncIOMotorCollection, translator: JavaScriptExpressionTranslator):
+    def __init__(self, collection: AsyncIOMotorCollection, translator: JavaScriptExpressionTranslator, filter_translator: Optional[MongoExpressionTranslator] = None):
         """
         Initialize the Motor query builder.
 
         Args:
             collection: Motor async collection to query
-            translator: JavaScript expression translator for filter expressions
+            translator: JavaScript expression translator for selectors, and for predicates that cannot be translated natively
+            filter_translator: Native MongoDB query translator for predicates. Defaults to a translator using constants as is
         """
         self._collection = collection
         self._translator = translator
+        self._filter_translator = filter_translator or MongoExpressionTranslator()
         self._order_by_clauses: dict[str, int] = {}
         self._select_clause: Optional[list[str]] = None
         self._skip_clause: Optional[int] = None
         self._take_clause: Optional[int] = None
-        self._where_clauses: list[str] = []
+        self._where_clauses: list[dict[str, Any]] = []
 
     def build(self, expression: expr) -> AsyncIOMotorCursor:
         """
@@ -200,20 +213,13 @@ class MotorQueryBuilder(NodeVisitor):
         """
         self.visit(expression)
 
-        # Build cursor with projection
-        cursor = self._collection.find(projection=self._select_clause)
+        # Build cursor with filter and projection
+        cursor = self._collection.find(self.build_filter(), projection=self._select_clause)
 
         # Apply sorting
         if len(self._order_by_clauses) > 0:
             cursor = cursor.sort(list(self._order_by_clauses.items()))
 
-        # Apply where clauses
-        if len(self._where_clauses) > 0:
-            # Use $where for JavaScript expressions
-            cursor = self._collection.find({"$where": " && ".join(self._where_clauses)}, projection=self._select_clause)
-            if len(self._order_by_clauses) > 0:
-                cursor = cursor.sort(list(self._order_by_clauses.items()))
-
         # Apply skip
         if self._skip_clause is not None:
             cursor = cursor.skip(self._skip_clause)
@@ -224,6 +230,23 @@ class MotorQueryBuilder(NodeVisitor):
 
         return cursor
 
+    def build_filter(self) -> dict[str, Any]:
+        """Builds the MongoDB query filter combining the where clauses visited so far"""
+        if len(self._where_clauses) == 0:
+            return {}
+        if len(self._where_clauses) == 1:
+            return self._where_clauses[0]
+        return {"$and": self._where_clauses}
+
+    def _translate_predicate(self, expression: expr) -> dict[str, Any]:
+        """Translates the specified predicate into a native MongoDB query filter, falling back to a '$where' clause if it cannot be"""
+        try:
+            return self._filter_translator.translate(expression)
+        except NotImplementedError as ex:
+            javascript = self._translator.translate(expression)
+            log.warning(f"Falling back to a '$where' clause, which cannot use indexes, for predicate '{ast.unparse(expression)}': {ex}")
+            return {"$where": javascript}
+
     def visit_Call(self, node: ast.Call):
         """
         Visit a method call node in the AST.
@@ -246,17 +269,21 @@ class MotorQueryBuilder(NodeVisitor):
         if expression is None:
             return
 
-        # Translate lambda expressions to JavaScript
-        javascript = self._translator.translate(expression)
+        if clause in ("first", "last", "where"):
+            # Translate predicates into native query operators
+            predicate = self._translate_predicate(expression)
+        else:
+            # Translate selectors to JavaScript
+            javascript = self._translator.translate(expression)
 
         if clause == "distinct_by":
             # Not directly supported in projection, would need aggregation
             pass
         elif clause == "first":
-            self._where_clauses.append(javascript)
+            self._where_clauses.append(predicate)
             self._take_clause = 1
         elif clause == "last":
-            self._where_clauses.append(javascript)
+            self._where_clauses.append(predicate)
             self._take_clause = 1
             # Default sort by created_at descending (could be any field)
             if "created_at" not in self._order_by_clauses:
@@ -275,7 +302,7 @@ class MotorQueryBuilder(NodeVisitor):
             if isinstance(expression.value, int):
                 self._take_clause = expression.value
         elif clause == "where":
-            self._where_clauses.append(javascript)
+            self._where_clauses.append(predicate)
 
 
 class MotorQueryProvider(QueryProvider):
@@ -359,7 +386,7 @@ class MotorQueryProvider(QueryProvider):
             ```
         """
         # Build Motor cursor from expression
-        cursor = MotorQueryBuilder(self._collection, JavaScriptExpressionTranslator()).build(expression)
+        cursor = MotorQueryBuilder(self._collection, JavaScriptExpressionTranslator(), MongoExpressionTranslator(self._entity_type, self._encode_value)).build(expression)
 
         # Determine if we're expecting a list or single result
         # Check if query_type is List or list type annotation
@@ -379,6 +406,16 @@ class MotorQueryProvider(QueryProvider):
             results = await cursor.to_list(length=1)
             return self._deserialize_entity(results[0]) if results else None
 
+    def _encode_value(self, value: Any) -> Any:
+        """
+        Encode a constant of a query filter the way entities are stored.
+
+        Primitives and datetimes are used as is, other values (enums, decimals, value objects...) are encoded by the serializer.
+        """
+        if value is None or isinstance(value, (str, bool, int, float, datetime)):
+            return value
+        return json.loads(self._serializer.serialize_to_text(value))
+
     def _deserialize_entity(self, doc: dict) -> Any:
         """
         Deserialize a MongoDB document to an entity instance.
@@ -38,15 +38,42 @@ See Also:
 """
 
 import logging
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Generic, Optional, cast
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+    get_origin,
+    get_type_hints,
+)
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError
 
 from neuroglia.data.abstractions import AggregateRoot, TEntity, TKey
+from neuroglia.data.exceptions import (
+    DataAccessException,
+    DuplicateEntityException,
+    EntityNotFoundException,
+    OptimisticConcurrencyException,
+)
 from neuroglia.data.infrastructure.abstractions import QueryableRepository, Repository
+from neuroglia.data.infrastructure.mongo.motor_indexes import (
+    MongoIndex,
+    MotorIndexProvisioner,
+    get_declared_indexes,
+)
 from neuroglia.data.queryable import Queryable
-from neuroglia.hosting.abstractions import ApplicationBuilderBase
+from neuroglia.hosting.abstractions import ApplicationBuilderBase, HostedService
 from neuroglia.mediation.mediator import Mediator
 from neuroglia.serialization.json import JsonSerializer
 
@@ -55,6 +82,37 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_collection_redirects: ContextVar[Optional[dict[tuple[str, str], str]]] = ContextVar("motor_collection_redirects", default=None)
+""" Gets a mapping of the (database, collection) pairs whose reads and writes are redirected, in the current context, to the name of the collection to use instead """
+
+TProjection = TypeVar("TProjection")
+""" Represents the type of the lightweight read models documents are projected onto """
+
+
+@lru_cache(maxsize=None)
+def _get_projection(projection_type: type) -> dict[str, int]:
+    """Gets the MongoDB projection including the fields annotated on the specified type, and excluding '_id'. Projections are computed once per type"""
+    fields = [name for name, annotation in get_type_hints(projection_type).items() if not name.startswith("_") and annotation is not ClassVar and get_origin(annotation) is not ClassVar]
+    if not fields:
+        raise TypeError(f"The projection type '{projection_type.__name__}' does not declare any annotated field")
+    return {"_id": 0, **{name: 1 for name in fields}}
+
+
+@dataclass
+class MotorBulkWriteResult(Generic[TEntity]):
+    """Represents the result of the bulk write of entities by a MotorRepository"""
+
+    written: list[TEntity] = field(default_factory=list)
+    """ Gets the entities that have been written, in the order they have been specified """
+
+    conflicts: list[tuple[TEntity, DataAccessException]] = field(default_factory=list)
+    """ Gets the entities that could not be written, and the exception describing why, i.e. an OptimisticConcurrencyException """
+
+    @property
+    def succeeded(self) -> bool:
+        """Gets a boolean indicating whether or not all entities have been written"""
+        return not self.conflicts
+
 
 class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]):
     """
@@ -163,6 +221,12 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
         Returns:
             Async Motor collection for this repository
         """
+        redirects = _collection_redirects.get()
+        if redirects:
+            # the collection is being rebuilt into a shadow copy by the current context
+            redirected_collection_name = redirects.get((self._database_name, self._collection_name))
+            if redirected_collection_name is not None:
+                return self._client[self._database_name][redirected_collection_name]
         if self._collection is None:
             self._collection = self._client[self._database_name][self._collection_name]
         return self._collection
@@ -446,10 +510,7 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
             # Atomic update with version check
             # Handle documents that don't have state_version field (legacy data)
             # Use $or to match either explicit version or missing version (treated as 0)
-            if old_version == 0:
-                query = {"id": entity_id_str, "$or": [{"state_version": 0}, {"state_version": {"$exists": False}}]}
-            else:
-                query = {"id": entity_id_str, "state_version": old_version}
+            query = self._get_version_filter(entity_id_str, old_version)
 
             result = await self.collection.replace_one(query, doc)
 
@@ -506,6 +567,167 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
         """
         await self.collection.delete_one({"id": self._normalize_id(id)})
 
+    async def add_many_async(self, entities: list[TEntity]) -> MotorBulkWriteResult[TEntity]:
+        """
+        Add the specified entities with a single bulk write, then publish their domain events in one batch.
+
+        Entities are inserted with an unordered bulk write: an entity that cannot be inserted, i.e. because an entity with
+        the same id already exists, is reported as a conflict without preventing the others from being inserted.
+        The domain events of the aggregates that have been inserted are then published with a single Mediator.publish_batch_async call.
+
+        Args:
+            entities: The entities to add
+
+        Returns:
+            The entities that have been added, and the conflicts that prevented the others from being added
+
+        Example:
+            ```python
+            result = await repository.add_many_async(imported_orders)
+            for order, ex in result.conflicts:
+                log.warning(f"Order {order.id()} was not imported: {ex}")
+            ```
+        """
+        result = MotorBulkWriteResult[TEntity]()
+        if not entities:
+            return result
+        operations = list[Union[InsertOne, ReplaceOne]]()
+        for entity in entities:
+            if self._is_aggregate_root(entity):
+                aggregate = cast(AggregateRoot, entity)
+                if getattr(aggregate.state, "created_at", None) is None:
+                    aggregate.state.created_at = datetime.now(timezone.utc)
+                if getattr(aggregate.state, "last_modified", None) is None:
+                    aggregate.state.last_modified = aggregate.state.created_at
+            operations.append(InsertOne(self._serialize_entity(entity)))
+
+        write_errors, _ = await self._bulk_write_async(operations)
+
+        for index, entity in enumerate(entities):
+            write_error = write_errors.get(index)
+            if write_error is None:
+                result.written.append(entity)
+            else:
+                result.conflicts.append((entity, self._get_write_exception(entity, write_error)))
+        await self._publish_domain_events_batch(result.written)
+        return result
+
+    async def update_many_async(self, entities: list[TEntity]) -> MotorBulkWriteResult[TEntity]:
+        """
+        Update the specified entities with a single bulk write, then publish their domain events in one batch.
+
+        As with update_async, each aggregate is only replaced if its 'state_version' has not changed since it was loaded,
+        and its version is incremented. Aggregates that have been modified concurrently, and entities that do not exist,
+        are reported as conflicts (OptimisticConcurrencyException, EntityNotFoundException) without preventing the others
+        from being updated, and keep their version and pending domain events. The domain events of the aggregates that have
+        been updated are then published with a single Mediator.publish_batch_async call.
+
+        A bulk write only reports how many documents matched overall, so each entity is replaced with an upsert: the
+        replacement of an aggregate whose version has changed fails with a duplicate key error on the unique index on 'id',
+        and the replacement of an entity that does not exist is upserted, then deleted. Conflicts are thereby read from the
+        write errors and upserts of the bulk write itself.
+
+        Args:
+            entities: The entities to update
+
+        Returns:
+            The entities that have been updated, and the conflicts that prevented the others from being updated
+
+        Example:
+            ```python
+            result = await repository.update_many_async(orders)
+            if not result.succeeded:
+                # Reload and retry the conflicting orders
+                retry_ids = [order.id() for order, _ in result.conflicts]
+            ```
+        """
+        result = MotorBulkWriteResult[TEntity]()
+        if not entities:
+            return result
+        operations = list[Union[InsertOne, ReplaceOne]]()
+        previous_versions = list[Optional[tuple[int, Any]]]()
+        for entity in entities:
+            if self._is_aggregate_root(entity):
+                aggregate = cast(AggregateRoot, entity)
+                old_version = aggregate.state.state_version
+                previous_versions.append((old_version, getattr(aggregate.state, "last_modified", None)))
+                aggregate.state.last_modified = datetime.now(timezone.utc)
+                aggregate.state.state_version = old_version + 1
+                doc = self._serialize_entity(entity)
+                doc.pop("_id", None)
+                operations.append(ReplaceOne(self._get_version_filter(str(aggregate.id()), old_version), doc, upsert=True))
+            else:
+                if hasattr(entity, "last_modified"):
+                    entity.last_modified = datetime.now(timezone.utc)  # type: ignore
+                doc = self._serialize_entity(entity)
+                doc.pop("_id", None)
+                previous_versions.append(None)
+                operations.append(ReplaceOne({"id": self._normalize_id(self._get_entity_id(entity))}, doc, upsert=True))
+
+        write_errors, upserted_ids = await self._bulk_write_async(operations)
+
+        if upserted_ids:
+            # the entities did not exist: remove the documents their replacement has inserted
+            await self.collection.delete_many({"_id": {"$in": list(upserted_ids.values())}})
+        conflicting_indexes = [index for index, write_error in write_errors.items() if previous_versions[index] is not None and self._is_version_conflict(write_error)]
+        actual_versions = dict[str, int]()
+        if conflicting_indexes:
+            ids = [str(self._get_entity_id(entities[index])) for index in conflicting_indexes]
+            actual_versions = {doc["id"]: doc.get("state_version", 0) async for doc in self.collection.find({"id": {"$in": ids}}, projection={"_id": 0, "id": 1, "state_version": 1})}
+
+        for index, entity in enumerate(entities):
+            entity_id = self._get_entity_id(entity)
+            previous_version = previous_versions[index]
+            exception: Optional[DataAccessException] = None
+            if index in upserted_ids:
+                exception = EntityNotFoundException(entity_id=entity_id, entity_type=type(entity).__name__)
+            elif index in write_errors:
+                if previous_version is not None and self._is_version_conflict(write_errors[index]):
+                    exception = OptimisticConcurrencyException(entity_id=entity_id, expected_version=previous_version[0], actual_version=actual_versions.get(str(entity_id), 0))
+                else:
+                    exception = self._get_write_exception(entity, write_errors[index])
+            if exception is None:
+                result.written.append(entity)
+                continue
+            if previous_version is not None:
+                # the aggregate has not been written: restore the version it has been loaded with
+                aggregate = cast(AggregateRoot, entity)
+                aggregate.state.state_version, aggregate.state.last_modified = previous_version
+            result.conflicts.append((entity, exception))
+        await self._publish_domain_events_batch(result.written)
+        return result
+
+    async def _bulk_write_async(self, operations: list[Union[InsertOne, ReplaceOne]]) -> tuple[dict[int, dict], dict[int, Any]]:
+        """Performs the specified operations with a single unordered bulk write, and returns the write errors and the ids of the upserted documents, mapped by operation index"""
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            return {}, dict(result.upserted_ids or {})
+        except BulkWriteError as ex:
+            if ex.details.get("writeConcernErrors"):
+                raise
+            upserted_ids = {upserted["index"]: upserted["_id"] for upserted in ex.details.get("upserted", [])}
+            return {write_error["index"]: write_error for write_error in ex.details.get("writeErrors", [])}, upserted_ids
+
+    def _get_entity_id(self, entity: TEntity) -> Any:
+        return cast(AggregateRoot, entity).id() if self._is_aggregate_root(entity) else entity.id  # type: ignore[attr-defined]
+
+    def _get_version_filter(self, entity_id: str, version: int) -> dict[str, Any]:
+        """Gets the filter matching the document of the specified aggregate only if it has the specified version. Documents without 'state_version' (legacy data) are at version 0"""
+        if version == 0:
+            return {"id": entity_id, "$or": [{"state_version": 0}, {"state_version": {"$exists": False}}]}
+        return {"id": entity_id, "state_version": version}
+
+    def _get_write_exception(self, entity: TEntity, write_error: dict) -> DataAccessException:
+        entity_id = self._get_entity_id(entity)
+        if write_error.get("code") == 11000:
+            return DuplicateEntityException(entity_id=entity_id, entity_type=type(entity).__name__)
+        return DataAccessException(f"Failed to write {type(entity).__name__} '{entity_id}': {write_error.get('errmsg')}")
+
+    @staticmethod
+    def _is_version_conflict(write_error: dict) -> bool:
+        """Determines whether or not the specified write error is the duplicate key error raised on the unique index on 'id' by the upsert of an aggregate whose version has changed"""
+        return write_error.get("code") == 11000 and list(write_error.get("keyPattern", {"id": 1}).keys()) == ["id"]
+
     async def query_async(self) -> Queryable[TEntity]:
         """
         Returns a queryable for fluent LINQ-style queries.
@@ -538,7 +760,7 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
             ```
 
         Notes:
-            - Lambda expressions are translated to JavaScript for MongoDB $where
+            - Predicates are translated to native MongoDB query operators, which can use indexes, or to a '$where' clause when they cannot be
             - Supports .where(), .order_by(), .skip(), .take(), .select()
             - Use .to_list_async() or .first_or_default_async() to execute
         """
@@ -598,7 +820,8 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
                   Example: [("name", 1), ("created_at", -1)]
             limit: Maximum number of documents to return
             skip: Number of documents to skip (for pagination)
-            projection: Fields to include/exclude. Example: {"name": 1, "email": 1}
+            projection: Fields to include/exclude. Example: {"name": 1, "email": 1}.
+                Documents are still deserialized into entities: use find_projected_async() to map them onto a read type instead
 
         Returns:
             List of entities matching the filter
@@ -645,6 +868,53 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
 
         return entities
 
+    async def find_projected_async(
+        self,
+        filter_dict: dict,
+        projection_type: type[TProjection],
+        sort: Optional[list[tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+        skip: Optional[int] = None,
+    ) -> list[TProjection]:
+        """
+        Find the documents matching a MongoDB filter query, and map them onto a lightweight read type instead of the entity type.
+
+        Only the fields annotated on the projection type are fetched, and documents are deserialized straight onto it,
+        without materializing entities nor aggregates. Projected fields are matched by name against the top-level fields of
+        the documents, i.e. the fields of the state for aggregates, and embedded documents are fetched whole.
+
+        Args:
+            filter_dict: MongoDB query filter
+            projection_type: The type to map documents onto, such as a dataclass or a pydantic model declaring the fields to fetch
+            sort: List of (field, direction) tuples. Direction: 1 for ascending, -1 for descending.
+            limit: Maximum number of documents to return
+            skip: Number of documents to skip (for pagination)
+
+        Returns:
+            List of read models mapped from the documents matching the filter
+
+        Example:
+            ```python
+            @dataclass
+            class OrderSummaryDto:
+                id: str
+                status: OrderStatus
+                total_amount: Decimal
+
+            summaries = await repository.find_projected_async({"customer_id": customer_id}, OrderSummaryDto, sort=[("created_at", -1)], limit=20)
+            ```
+        """
+        cursor = self.collection.find(filter_dict, _get_projection(projection_type))
+
+        if sort:
+            cursor = cursor.sort(sort)
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        return [self._serializer.deserialize_from_value(doc, projection_type) async for doc in cursor]
+
     async def find_one_async(self, filter_dict: dict) -> Optional[TEntity]:
         """
         Find a single entity matching a MongoDB filter query.
@@ -730,6 +1000,8 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
         connection_string_name: str = "mongo",
         domain_repository_type: Optional[type] = None,
         implementation_type: Optional[type] = None,
+        indexes: Optional[list[MongoIndex]] = None,
+        ensure_indexes: bool = True,
     ) -> ApplicationBuilderBase:
         """
         Configure the application to use MotorRepository for a specific entity type.
@@ -758,6 +1030,10 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
                 registered for the domain interface instead of base MotorRepository.
                 Must extend MotorRepository[entity_type, key_type]. Enables single-line
                 registration of custom repositories with domain-specific query methods.
+            indexes: Optional indexes to declare on the collection, in addition to the unique index on 'id' and to
+                the indexes declared with @mongo_index on the entity type or, for aggregates, on its state type.
+                Indexes declared here take precedence over the ones with the same name declared on types.
+            ensure_indexes: Whether or not to ensure the declared indexes at host startup (default: True)
 
         Returns:
             The configured application builder (for fluent chaining)
@@ -810,6 +1086,7 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
         Notes:
             - AsyncIOMotorClient is registered as SINGLETON (shared connection pool)
             - Repository instances are SCOPED (one per request for proper async context)
+            - Declared indexes are ensured at startup by a MotorIndexProvisioner hosted service, which creates missing indexes and logs drifted ones
             - This pattern ensures efficient connection pooling while maintaining request isolation
 
         See Also:
@@ -877,6 +1154,15 @@ class MotorRepository(Generic[TEntity, TKey], QueryableRepository[TEntity, TKey]
                     mediator=mediator,
                 )
 
+        if ensure_indexes:
+            declared_indexes = [*(indexes or []), *get_declared_indexes(entity_type)]
+
+            # Ensure the declared indexes at startup (idempotent: only missing indexes are created)
+            builder.services.add_singleton(
+                HostedService,
+                implementation_factory=lambda sp: MotorIndexProvisioner(sp.get_required_service(AsyncIOMotorClient), database_name, cast(str, collection_name), declared_indexes),
+            )
+
         # Factory function to resolve abstract Repository interface
         def get_repository_interface(sp):
             return sp.get_required_service(MotorRepository[entity_type, key_type])
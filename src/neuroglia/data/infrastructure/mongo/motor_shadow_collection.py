@@ -0,0 +1,110 @@
+"""
+Shadow collections for the rebuild of MongoDB read models.
+
+A projection rebuild writing into a shadow collection leaves the live collection untouched, and queryable, until the
+rebuild completes. The shadow collection is then renamed over the live one, which MongoDB performs atomically. The
+shadow collection is created with the indexes of the live collection, or the declared ones, before any document is
+written to it, so that the collection swapped in is indexed.
+
+Example:
+    ```python
+    target = MotorShadowCollection(client, "bank", "accounts")
+    rebuilder = ProjectionRebuilder(mediator, event_store_options, event_store, checkpoint_store, ProjectionRebuildOptions("accounts"), target)
+
+    # MotorRepository instances write to 'accounts_rebuild' while dispatching rebuilt events,
+    # and to 'accounts' everywhere else
+    await rebuilder.rebuild_async()
+    ```
+
+See Also:
+    - Event Sourcing: https://bvandewe.github.io/pyneuro/patterns/event-sourcing/
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    ProjectionRebuildTarget,
+)
+from neuroglia.data.infrastructure.mongo.motor_indexes import MongoIndex
+from neuroglia.data.infrastructure.mongo.motor_repository import _collection_redirects
+
+log = logging.getLogger(__name__)
+
+
+class MotorShadowCollection(ProjectionRebuildTarget):
+    """
+    Represents a MongoDB collection rebuilt into a shadow copy, which is renamed over the live collection once the rebuild completes.
+
+    While redirected, the MotorRepository instances bound to the live collection read from and write to the shadow collection instead.
+    The redirection only applies to the context the rebuild runs in: concurrent requests keep using the live collection.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, database_name: str, collection_name: str, suffix: str = "_rebuild", indexes: Optional[list[MongoIndex]] = None):
+        """
+        Initializes a new MotorShadowCollection.
+
+        Args:
+            client: Async Motor MongoDB client instance
+            database_name: Name of the MongoDB database
+            collection_name: Name of the live collection to rebuild
+            suffix: The suffix appended to the name of the live collection to name its shadow copy
+            indexes: The indexes to create on the shadow collection. Defaults to the indexes of the live collection
+        """
+        self._client = client
+        self._database_name = database_name
+        self._collection_name = collection_name
+        self._indexes = indexes
+        self.shadow_collection_name = f"{collection_name}{suffix}"
+
+    shadow_collection_name: str
+    """ Gets the name of the shadow collection """
+
+    async def prepare_async(self, resume: bool) -> None:
+        database = self._client[self._database_name]
+        if not resume:
+            await database.drop_collection(self.shadow_collection_name)
+        if self.shadow_collection_name not in await database.list_collection_names():
+            # created even if no document is projected, so that the swap never leaves the read model without its indexes
+            await database.create_collection(self.shadow_collection_name)
+        index_models = [index.to_index_model() for index in self._indexes] if self._indexes is not None else await self._get_live_index_models_async()
+        if index_models:
+            await database[self.shadow_collection_name].create_indexes(index_models)
+
+    @contextmanager
+    def redirect(self) -> Iterator[None]:
+        redirects = dict(_collection_redirects.get() or {})
+        redirects[(self._database_name, self._collection_name)] = self.shadow_collection_name
+        token = _collection_redirects.set(redirects)
+        try:
+            yield
+        finally:
+            _collection_redirects.reset(token)
+
+    async def swap_async(self) -> None:
+        # the shadow collection exists since it has been prepared: the live collection is replaced, never merely dropped
+        await self._client[self._database_name][self.shadow_collection_name].rename(self._collection_name, dropTarget=True)
+        log.info(f"Swapped the shadow collection '{self.shadow_collection_name}' in as '{self._collection_name}'")
+
+    async def _get_live_index_models_async(self) -> list[IndexModel]:
+        """Gets the models of the indexes of the live collection, other than the one on '_id', which MongoDB creates"""
+        information: dict[str, dict[str, Any]] = await self._client[self._database_name][self._collection_name].index_information()
+        index_models = list[IndexModel]()
+        for name, index in information.items():
+            if name == "_id_":
+                continue
+            options = {key: value for key, value in index.items() if key not in ("v", "key", "ns")}
+            keys = list[tuple[str, Any]]()
+            for field_name, direction in index["key"]:
+                # text indexes are described by internal '_fts' keys, and are created from the fields they weight
+                if field_name == "_fts":
+                    keys.extend((weighted_field_name, "text") for weighted_field_name in index["weights"])
+                elif field_name != "_ftsx":
+                    keys.append((field_name, direction))
+            index_models.append(IndexModel(keys, name=name, **options))
+        return index_models
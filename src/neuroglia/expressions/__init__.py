@@ -1,11 +1,13 @@
 """
 Expression evaluation and translation for Neuroglia.
 
-Provides JavaScript expression translation and evaluation capabilities.
+Provides JavaScript and native MongoDB query translation of expressions, and evaluation capabilities.
 """
 
 from .javascript_expression_translator import JavaScriptExpressionTranslator
+from .mongo_expression_translator import MongoExpressionTranslator
 
 __all__ = [
     "JavaScriptExpressionTranslator",
-]
\ No newline at end of file
+    "MongoExpressionTranslator",
+]
@@ -0,0 +1,248 @@
+import ast
+import re
+from ast import (
+    And,
+    Attribute,
+    BoolOp,
+    Call,
+    Compare,
+    Constant,
+    Eq,
+    Gt,
+    GtE,
+    In,
+    Is,
+    IsNot,
+    Lambda,
+    Lt,
+    LtE,
+    Name,
+    Not,
+    NotEq,
+    NotIn,
+    Or,
+    Subscript,
+    UnaryOp,
+    USub,
+    cmpop,
+    expr,
+)
+from collections.abc import Callable
+from decimal import Decimal
+from types import UnionType
+from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
+
+
+class MongoExpressionTranslator:
+    """
+    Represents a service used to translate lambda predicates into native MongoDB query filters.
+
+    Unlike the filters produced by the JavaScriptExpressionTranslator, which MongoDB evaluates by running JavaScript
+    against each document, native filters are evaluated by the query engine and can use indexes.
+
+    Supported expressions:
+        - Field paths, including nested attributes and subscripts: `o.address.city`, `o.lines[0].sku`, `o.labels["team"]`
+        - Comparisons with constants: `==`, `!=`, `<`, `<=`, `>`, `>=`, `is None` and `is not None`, including chained comparisons
+        - Membership: `o.status in ["A", "B"]`, `o.status not in (...)`, and `"admin" in o.roles` when the field is known to be a list or a string
+        - Boolean operators: `and`, `or` and `not`, and boolean fields used as predicates: `o.active`
+        - String methods: `o.name.startswith("A")`, `o.name.endswith("son")`, `o.name.lower() == "bob"` and `o.name.upper() == "BOB"`
+        - Array lengths: `len(o.items) == 3`
+
+    Constants are encoded with the specified function, which should encode them the way documents are stored.
+    Fields stored as strings but compared as numbers, such as Decimals, cannot be compared natively: comparisons involving them,
+    or Decimal constants, are not translated.
+    Expressions that cannot be translated raise a NotImplementedError, so that callers can fall back to another translation.
+
+    Examples:
+        ```python
+        translator = MongoExpressionTranslator(Order)
+        translator.translate(ast.parse('lambda o: o.status == "PENDING" and o.total.amount > 10').body[0].value)
+        # {'$and': [{'status': {'$eq': 'PENDING'}}, {'total.amount': {'$gt': 10}}]}
+        ```
+    """
+
+    _comparison_operators: dict[type[cmpop], str] = {Eq: "$eq", NotEq: "$ne", Lt: "$lt", LtE: "$lte", Gt: "$gt", GtE: "$gte", Is: "$eq", IsNot: "$ne"}
+    """ Gets a mapping of the supported comparison operators to their MongoDB equivalent """
+
+    _reversed_comparison_operators: dict[str, str] = {"$eq": "$eq", "$ne": "$ne", "$lt": "$gt", "$lte": "$gte", "$gt": "$lt", "$gte": "$lte"}
+    """ Gets a mapping of MongoDB comparison operators to the operator to use when their operands are swapped """
+
+    _string_encoded_numeric_types: tuple[type, ...] = (Decimal,)
+    """ Gets the numeric types whose values are stored as strings, and therefore cannot be compared natively """
+
+    def __init__(self, element_type: Optional[type] = None, encode_value: Optional[Callable[[Any], Any]] = None):
+        """
+        Initializes a new MongoExpressionTranslator.
+
+        Args:
+            element_type: The type of the documents to filter, used to disambiguate membership tests on strings and lists
+            encode_value: A function used to encode constants into the values they are stored as. Constants are used as is when not set
+        """
+        self._element_type = element_type
+        self._encode_value = encode_value or (lambda value: value)
+        self._parameter: Optional[str] = None
+
+    def translate(self, expression: expr) -> dict[str, Any]:
+        """Translates the specified lambda predicate into a new MongoDB query filter"""
+        if not isinstance(expression, Lambda) or len(expression.args.args) != 1:
+            raise NotImplementedError("Only lambda predicates with a single argument can be translated")
+        self._parameter = expression.args.args[0].arg
+        return self._translate_predicate(expression.body)
+
+    def _translate_predicate(self, expression: expr) -> dict[str, Any]:
+        if isinstance(expression, BoolOp):
+            return self._translate_bool_op(expression)
+        elif isinstance(expression, Compare):
+            return self._translate_compare(expression)
+        elif isinstance(expression, UnaryOp) and isinstance(expression.op, Not):
+            return {"$nor": [self._translate_predicate(expression.operand)]}
+        elif isinstance(expression, Call):
+            return self._translate_call(expression)
+        elif isinstance(expression, (Attribute, Subscript)):
+            return {self._translate_field(expression): {"$eq": True}}
+        raise NotImplementedError(f"The specified expression type '{type(expression).__name__}' cannot be translated into a MongoDB query filter")
+
+    def _translate_bool_op(self, expression: BoolOp) -> dict[str, Any]:
+        operator = "$and" if isinstance(expression.op, And) else "$or"
+        filters = list[dict[str, Any]]()
+        for value in expression.values:
+            value_filter = self._translate_predicate(value)
+            # flattens nested operations of the same kind, i.e. 'a and (b and c)'
+            filters.extend(value_filter[operator] if list(value_filter.keys()) == [operator] else [value_filter])
+        return {operator: filters}
+
+    def _translate_compare(self, expression: Compare) -> dict[str, Any]:
+        filters = list[dict[str, Any]]()
+        left = expression.left
+        for operator, right in zip(expression.ops, expression.comparators):
+            filters.append(self._translate_comparison(left, operator, right))
+            left = right
+        return filters[0] if len(filters) == 1 else {"$and": filters}
+
+    def _translate_comparison(self, left: expr, operator: cmpop, right: expr) -> dict[str, Any]:
+        if isinstance(operator, (In, NotIn)):
+            return self._translate_membership(left, right, isinstance(operator, NotIn))
+        mongo_operator = self._comparison_operators.get(type(operator))
+        if mongo_operator is None:
+            raise NotImplementedError(f"The specified comparison operator '{type(operator).__name__}' cannot be translated")
+        if not self._is_field(left):
+            if not self._is_field(right):
+                raise NotImplementedError("Comparisons must involve a field of the document")
+            left, right, mongo_operator = right, left, self._reversed_comparison_operators[mongo_operator]
+        if isinstance(left, Call):
+            return self._translate_call_comparison(left, mongo_operator, right)
+        field = self._translate_field(left)
+        value = self._evaluate(right)
+        if value is not None and (isinstance(value, self._string_encoded_numeric_types) or self._is_string_encoded_numeric(field)):
+            raise NotImplementedError(f"Field '{field}' is stored as a string and cannot be compared natively")
+        return {field: {mongo_operator: self._encode_value(value)}}
+
+    def _translate_call_comparison(self, call: Call, mongo_operator: str, value_expression: expr) -> dict[str, Any]:
+        function_name = getattr(call.func, "id", None) or getattr(call.func, "attr", None)
+        value = self._evaluate(value_expression)
+        if function_name == "len" and isinstance(call.func, Name) and len(call.args) == 1 and mongo_operator == "$eq" and isinstance(value, int):
+            return {self._translate_field(call.args[0]): {"$size": value}}
+        # a lower-cased (upper-cased) string equals a lower-case (upper-case) value when they are equal regardless of case
+        if function_name in ("lower", "upper") and isinstance(call.func, Attribute) and not call.args and mongo_operator in ("$eq", "$ne") and isinstance(value, str) and value == getattr(value, function_name)():
+            pattern = re.compile(f"^{re.escape(value)}$", re.IGNORECASE)
+            return {self._translate_field(call.func.value): {"$regex": pattern.pattern, "$options": "i"} if mongo_operator == "$eq" else {"$not": pattern}}
+        raise NotImplementedError(f"Comparisons with the result of '{function_name}' cannot be translated")
+
+    def _translate_membership(self, element: expr, container: expr, negate: bool) -> dict[str, Any]:
+        if self._is_field(element) and not self._is_field(container):
+            values = self._evaluate(container)
+            if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+                raise NotImplementedError("Membership tests of fields must be against a collection of constants")
+            field = self._translate_field(element)
+            if self._is_string_encoded_numeric(field) or any(isinstance(value, self._string_encoded_numeric_types) for value in values):
+                raise NotImplementedError(f"Field '{field}' is stored as a string and cannot be compared natively")
+            return {field: {"$nin" if negate else "$in": [self._encode_value(value) for value in values]}}
+        if self._is_field(container) and not self._is_field(element):
+            field = self._translate_field(container)
+            value = self._evaluate(element)
+            kind = self._get_field_kind(field)
+            if kind == "array":
+                return {field: {"$ne" if negate else "$eq": self._encode_value(value)}}
+            if kind == "string" and isinstance(value, str):
+                pattern = re.escape(value)
+                return {field: {"$not": re.compile(pattern)}} if negate else {field: {"$regex": pattern}}
+            raise NotImplementedError(f"Membership tests on field '{field}' cannot be translated without knowing whether it is a list or a string")
+        raise NotImplementedError("Membership tests must involve a field of the document and a constant")
+
+    def _translate_call(self, expression: Call) -> dict[str, Any]:
+        function_name = getattr(expression.func, "attr", None)
+        if function_name in ("startswith", "endswith") and len(expression.args) == 1 and self._is_field(expression.func.value):
+            value = self._evaluate(expression.args[0])
+            if isinstance(value, str):
+                pattern = f"^{re.escape(value)}" if function_name == "startswith" else f"{re.escape(value)}$"
+                return {self._translate_field(expression.func.value): {"$regex": pattern}}
+        raise NotImplementedError(f"The specified function '{function_name or ast.unparse(expression.func)}' cannot be translated into a MongoDB query filter")
+
+    def _translate_field(self, expression: expr) -> str:
+        """Translates the specified attribute or subscript chain, rooted at the lambda's argument, into a dotted field path"""
+        path_parts = list[str]()
+        while True:
+            if isinstance(expression, Attribute):
+                path_parts.append(expression.attr)
+                expression = expression.value
+            elif isinstance(expression, Subscript):
+                key = self._evaluate(expression.slice)
+                if not isinstance(key, (str, int)) or isinstance(key, bool) or (isinstance(key, int) and key < 0):
+                    raise NotImplementedError("Only non-negative integer and string subscripts can be translated into field paths")
+                path_parts.append(str(key))
+                expression = expression.value
+            elif isinstance(expression, Name) and expression.id == self._parameter and path_parts:
+                path_parts.reverse()
+                return ".".join(path_parts)
+            else:
+                raise NotImplementedError(f"The specified expression '{ast.unparse(expression)}' is not a field of the document")
+
+    def _evaluate(self, expression: expr) -> Any:
+        """Evaluates the specified constant expression"""
+        if isinstance(expression, Constant):
+            return expression.value
+        elif isinstance(expression, Attribute) and not self._is_field(expression):
+            # i.e. an enum member of a captured enum type
+            return getattr(self._evaluate(expression.value), expression.attr)
+        elif isinstance(expression, (ast.List, ast.Tuple, ast.Set)):
+            return [self._evaluate(element) for element in expression.elts]
+        elif isinstance(expression, UnaryOp) and isinstance(expression.op, USub):
+            return -self._evaluate(expression.operand)
+        raise NotImplementedError(f"The specified expression '{ast.unparse(expression)}' cannot be evaluated to a constant")
+
+    def _is_field(self, expression: expr) -> bool:
+        """Determines whether or not the specified expression refers to (a function of) the lambda's argument"""
+        return any(isinstance(node, Name) and node.id == self._parameter for node in ast.walk(expression))
+
+    def _get_field_type(self, field: str) -> Any:
+        """Gets the type of the specified field of the element type, if it can be determined"""
+        field_type: Any = self._element_type
+        for part in field.split("."):
+            if field_type is None or part.isdigit():
+                return None
+            try:
+                field_type = self._unwrap_optional(get_type_hints(field_type).get(part))
+            except Exception:
+                return None
+        return field_type
+
+    def _is_string_encoded_numeric(self, field: str) -> bool:
+        """Determines whether or not the specified field is known to hold numbers stored as strings"""
+        field_type = self._get_field_type(field)
+        return isinstance(field_type, type) and issubclass(field_type, self._string_encoded_numeric_types)
+
+    def _get_field_kind(self, field: str) -> Optional[str]:
+        """Gets the kind of the specified field of the element type, either 'array' or 'string', if it can be determined"""
+        field_type = self._get_field_type(field)
+        if field_type is str:
+            return "string"
+        if field_type in (list, set, tuple, frozenset) or get_origin(field_type) in (list, set, tuple, frozenset):
+            return "array"
+        return None
+
+    @staticmethod
+    def _unwrap_optional(field_type: Any) -> Any:
+        if get_origin(field_type) in (Union, UnionType):
+            arguments = [argument for argument in get_args(field_type) if argument is not type(None)]
+            return arguments[0] if len(arguments) == 1 else None
+        return field_type
@@ -4,13 +4,19 @@ from typing import TYPE_CHECKING, Optional
 
 from neuroglia.core import ModuleLoader, TypeFinder
 from neuroglia.data.abstractions import AggregateRoot
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    EventStore,
+    EventStoreOptions,
+    ProjectionCheckpointStore,
+)
 from neuroglia.data.infrastructure.event_sourcing.read_model_reconciliator import (
     ReadModelConciliationOptions,
     ReadModelReconciliator,
 )
 from neuroglia.data.queries.generic import GetByIdQueryHandler, ListQueryHandler
 from neuroglia.hosting.abstractions import ApplicationBuilderBase, HostedService
-from neuroglia.mediation.mediator import RequestHandler
+from neuroglia.dependency_injection.service_provider import ServiceProviderBase
+from neuroglia.mediation.mediator import Mediator, RequestHandler
 
 if TYPE_CHECKING:
     from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
@@ -248,6 +254,7 @@ class DataAccessLayer:
             database_name: Optional[str] = None,
             repository_type: str = "mongo",
             repository_mappings: Optional[dict[type, type]] = None,
+            reconciliation_options: Optional[ReadModelConciliationOptions] = None,
         ):
             """Initialize ReadModel configuration
 
@@ -261,6 +268,9 @@ class DataAccessLayer:
                                     to their concrete implementations. Allows single-line
                                     registration of custom domain repositories.
                     Example: {TaskDtoRepository: MotorTaskDtoRepository}
+                reconciliation_options: Optional options used to configure the ReadModelReconciliator.
+                                    Defaults to sequential processing for the consumer group of the application settings.
+                                    Catching up requires a ProjectionCheckpointStore to be registered.
 
             Example:
                 ```python
@@ -287,6 +297,7 @@ class DataAccessLayer:
             self._database_name = database_name
             self._repository_type = repository_type
             self._repository_mappings = repository_mappings or {}
+            self._reconciliation_options = reconciliation_options
 
             # Validate repository_type
             if repository_type not in ("mongo", "motor"):
@@ -333,11 +344,26 @@ class DataAccessLayer:
             Raises:
                 ValueError: If consumer_group not specified in settings
             """
-            consumer_group = builder.settings.consumer_group
-            if not consumer_group:
-                raise ValueError("Cannot configure Read Model DAL: consumer group not specified in application settings")
-            builder.services.add_singleton(ReadModelConciliationOptions, singleton=ReadModelConciliationOptions(consumer_group))
-            builder.services.add_singleton(HostedService, ReadModelReconciliator)
+            options = self._reconciliation_options
+            if options is None:
+                consumer_group = builder.settings.consumer_group
+                if not consumer_group:
+                    raise ValueError("Cannot configure Read Model DAL: consumer group not specified in application settings")
+                options = ReadModelConciliationOptions(consumer_group)
+            builder.services.add_singleton(ReadModelConciliationOptions, singleton=options)
+
+            def make_reconciliator(provider: ServiceProviderBase) -> ReadModelReconciliator:
+                # optional dependencies are not resolved by the service provider, hence the factory
+                return ReadModelReconciliator(
+                    provider,
+                    provider.get_required_service(Mediator),
+                    provider.get_required_service(EventStoreOptions),
+                    provider.get_required_service(EventStore),
+                    provider.get_required_service(ReadModelConciliationOptions),
+                    provider.get_service(ProjectionCheckpointStore),
+                )
+
+            builder.services.add_singleton(HostedService, implementation_factory=make_reconciliator)
 
         def _configure_with_custom_setup(
             self,
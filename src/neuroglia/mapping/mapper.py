@@ -1,6 +1,8 @@
+import asyncio
 import inspect
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
 from typing import TYPE_CHECKING, Any, Optional, get_type_hints
 
 from neuroglia.core import ModuleLoader, TypeFinder
@@ -136,6 +138,73 @@ class MemberMapConfiguration:
     """ Gets a callable, if any, used to convert the value of the member """
 
 
+class TypeMapPlan:
+    """Represents the compiled form of a TypeMapConfiguration, computed once and reused for every mapped instance"""
+
+    def __init__(self, configuration: "TypeMapConfiguration"):
+        declared_attributes = dict[str, None]()
+        for cls in configuration.destination_type.__mro__:
+            if hasattr(cls, "__annotations__"):
+                declared_attributes.update([(key, None) for key in cls.__annotations__.keys() if not key.startswith("_")])
+        self.declared_attributes = frozenset(declared_attributes)
+        self.member_configurations = list(configuration.member_configurations)
+        self.member_configurations_by_name: dict[str, MemberMapConfiguration] = {}
+        for member in self.member_configurations:
+            self.member_configurations_by_name.setdefault(member.name, member)
+        self.signature = (id(configuration.member_configurations), len(configuration.member_configurations))
+        self.compiled_map = None
+        if configuration.compiled:
+            try:
+                self.compiled_map = self._compile(configuration, list(declared_attributes))
+            except Exception as ex:
+                log.warning(f"Failed to compile the type map {configuration.source_type.__name__} -> {configuration.destination_type.__name__}, falling back to interpreted mapping: {ex}")
+
+    declared_attributes: frozenset[str]
+    """ Gets the public attributes declared by the destination type and its bases """
+
+    member_configurations: list[MemberMapConfiguration]
+    """ Gets the configured members, in declaration order """
+
+    member_configurations_by_name: dict[str, MemberMapConfiguration]
+    """ Gets the first configuration of each configured member, keyed by member name """
+
+    signature: tuple[int, int]
+    """ Gets the identity and length of the member configuration list the plan was compiled from """
+
+    compiled_map: Optional[Callable[[Any], Any]]
+    """ Gets the generated function, if any, that maps source instances with straight-line attribute copies """
+
+    def _compile(self, configuration: "TypeMapConfiguration", declared_attributes: list[str]) -> Callable[[Any], Any]:
+        """Generates a function that performs the same mapping as TypeMapConfiguration.map, unrolled for the configured types and members"""
+        namespace: dict[str, Any] = {
+            "_new": object.__new__,
+            "_context": MemberMappingContext,
+            "_source_type": configuration.source_type,
+            "_destination_type": configuration.destination_type,
+        }
+        lines = ["def map_compiled(source):", "    attributes = source.__dict__", "    destination_attributes = {}"]
+        for index, name in enumerate(declared_attributes):
+            member = self.member_configurations_by_name.get(name)
+            key = repr(name)
+            if member is None or (not member.is_ignored and member.value_converter is None):
+                lines.append(f"    if {key} in attributes:")
+                lines.append(f"        destination_attributes[{key}] = attributes[{key}]")
+            elif not member.is_ignored:
+                namespace[f"_convert_{index}"] = member.value_converter
+                lines.append(f"    if {key} in attributes:")
+                lines.append(f"        destination_attributes[{key}] = _convert_{index}(_context(source, _source_type, _destination_type, {key}, attributes[{key}]))")
+        for index, member in enumerate(self.member_configurations):
+            if member.is_ignored or member.value_converter is None:
+                continue
+            key = repr(member.name)
+            namespace[f"_convert_missing_{index}"] = member.value_converter
+            lines.append(f"    if {key} not in attributes:")
+            lines.append(f"        destination_attributes[{key}] = _convert_missing_{index}(_context(source, _source_type, _destination_type, {key}, getattr(source, {key}, None)))")
+        lines.extend(["    destination = _new(_destination_type)", "    destination.__dict__ = destination_attributes", "    return destination"])
+        exec("\n".join(lines), namespace)
+        return namespace["map_compiled"]
+
+
 class TypeMapConfiguration:
     """Represents an object used to configure the mapping of a type to another"""
 
@@ -149,6 +218,8 @@ class TypeMapConfiguration:
         self.destination_type = destination_type
         self.type_converter = type_converter
         self.member_configurations: list[MemberMapConfiguration] = []
+        self.compiled = False
+        self._plan: Optional[TypeMapPlan] = None
 
     source_type: type
     """ Gets the type to convert to the specified type """
@@ -159,27 +230,37 @@ class TypeMapConfiguration:
     type_converter: Optional[Callable[[TypeMappingContext], Any]]
     """ Gets the callable, if any, used to convert source instances to the configured destination type """
 
+    compiled: bool
+    """ Gets/sets a boolean indicating whether or not instances are mapped using a generated function rather than interpreting the configuration """
+
+    def get_plan(self) -> TypeMapPlan:
+        """Gets the compiled plan of the type map, compiling it again only if members have been configured since"""
+        plan = getattr(self, "_plan", None)
+        if plan is None or plan.signature != (id(self.member_configurations), len(self.member_configurations)):
+            plan = TypeMapPlan(self)
+            self._plan = plan
+        return plan
+
+    def invalidate_plan(self) -> None:
+        """Discards the compiled plan, which is compiled again on next use"""
+        self._plan = None
+
     def map(self, source: Any):
         """Maps the specified value to the configured destination type"""
-        mapping_context = TypeMappingContext(source, self.source_type, self.destination_type)
         if self.type_converter is not None:
-            return self.type_converter(mapping_context)
+            return self.type_converter(TypeMappingContext(source, self.source_type, self.destination_type))
+        plan = self.get_plan()
+        if plan.compiled_map is not None and hasattr(source, "__dict__"):
+            return plan.compiled_map(source)
         source_attributes = dict([(key, value) for key, value in source.__dict__.items() if not key.startswith("_")]) if hasattr(source, "__dict__") else dict()
         destination_attributes = dict()
-        # Get all declared attributes including inherited ones
-        declared_attributes = []
-        for cls in self.destination_type.__mro__:
-            if hasattr(cls, "__annotations__"):
-                declared_attributes.extend([key for key, _ in cls.__annotations__.items() if not key.startswith("_")])
-        declared_attributes = list(set(declared_attributes))  # Remove duplicates
+        declared_attributes = plan.declared_attributes
+        member_configurations = plan.member_configurations_by_name
 
         for source_attribute_key, source_attribute_value in source_attributes.items():
             if source_attribute_key not in declared_attributes:
                 continue
-            member_map = next(
-                (member for member in self.member_configurations if member.name == source_attribute_key),
-                None,
-            )
+            member_map = member_configurations.get(source_attribute_key)
             if member_map is None:
                 destination_attributes[source_attribute_key] = source_attribute_value
             elif member_map.is_ignored:
@@ -197,8 +278,8 @@ class TypeMapConfiguration:
                     )
                 else:
                     destination_attributes[source_attribute_key] = source_attribute_value
-        for configured_attribute in [attr for attr in self.member_configurations if attr.name not in source_attributes.keys()]:
-            if configured_attribute.is_ignored or configured_attribute.value_converter is None:
+        for configured_attribute in plan.member_configurations:
+            if configured_attribute.name in source_attributes or configured_attribute.is_ignored or configured_attribute.value_converter is None:
                 continue
             # Safely get source value, ensuring we have a valid value to work with
             source_value = getattr(source, configured_attribute.name, None)
@@ -230,6 +311,15 @@ class TypeMapExpression:
         """Maps values using the specified converter function"""
         self._configuration.type_converter = converter
 
+    def compile(self) -> "TypeMapExpression":
+        """
+        Configures the map to use a function generated for the source and destination types, with straight-line attribute copies and
+        inlined member converters. Intended for hot type maps: sources without a __dict__ and maps using a type converter keep the interpreted path
+        """
+        self._configuration.compiled = True
+        self._configuration.invalidate_plan()
+        return self
+
     def ignore_member(self, name: str) -> "TypeMapExpression":
         """Configures the map to ignore the specified member of the source type"""
         configuration = next(
@@ -240,6 +330,7 @@ class TypeMapExpression:
             self._configuration.member_configurations.append(MemberMapConfiguration(name, True))
         else:
             configuration.is_ignored = True
+            self._configuration.invalidate_plan()
         return self
 
     def for_member(self, name: str, converter: Callable[[MemberMappingContext], Any]):
@@ -252,6 +343,7 @@ class TypeMapExpression:
             self._configuration.member_configurations.append(MemberMapConfiguration(name, value_converter=converter))
         else:
             configuration.value_converter = converter
+            self._configuration.invalidate_plan()
         return self
 
 
@@ -296,6 +388,8 @@ class MappingProfile:
             # Copy over any member configurations from the temp expression
             if hasattr(expression, "_configuration") and hasattr(actual_expression, "_configuration"):
                 actual_expression._configuration.member_configurations.extend(expression._configuration.member_configurations)
+                if expression._configuration.compiled:
+                    actual_expression.compile()
 
         self._configuration_actions.append(configure_map)
         return expression
@@ -312,10 +406,55 @@ class Mapper:
 
     def __init__(self, options: MapperConfiguration):
         self.options = options
+        self._type_maps: dict[tuple[type, type], TypeMapConfiguration] = {}
+        self._type_maps_by_source_type: dict[type, list[TypeMapConfiguration]] = {}
+        self._type_maps_signature: Optional[tuple[int, int]] = None
+        self._nested_destination_types: dict[tuple[type, Any], Optional[type]] = {}
+        self._type_hints: dict[type, dict[str, Any]] = {}
 
     options: MapperConfiguration
     """ Gets the options used to configure the mapper """
 
+    def _ensure_type_maps_indexed(self) -> None:
+        """Indexes the configured type maps by (source, destination) and by source type, re-indexing only when type maps have been added since"""
+        type_maps = self.options.type_maps
+        signature = (id(type_maps), len(type_maps))
+        if signature == self._type_maps_signature:
+            return
+        indexed_type_maps: dict[tuple[type, type], TypeMapConfiguration] = {}
+        type_maps_by_source_type: dict[type, list[TypeMapConfiguration]] = {}
+        for type_map in type_maps:
+            indexed_type_maps.setdefault((type_map.source_type, type_map.destination_type), type_map)
+            type_maps_by_source_type.setdefault(type_map.source_type, []).append(type_map)
+        # assign complete indexes only, so that batches mapped on worker threads never observe a partial index
+        self._type_maps = indexed_type_maps
+        self._type_maps_by_source_type = type_maps_by_source_type
+        self._nested_destination_types = {}
+        self._type_maps_signature = signature
+
+    def get_type_map(self, source_type: type, destination_type: type) -> Optional[TypeMapConfiguration]:
+        """Gets the type map, if any, configured to map the specified source type to the specified destination type"""
+        self._ensure_type_maps_indexed()
+        return self._type_maps.get((source_type, destination_type))
+
+    def _get_nested_destination_type(self, source_type: type, expected_type: Any) -> Optional[type]:
+        """Gets the destination type of the first type map that maps the specified source type to the expected type or one of its subclasses"""
+        self._ensure_type_maps_indexed()
+        key = (source_type, expected_type)
+        if key in self._nested_destination_types:
+            return self._nested_destination_types[key]
+        destination_type = next((tm.destination_type for tm in self._type_maps_by_source_type.get(source_type, []) if issubclass(tm.destination_type, expected_type)), None)
+        self._nested_destination_types[key] = destination_type
+        return destination_type
+
+    def _get_type_hints(self, destination_type: type) -> dict[str, Any]:
+        """Gets the resolved type hints of the specified destination type, resolving them once per type"""
+        type_hints = self._type_hints.get(destination_type)
+        if type_hints is None:
+            type_hints = get_type_hints(destination_type) if hasattr(destination_type, "__annotations__") else {}
+            self._type_hints[destination_type] = type_hints
+        return type_hints
+
     def map(self, source: Any, destination_type: type) -> Any:
         """
         Maps the specified value into a new instance of the destination type,
@@ -333,7 +472,7 @@ class Mapper:
             return None
 
         # If source is already the correct type, return it
-        if isinstance(source, destination_type):
+        if get_origin_safe(destination_type) is None and isinstance(source, destination_type):
             return source
 
         # Get the source type
@@ -373,10 +512,7 @@ class Mapper:
             return source
 
         # Find a type map for direct mapping
-        type_map = next(
-            (tm for tm in self.options.type_maps if tm.source_type == source_type and tm.destination_type == destination_type),
-            None,
-        )
+        type_map = self.get_type_map(source_type, destination_type)
 
         if type_map is None:
             raise Exception(f"Missing type map configuration or unsupported mapping. " f"Mapping types: {source_type.__name__} -> {destination_type.__name__}")
@@ -386,11 +522,79 @@ class Mapper:
 
         # After basic mapping, check for nested objects that need mapping
         if hasattr(destination, "__dict__"):
-            destination_annotations = get_type_hints(destination_type) if hasattr(destination_type, "__annotations__") else {}
-            self._map_nested_attributes(destination, destination_annotations)
+            self._map_nested_attributes(destination, self._get_type_hints(destination_type))
 
         return destination
 
+    def map_many(self, items: Iterable[Any], destination_type: type) -> list[Any]:
+        """
+        Maps the specified items into new instances of the destination type.
+
+        Unlike mapping each item with map(), the type map and the destination type hints are resolved once per
+        source type rather than once per item. Items that are not mapped through a type map (None, primitives,
+        collections, instances of the destination type) are mapped like map() would.
+
+        Args:
+            items: The items to map
+            destination_type: The type to map the items to
+
+        Returns:
+            A list containing the mapped items, in the order of the specified items
+        """
+        type_hints = self._get_type_hints(destination_type) if get_origin_safe(destination_type) is None else {}
+        type_maps: dict[type, Optional[TypeMapConfiguration]] = {}
+        mapped_items = []
+        for item in items:
+            source_type = type(item)
+            if source_type in type_maps:
+                type_map = type_maps[source_type]
+            else:
+                type_map = type_maps[source_type] = self._get_batch_type_map(source_type, destination_type)
+            if type_map is None:
+                mapped_items.append(self.map(item, destination_type))
+                continue
+            destination = type_map.map(item)
+            if type_hints and hasattr(destination, "__dict__"):
+                self._map_nested_attributes(destination, type_hints)
+            mapped_items.append(destination)
+        return mapped_items
+
+    async def map_many_async(self, items: Iterable[Any], destination_type: type, chunk_size: int = 1000, executor: Optional[Executor] = None) -> list[Any]:
+        """
+        Maps the specified items into new instances of the destination type, offloading large batches to a thread pool.
+
+        Batches no larger than the chunk size are mapped inline. Larger batches are split into chunks mapped on the
+        specified executor, or on the event loop's default executor, so that the event loop is not blocked while
+        mapping them.
+
+        Args:
+            items: The items to map
+            destination_type: The type to map the items to
+            chunk_size: The maximum number of items to map inline, and the number of items mapped per chunk
+            executor: The executor, if any, used to map chunks. Defaults to the event loop's default executor
+
+        Returns:
+            A list containing the mapped items, in the order of the specified items
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be greater than 0")
+        items = items if isinstance(items, list) else list(items)
+        if len(items) <= chunk_size:
+            return self.map_many(items, destination_type)
+        self._ensure_type_maps_indexed()
+        loop = asyncio.get_running_loop()
+        chunks = [items[index : index + chunk_size] for index in range(0, len(items), chunk_size)]
+        mapped_chunks = await asyncio.gather(*(loop.run_in_executor(executor, self.map_many, chunk, destination_type) for chunk in chunks))
+        return [mapped_item for mapped_chunk in mapped_chunks for mapped_item in mapped_chunk]
+
+    def _get_batch_type_map(self, source_type: type, destination_type: type) -> Optional[TypeMapConfiguration]:
+        """Gets the type map used to map items of the specified source type in a batch, or None if they must be mapped by map()"""
+        if issubclass(source_type, (type(None), list, tuple, set, dict, int, float, str, bool)):
+            return None
+        if get_origin_safe(destination_type) is not None or issubclass(source_type, destination_type):
+            return None
+        return self.get_type_map(source_type, destination_type)
+
     def _map_nested_attributes(self, obj: Any, type_annotations: dict[str, type]) -> None:
         """
         Maps nested attributes of an object based on type annotations.
@@ -429,12 +633,11 @@ class Mapper:
         source_type = type(attr_value)
 
         # Try to find a mapping for this nested object
-        for type_map in self.options.type_maps:
-            if type_map.source_type == source_type and issubclass(type_map.destination_type, expected_type):
-                # Map the nested object and update it
-                mapped_value = self.map(attr_value, type_map.destination_type)
-                setattr(obj, attr_name, mapped_value)
-                break
+        destination_type = self._get_nested_destination_type(source_type, expected_type)
+        if destination_type is not None:
+            # Map the nested object and update it
+            mapped_value = self.map(attr_value, destination_type)
+            setattr(obj, attr_name, mapped_value)
 
     def _map_collection(self, obj: Any, attr_name: str, collection: Any, expected_type: type) -> None:
         """Maps items in a collection attribute."""
@@ -451,12 +654,9 @@ class Mapper:
         mapped_items = []
         for item in collection:
             # Try to find a mapping for each item
-            item_source_type = type(item)
-            for type_map in self.options.type_maps:
-                if type_map.source_type == item_source_type and issubclass(type_map.destination_type, item_type):
-                    mapped_item = self.map(item, type_map.destination_type)
-                    mapped_items.append(mapped_item)
-                    break
+            destination_type = self._get_nested_destination_type(type(item), item_type)
+            if destination_type is not None:
+                mapped_items.append(self.map(item, destination_type))
             else:
                 # No mapping found, keep original
                 mapped_items.append(item)
@@ -488,12 +688,9 @@ class Mapper:
             mapped_key = k  # Usually keys are simple types
 
             # Try to find a mapping for the value
-            v_type = type(v)
-            for type_map in self.options.type_maps:
-                if type_map.source_type == v_type and issubclass(type_map.destination_type, value_type):
-                    mapped_value = self.map(v, type_map.destination_type)
-                    mapped_dict[mapped_key] = mapped_value
-                    break
+            destination_type = self._get_nested_destination_type(type(v), value_type)
+            if destination_type is not None:
+                mapped_dict[mapped_key] = self.map(v, destination_type)
             else:
                 # No mapping found, keep original
                 mapped_dict[mapped_key] = v
@@ -830,6 +830,16 @@ class NotificationHandler(Generic[TNotification], ABC):
         """Handles the specified notification"""
         raise NotImplementedError()
 
+    async def handle_batch_async(self, notifications: list[TNotification]) -> None:
+        """
+        Handles the specified batch of notifications, in order.
+
+        Invoked when notifications are published in batches, for example by a ReadModelReconciliator configured with a batch size.
+        Defaults to handling each notification in turn. Override it to process the whole batch at once, for example with a single bulk write.
+        """
+        for notification in notifications:
+            await self.handle_async(notification)
+
 
 TDomainEvent = TypeVar("TDomainEvent", bound=DomainEvent)
 """ Represents the type of domain event to handle """
@@ -1111,6 +1121,99 @@ class Mediator:
             await self._execute_notification_pipeline(notification, invoke_handlers, behaviors)
         # Scope automatically disposed here, including all scoped services
 
+    async def publish_batch_async(self, notifications: list[object]):
+        """
+        Publishes the specified batch of notifications to all registered handlers.
+
+        Handlers are resolved once, from a single scope, and each of them is passed the notifications it handles
+        in one call to its handle_batch_async method, in the order they have been published. Handlers are executed
+        concurrently, and the scope is disposed after all of them completed.
+
+        Pipeline behaviors still wrap the handling of each notification: the pipelines of all notifications are run
+        up to the point where they invoke their handlers, which are then invoked once for the whole batch.
+
+        Args:
+            notifications: The notifications to publish to handlers
+
+        Examples:
+            ```python
+            class OrderReadModelHandler(DomainEventHandler[OrderPlacedDomainEvent]):
+                async def handle_async(self, e: OrderPlacedDomainEvent):
+                    await self.orders.replace_one({"id": e.aggregate_id}, self._map(e), upsert=True)
+
+                async def handle_batch_async(self, events: list[OrderPlacedDomainEvent]):
+                    await self.orders.bulk_write([ReplaceOne({"id": e.aggregate_id}, self._map(e), upsert=True) for e in events])
+
+            await mediator.publish_batch_async(events)
+            ```
+        """
+        if not notifications:
+            return
+        async with self._service_provider.create_async_scope() as scope:
+            scoped_provider = scope.get_service_provider()
+            candidates: list[NotificationHandler] = scoped_provider.get_services(NotificationHandler)
+            handlers_per_type: dict[type, list[NotificationHandler]] = {}
+            for notification_type in dict.fromkeys(type(notification) for notification in notifications):
+                handlers_per_type[notification_type] = [candidate for candidate in candidates if self._notification_handler_matches(candidate, notification_type)]
+
+            async def invoke_handlers(batch: list[object]) -> None:
+                batches: dict[int, tuple[NotificationHandler, list[object]]] = {}
+                for notification in batch:
+                    for handler in handlers_per_type[type(notification)]:
+                        batches.setdefault(id(handler), (handler, []))[1].append(notification)
+                if batches:
+                    await asyncio.gather(*(handler.handle_batch_async(handled) for handler, handled in batches.values()))
+
+            # behaviors are resolved once for the whole batch, then matched against each notification
+            batch_behaviors = self._get_pipeline_behaviors(notifications[0], scoped_provider)
+            behaviors = [[behavior for behavior in batch_behaviors if self._pipeline_behavior_matches(behavior, notification)] for notification in notifications]
+            if not any(behaviors):
+                await invoke_handlers(notifications)
+                return
+            await self._execute_batch_notification_pipelines(notifications, invoke_handlers, behaviors)
+
+    async def _execute_batch_notification_pipelines(self, notifications: list[object], handler_callable: Callable[[list[object]], Awaitable[None]], behaviors: list[list[PipelineBehavior]]) -> None:
+        """Executes the pipeline behaviors of each of the specified notifications around a single invocation of the handlers of the batch"""
+        handled: asyncio.Future = asyncio.get_running_loop().create_future()
+        settled = asyncio.Event()
+        reached: list[int] = []
+        pending = len(notifications)
+
+        def settle() -> None:
+            nonlocal pending
+            pending -= 1
+            if pending == 0:
+                settled.set()
+
+        async def execute_pipeline(index: int) -> None:
+            reached_handlers = False
+
+            async def wait_for_batch() -> None:
+                nonlocal reached_handlers
+                reached_handlers = True
+                reached.append(index)
+                settle()
+                await handled
+
+            try:
+                await self._execute_notification_pipeline(notifications[index], wait_for_batch, behaviors[index])
+            finally:
+                # pipelines short-circuited by a behavior, or that failed before invoking handlers, must not hold the batch back
+                if not reached_handlers:
+                    settle()
+
+        pipelines = [asyncio.ensure_future(execute_pipeline(index)) for index in range(len(notifications))]
+        await settled.wait()
+        try:
+            await handler_callable([notifications[index] for index in sorted(reached)])
+            handled.set_result(None)
+        except Exception as ex:
+            handled.set_exception(ex)
+        results = await asyncio.gather(*pipelines, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     def _handler_type_matches(self, handler_class, request_type) -> bool:
         """Check if a handler class can handle the specified request type"""
         try:
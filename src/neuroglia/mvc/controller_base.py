@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from classy_fastapi import Routable
-from fastapi import Response
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRoute
 
 from neuroglia.core.operation_result import OperationResult
@@ -57,6 +59,40 @@ def generate_unique_id_function(route: APIRoute) -> str | APIRoute:
         return f"{name}"
 
 
+class _StreamFraming:
+    """Represents the framing of streamed items, encoded as a JSON array or as newline-delimited JSON and flushed in batches"""
+
+    def __init__(self, serializer: "JsonSerializer", batch_size: int, ndjson: bool):
+        self._serializer = serializer
+        self._batch_size = batch_size
+        self._ndjson = ndjson
+        self._separator = "\n" if ndjson else ","
+        self._batch = list[str]()
+        self._empty = True
+
+    def open(self) -> str:
+        """Gets the chunk that opens the stream"""
+        return "" if self._ndjson else "["
+
+    def add(self, item: Any) -> Optional[str]:
+        """Encodes the specified item, returning the chunk to flush if the current batch is full"""
+        self._batch.append(self._serializer.serialize_to_text(item))
+        return self._flush() if len(self._batch) >= self._batch_size else None
+
+    def close(self) -> str:
+        """Gets the chunk that closes the stream, made of the items that have not been flushed yet"""
+        chunk = self._flush() if self._batch else ""
+        if self._ndjson:
+            return chunk if self._empty else chunk + "\n"
+        return chunk + "]"
+
+    def _flush(self) -> str:
+        chunk = ("" if self._empty else self._separator) + self._separator.join(self._batch)
+        self._batch.clear()
+        self._empty = False
+        return chunk
+
+
 class ControllerBase(Routable):
     """
     Represents the abstraction for all API controllers in the MVC pattern implementation.
@@ -175,18 +211,26 @@ class ControllerBase(Routable):
 
     json_serializer: "JsonSerializer"
 
+    streaming_batch_size: int = 100
+    """ Gets/sets the number of items encoded per chunk when streaming iterable results """
+
     name: str
     """ Gets/sets the name of the controller, which is used to configure the controller's router. Defaults to the lowercased name of the implementing controller class, excluding the term 'Controller' """
 
-    def process(self, result: OperationResult):
+    def process(self, result: OperationResult, request: Optional[Request] = None):
         """
         Processes an OperationResult into a proper HTTP response with status codes and serialization.
 
         This method handles the conversion from CQRS operation results to HTTP responses,
         including proper status code mapping, content serialization, and media type setting.
 
+        Successful results whose data is an iterator or an async iterator (e.g. a generator or a
+        database cursor) are streamed: items are encoded and flushed in batches, as a JSON array or,
+        when the request accepts 'application/x-ndjson', as newline-delimited JSON.
+
         Args:
             result (OperationResult): The operation result from a command or query handler
+            request (Optional[Request]): The current request, used to negotiate the streaming format
 
         Returns:
             Response: FastAPI Response object with appropriate status code and content
@@ -201,8 +245,17 @@ class ControllerBase(Routable):
 
             # For success (200): Returns result.data as JSON
             # For errors (4xx/5xx): Returns full OperationResult as JSON
+
+            @get("/")
+            async def list_items(self, request: Request):
+                result = await self.mediator.execute_async(StreamItemsQuery())
+                return self.process(result, request)  # Streams result.data if it is an iterator
             ```
         """
+        if result.status >= 200 and result.status < 300:
+            ndjson = request is not None and "application/x-ndjson" in request.headers.get("accept", "")
+            if self._is_streamable(result.data) or (ndjson and isinstance(result.data, (list, tuple))):
+                return self._stream(result, ndjson)
         content = result.data if result.status >= 200 and result.status < 300 else result
         media_type = "application/json"
         if content is not None:
@@ -210,6 +263,39 @@ class ControllerBase(Routable):
             media_type = "application/json"
         return Response(status_code=result.status, content=content, media_type=media_type)
 
+    def _is_streamable(self, data: Any) -> bool:
+        """Determines whether the specified data is produced lazily, and should therefore be streamed"""
+        return isinstance(data, (Iterator, AsyncIterable)) and not isinstance(data, (str, bytes, dict))
+
+    def _stream(self, result: OperationResult, ndjson: bool) -> StreamingResponse:
+        """Streams the items of the specified result's data, encoded as a JSON array or as newline-delimited JSON"""
+        if isinstance(result.data, AsyncIterable):
+            content = self._encode_items_async(result.data, ndjson)
+        else:
+            content = self._encode_items(result.data, ndjson)
+        media_type = "application/x-ndjson" if ndjson else "application/json"
+        return StreamingResponse(content, status_code=result.status, media_type=media_type)
+
+    def _encode_items(self, items: Iterable[Any], ndjson: bool) -> Iterator[str]:
+        """Encodes the specified items in batches. Synchronous sources are iterated in a thread pool by the StreamingResponse"""
+        framing = _StreamFraming(self.json_serializer, self.streaming_batch_size, ndjson)
+        yield framing.open()
+        for item in items:
+            chunk = framing.add(item)
+            if chunk is not None:
+                yield chunk
+        yield framing.close()
+
+    async def _encode_items_async(self, items: AsyncIterable[Any], ndjson: bool) -> AsyncIterator[str]:
+        """Encodes the specified asynchronously produced items in batches"""
+        framing = _StreamFraming(self.json_serializer, self.streaming_batch_size, ndjson)
+        yield framing.open()
+        async for item in items:
+            chunk = framing.add(item)
+            if chunk is not None:
+                yield chunk
+        yield framing.close()
+
     error_responses: Dict[int | str, Dict[str, Any]] | None = {
         400: {"model": ProblemDetails, "description": "Bad Request"},
         404: {"model": ProblemDetails, "description": "Not Found"},
@@ -10,6 +10,7 @@ Key Components:
     - TextSerializer: Base abstraction for text-based serialization
     - JsonEncoder: Enhanced JSON encoder for complex Python types
     - JsonSerializer: Full-featured JSON serialization service
+    - MessagePackSerializer: Compact binary serialization sharing the JsonSerializer's type plan
 
 Features:
     - Automatic type conversion (enums, datetime, decimals, custom objects)
@@ -18,6 +19,7 @@ Features:
     - Dataclass and custom object handling
     - Type registry integration for enum discovery
     - Comprehensive error handling and fallback strategies
+    - Strict schema mode with inference counters to find types that need annotations
 
 Examples:
     ```python
@@ -45,11 +47,14 @@ See Also:
 """
 
 from .abstractions import Serializer, TextSerializer
-from .json import JsonEncoder, JsonSerializer
+from .json import JsonEncoder, JsonSerializer, strict_schema
+from .message_pack import MessagePackSerializer
 
 __all__ = [
     "Serializer",
     "TextSerializer",
     "JsonEncoder",
     "JsonSerializer",
+    "strict_schema",
+    "MessagePackSerializer",
 ]
@@ -404,7 +404,6 @@ class AggregateSerializer(JsonSerializer):
             Nested aggregates violate DDD aggregate boundaries.
         """
         # Deserialize the state using base JSON deserialization
-        state_json = json.dumps(state_data)
-        state_instance = super().deserialize_from_text(state_json, state_type)
+        state_instance = super().deserialize_from_value(state_data, state_type)
 
         return state_instance
@@ -12,6 +12,7 @@ Key Features:
     - Type registry integration for intelligent enum discovery
     - Dataclass and generic type support (List[T], Dict[K,V], Optional[T])
     - Comprehensive error handling and fallback strategies
+    - Strict schema mode that disables heuristic inference for fully-annotated types
     - Application builder integration for easy setup
 
 Examples:
@@ -38,8 +39,10 @@ See Also:
 """
 
 import json
+import re
 import types
 import typing
+from collections import Counter
 from dataclasses import MISSING, fields, is_dataclass
 from datetime import datetime
 from enum import Enum
@@ -60,6 +63,31 @@ if TYPE_CHECKING:
     from neuroglia.hosting.abstractions import ApplicationBuilderBase
 
 
+_DECIMAL_PATTERN = re.compile(r"^-?\d+\.?\d*(?:[eE][+-]?\d+)?$")
+""" Matches plain and scientific decimal notations, such as '-12.50' or '1.5e-10' """
+
+
+def strict_schema(cls):
+    """
+    Represents a decorator used to mark a type as fully annotated, disabling heuristic type inference during deserialization.
+
+    Fields of a strict type that have no type annotation are kept as plain JSON values instead of being sniffed
+    for datetimes, decimals or enums.
+
+    Examples:
+        ```python
+        @strict_schema
+        @dataclass
+        class OrderDto:
+            id: str
+            status: OrderStatus
+            total: Decimal
+        ```
+    """
+    cls.__strict_schema__ = True
+    return cls
+
+
 class JsonEncoder(json.JSONEncoder):
     """
     Enhanced JSON encoder that provides automatic conversion for complex Python types.
@@ -212,6 +240,18 @@ class JsonSerializer(TextSerializer):
         # status automatically matched to UserStatus.ACTIVE enum
         ```
 
+    Strict Schema:
+        Inference can be disabled globally (``JsonSerializer(strict_schema=True)``) or per type
+        (``@strict_schema``). Unannotated fields of strict types are then kept as plain JSON values.
+        Inference hits are counted per type and field, which helps finding types that need annotations.
+        At most ``max_inference_statistics`` fields are tracked, hits on further fields being counted under ``<other>``:
+
+        ```python
+        serializer.deserialize_from_text(data, Product)
+        serializer.get_inference_statistics()
+        # {"myapp.models.Product.price": 1}
+        ```
+
     Forward Reference Resolution:
         Automatically resolves postponed annotations and forward references when
         reconstructing objects:
@@ -239,6 +279,22 @@ class JsonSerializer(TextSerializer):
         - API Response Handling: https://bvandewe.github.io/pyneuro/features/mvc-controllers/
     """
 
+    def __init__(self, strict_schema: bool = False):
+        """
+        Initializes a new JsonSerializer.
+
+        Args:
+            strict_schema: A boolean indicating whether heuristic type inference is disabled for all types
+        """
+        self._strict_schema = bool(strict_schema)
+        self._inference_counts: Counter[str] = Counter()
+
+    max_inference_statistics: int = 1000
+    """ Gets/sets the maximum number of fields whose inference hits are tracked. Hits on further fields, i.e. the keys of dictionary-shaped payloads, are counted under '<other>' """
+
+    _inference_overflow_key = "<other>"
+    """ Gets the key under which the inference hits on untracked fields are counted """
+
     def _is_aggregate_root(self, obj: Any) -> bool:
         """
         Check if an object is an AggregateRoot instance.
@@ -372,8 +428,23 @@ class JsonSerializer(TextSerializer):
             assert order.domain_events == []
             ```
         """
-        value = json.loads(input)
+        return self.deserialize_from_value(json.loads(input), expected_type)
+
+    def deserialize_from_value(self, value: Any, expected_type: Optional[type] = None) -> Any:
+        """
+        Deserialize an already decoded JSON value (dict, list or primitive) using the serializer's type handling.
+
+        This is the type-directed half of deserialize_from_text. It lets other codecs producing the same
+        JSON-compatible structures (e.g. MessagePack) reuse the enum, datetime, Decimal and dataclass handling
+        without round-tripping through JSON text.
 
+        Args:
+            value: The decoded value to deserialize
+            expected_type: Expected type for deserialization
+
+        Returns:
+            Deserialized object (Entity, AggregateRoot, or plain object)
+        """
         # If no expected type, return the raw parsed value
         if expected_type is None:
             return value
@@ -384,7 +455,6 @@ class JsonSerializer(TextSerializer):
         if isinstance(value, dict) and "aggregate_type" in value and "state" in value:
             # Handle old format for backward compatibility during transition
             value = value["state"]
-            input = json.dumps(value)
 
         # Check if expected_type is an AggregateRoot class
         if self._is_aggregate_root_type(expected_type):
@@ -431,8 +501,7 @@ class JsonSerializer(TextSerializer):
             return aggregate
 
         # Deserialize the state data to a state instance
-        state_json = json.dumps(data)
-        state_instance = self.deserialize_from_text(state_json, state_type)
+        state_instance = self.deserialize_from_value(data, state_type)
 
         # Create the aggregate instance without calling __init__
         aggregate.state = state_instance
@@ -465,6 +534,7 @@ class JsonSerializer(TextSerializer):
                 type_hints.update(resolved or annotations)
 
         # Deserialize each field using its type annotation
+        strict = self._is_strict_schema(expected_type)
         for key, value in data.items():
             if key in type_hints:
                 field_type = type_hints[key]
@@ -472,8 +542,12 @@ class JsonSerializer(TextSerializer):
                     fields[key] = value
                 else:
                     fields[key] = self._deserialize_nested(value, field_type)
+            elif strict:
+                # Strict types are fully annotated: keep undeclared fields as plain JSON values
+                fields[key] = value
             else:
                 # For fields without type annotations, try intelligent type inference
+                self._count_inference(f"{expected_type.__module__}.{expected_type.__qualname__}.{key}")
                 fields[key] = self._infer_and_deserialize(key, value, expected_type)
 
         # Populate missing optional fields with None to maintain backwards compatibility
@@ -531,7 +605,7 @@ class JsonSerializer(TextSerializer):
         return value
 
     # Monetary field patterns for decimal detection
-    _MONETARY_PATTERNS: tuple[str, ...] = ("price", "cost", "amount", "total", "fee", "balance", "rate", "tax")
+    _MONETARY_PATTERNS: frozenset[str] = frozenset(("price", "cost", "amount", "total", "fee", "balance", "rate", "tax"))
 
     def _is_monetary_field(self, field_name: str) -> bool:
         """
@@ -539,22 +613,17 @@ class JsonSerializer(TextSerializer):
         Only matches when the field name ENDS with a monetary pattern to avoid
         false positives from nested paths like 'input_schema_properties_price_type'.
         """
-        field_name_lower = field_name.lower()
-        # Split by underscore and check if the last part is a monetary pattern
-        parts = field_name_lower.split("_")
-        last_part = parts[-1] if parts else ""
-        return last_part in self._MONETARY_PATTERNS
+        # Check if the last underscore-separated part is a monetary pattern
+        return field_name.lower().rpartition("_")[2] in self._MONETARY_PATTERNS
 
     def _looks_like_decimal(self, value: str) -> bool:
         """
         Check if a string value looks like a valid decimal number.
         This prevents attempting Decimal conversion on arbitrary strings.
         """
-        import re
-
         # Match optional negative sign, digits, optional decimal point with more digits
         # Also match scientific notation like "1.5e-10"
-        return bool(re.match(r"^-?\d+\.?\d*(?:[eE][+-]?\d+)?$", value.strip()))
+        return _DECIMAL_PATTERN.match(value.strip()) is not None
 
     def _is_datetime_string(self, value: str) -> bool:
         """
@@ -864,6 +933,32 @@ class JsonSerializer(TextSerializer):
             # Return the value as is for types that do not require deserialization
             return value
 
+    def _is_strict_schema(self, cls: type) -> bool:
+        """Determines whether heuristic type inference is disabled for the specified type"""
+        return self._strict_schema or getattr(cls, "__strict_schema__", False)
+
+    def get_inference_statistics(self) -> dict[str, int]:
+        """
+        Gets the number of times heuristic type inference was used, keyed by the fully qualified name of the inferred field.
+
+        Fields that show up here have no type annotation: annotating them, or marking their type with @strict_schema,
+        removes the per-field inference cost.
+
+        Returns:
+            A dictionary mapping '<module>.<type>.<field>' to the number of inference hits, most frequent first, including the hits on untracked fields under '<other>'
+        """
+        return dict(self._inference_counts.most_common())
+
+    def _count_inference(self, field_name: str) -> None:
+        """Counts an inference hit on the specified field, or under the overflow key once the maximum number of tracked fields is reached"""
+        if field_name not in self._inference_counts and len(self._inference_counts) >= self.max_inference_statistics:
+            field_name = self._inference_overflow_key
+        self._inference_counts[field_name] += 1
+
+    def reset_inference_statistics(self) -> None:
+        """Resets the inference counters"""
+        self._inference_counts.clear()
+
     def _is_optional_type(self, annotation: Any) -> bool:
         """Check if the provided annotation represents an Optional type."""
         origin = get_origin(annotation)
@@ -894,7 +989,7 @@ class JsonSerializer(TextSerializer):
         return False
 
     @staticmethod
-    def configure(builder: "ApplicationBuilderBase", modules: Optional[list[str]] = None) -> "ApplicationBuilderBase":
+    def configure(builder: "ApplicationBuilderBase", modules: Optional[list[str]] = None, strict_schema: bool = False) -> "ApplicationBuilderBase":
         """
         Configures the specified application builder to use the JsonSerializer.
 
@@ -902,8 +997,9 @@ class JsonSerializer(TextSerializer):
             builder: The application builder to configure
             type_modules: Optional list of module names to scan for types (enums, etc.)
                          For example: ["domain.entities", "domain.models", "shared.enums"]
+            strict_schema: A boolean indicating whether heuristic type inference should be disabled for all types
         """
-        builder.services.add_singleton(JsonSerializer)
+        builder.services.add_singleton(JsonSerializer, singleton=JsonSerializer(strict_schema=strict_schema))
         builder.services.add_singleton(
             Serializer,
             implementation_factory=lambda provider: provider.get_required_service(JsonSerializer),
@@ -0,0 +1,90 @@
+"""
+Compact binary serialization based on MessagePack.
+
+This module provides a binary counterpart to the JsonSerializer, sharing its type plan: values are
+encoded with the same conversions as the JsonEncoder (enums as names, datetimes as ISO strings,
+Decimals as strings, objects as their public non-null attributes), and decoded with the
+JsonSerializer's type-directed reconstruction (enums, datetimes, Decimals, nested dataclasses,
+aggregates). Only the wire format changes, which makes payloads smaller and encoding/decoding
+cheaper for large values stored in caches, snapshots or Redis. The FileSnapshotStore and
+RedisSnapshotStore accept it to store snapshots, states included, in binary form.
+
+Requires the optional 'msgpack' package: pip install neuroglia-python[msgpack]
+
+Examples:
+    ```python
+    # Service registration
+    MessagePackSerializer.configure(builder)
+    serializer = provider.get_required_service(MessagePackSerializer)
+
+    # Aggregates are stored as their state, like with the JsonSerializer
+    payload = serializer.serialize(lab_resource)
+    restored = serializer.deserialize(payload, LabResource)
+    ```
+
+See Also:
+    - JSON Serialization Guide: https://bvandewe.github.io/pyneuro/features/serialization/
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None  # type: ignore
+    MSGPACK_AVAILABLE = False
+
+from neuroglia.serialization.abstractions import Serializer
+from neuroglia.serialization.json import JsonEncoder, JsonSerializer
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+
+class MessagePackSerializer(Serializer):
+    """
+    Represents a binary serializer that encodes values as MessagePack, using the same type plan as the JsonSerializer.
+
+    AggregateRoot instances are serialized as their state, and reconstructed from it when the expected type is an aggregate.
+    """
+
+    def __init__(self, json_serializer: Optional[JsonSerializer] = None):
+        """
+        Initializes a new MessagePackSerializer.
+
+        Args:
+            json_serializer: The JsonSerializer whose type plan is used to reconstruct decoded values. Defaults to a new JsonSerializer
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required for MessagePack serialization. Install with: pip install neuroglia-python[msgpack]")
+        self._json_serializer = json_serializer or JsonSerializer()
+        self._encoder = JsonEncoder()
+
+    def serialize(self, value: Any) -> bytearray:
+        if hasattr(value, "state") and hasattr(value, "register_event") and hasattr(value, "domain_events"):
+            value = value.state
+        return bytearray(msgpack.packb(value, default=self._encoder.default, use_bin_type=True))
+
+    def deserialize(self, input: bytearray, expected_type: Optional[type]) -> Any:
+        value = msgpack.unpackb(bytes(input), raw=False, strict_map_key=False)
+        return self._json_serializer.deserialize_from_value(value, expected_type)
+
+    @staticmethod
+    def configure(builder: "ApplicationBuilderBase") -> "ApplicationBuilderBase":
+        """
+        Configures the specified application builder to use the MessagePackSerializer.
+
+        The serializer is registered under its own type only, so that it can be injected where a compact binary
+        format is desired (caches, snapshots, ...) without replacing the default Serializer.
+
+        Args:
+            builder: The application builder to configure
+        """
+        builder.services.try_add_singleton(JsonSerializer)
+        builder.services.add_singleton(
+            MessagePackSerializer,
+            implementation_factory=lambda provider: MessagePackSerializer(provider.get_required_service(JsonSerializer)),
+        )
+        return builder
@@ -0,0 +1,141 @@
+"""
+Micro-benchmark configuration for the Neuroglia framework.
+
+Benchmarks are skipped unless NEUROGLIA_BENCHMARKS=1 is set, so that the regular suite stays fast and
+machine-independent. Each benchmark measures throughput (ops/sec) and peak traced memory per operation,
+and fails when it regresses beyond a tolerance compared to the baseline.
+
+Throughput depends on the machine, so the baseline is a local, untracked file ('baseline.json', ignored by git),
+recorded on the machine the benchmarks are compared on. Without a baseline, results are reported only.
+
+Environment variables:
+    - NEUROGLIA_BENCHMARKS=1: Enables the benchmarks
+    - NEUROGLIA_BENCHMARK_SAVE=1: Writes the measured results as the new baseline instead of comparing
+    - NEUROGLIA_BENCHMARK_TOLERANCE: Allowed throughput regression ratio (defaults to 0.30)
+    - NEUROGLIA_BENCHMARK_MEMORY_TOLERANCE: Allowed memory regression ratio (defaults to 0.10)
+
+Usage:
+    make benchmark
+    make benchmark-baseline
+"""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+BENCHMARKS_ENABLED = os.getenv("NEUROGLIA_BENCHMARKS") == "1"
+SAVE_BASELINE = os.getenv("NEUROGLIA_BENCHMARK_SAVE") == "1"
+THROUGHPUT_TOLERANCE = float(os.getenv("NEUROGLIA_BENCHMARK_TOLERANCE", "0.30"))
+MEMORY_TOLERANCE = float(os.getenv("NEUROGLIA_BENCHMARK_MEMORY_TOLERANCE", "0.10"))
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+@dataclass
+class BenchmarkResult:
+    """Represents the result of a benchmark"""
+
+    name: str
+    ops_per_sec: float
+    peak_bytes_per_op: int
+
+
+def measure(fn: Callable[[], Any], min_time: float = 0.2, rounds: int = 5) -> tuple[float, int]:
+    """Measures the best throughput of the specified function over several rounds, and the peak memory it allocates per call"""
+    fn()  # warm up caches (type hints, enum indexes, ...)
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / rounds:
+            break
+        iterations *= 2
+    best = elapsed
+    for _ in range(rounds - 1):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return iterations / best, peak
+
+
+class BenchmarkRunner:
+    """Runs benchmarks and compares their results with the baseline"""
+
+    def __init__(self):
+        self.results: dict[str, BenchmarkResult] = {}
+        self.baseline: dict[str, dict[str, Any]] = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+
+    def run(self, name: str, fn: Callable[[], Any], min_time: float = 0.2) -> BenchmarkResult:
+        ops_per_sec, peak_bytes = measure(fn, min_time)
+        result = BenchmarkResult(name, ops_per_sec, peak_bytes)
+        self.results[name] = result
+        if not SAVE_BASELINE:
+            self._check_regression(result)
+        return result
+
+    def _check_regression(self, result: BenchmarkResult) -> None:
+        baseline: Optional[dict[str, Any]] = self.baseline.get(result.name)
+        if baseline is None:
+            return
+        min_ops = baseline["ops_per_sec"] * (1 - THROUGHPUT_TOLERANCE)
+        assert result.ops_per_sec >= min_ops, f"{result.name}: throughput regressed to {result.ops_per_sec:,.0f} ops/sec (baseline {baseline['ops_per_sec']:,.0f}, minimum {min_ops:,.0f})"
+        max_bytes = baseline["peak_bytes_per_op"] * (1 + MEMORY_TOLERANCE)
+        assert result.peak_bytes_per_op <= max_bytes, f"{result.name}: peak memory regressed to {result.peak_bytes_per_op:,} bytes/op (baseline {baseline['peak_bytes_per_op']:,}, maximum {max_bytes:,.0f})"
+
+    def save_baseline(self) -> None:
+        baseline = dict(self.baseline)
+        baseline.update({name: {"ops_per_sec": round(result.ops_per_sec, 1), "peak_bytes_per_op": result.peak_bytes_per_op} for name, result in self.results.items()})
+        BASELINE_PATH.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+
+
+_runner = BenchmarkRunner()
+
+
+def pytest_collection_modifyitems(config, items):
+    if BENCHMARKS_ENABLED:
+        return
+    skip = pytest.mark.skip(reason="benchmarks are disabled, set NEUROGLIA_BENCHMARKS=1 to run them")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def benchmark_runner() -> BenchmarkRunner:
+    """Provides the session-wide benchmark runner"""
+    return _runner
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if SAVE_BASELINE and _runner.results:
+        _runner.save_baseline()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _runner.results:
+        return
+    terminalreporter.section("benchmarks")
+    if not _runner.baseline and not SAVE_BASELINE:
+        terminalreporter.write_line("no local baseline to compare with, run 'make benchmark-baseline' to record one")
+    terminalreporter.write_line(f"{'benchmark':<48} {'ops/sec':>14} {'baseline':>14} {'peak KiB/op':>12}")
+    for name, result in sorted(_runner.results.items()):
+        baseline = _runner.baseline.get(name)
+        baseline_ops = f"{baseline['ops_per_sec']:,.1f}" if baseline else "-"
+        terminalreporter.write_line(f"{name:<48} {result.ops_per_sec:>14,.1f} {baseline_ops:>14} {result.peak_bytes_per_op / 1024:>12,.1f}")
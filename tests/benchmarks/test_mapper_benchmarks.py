@@ -0,0 +1,62 @@
+"""
+Micro-benchmarks for the Mapper.
+
+Covers interpreted and compiled type maps for:
+1. A single DTO with a few dozen fields
+2. Lists of 10k items, mapped item by item and with map_many
+"""
+
+import pytest
+
+from neuroglia.mapping.mapper import Mapper, MapperConfiguration
+
+pytestmark = pytest.mark.benchmark
+
+FIELD_COUNT = 30
+
+
+class CustomerState:
+    """Source type with FIELD_COUNT public attributes"""
+
+    def __init__(self, i: int):
+        for f in range(FIELD_COUNT):
+            setattr(self, f"field_{f}", f"value-{i}-{f}")
+
+
+class CustomerDto:
+    """Destination type declaring FIELD_COUNT attributes"""
+
+    __annotations__ = {f"field_{f}": str for f in range(FIELD_COUNT)}
+
+
+def _mapper(compiled: bool) -> Mapper:
+    config = MapperConfiguration()
+    mapping = config.create_map(CustomerState, CustomerDto)
+    mapping.for_member("field_0", lambda ctx: ctx.source_member_value.upper())
+    if compiled:
+        mapping.compile()
+    return Mapper(config)
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["interpreted", "compiled"])
+class TestMapperBenchmarks:
+    def test_single_dto(self, compiled: bool, benchmark_runner):
+        mapper = _mapper(compiled)
+        source = CustomerState(1)
+        mode = "compiled" if compiled else "interpreted"
+
+        benchmark_runner.run(f"mapper.{mode}.dto_{FIELD_COUNT}_fields", lambda: mapper.map(source, CustomerDto))
+
+    def test_large_list(self, compiled: bool, benchmark_runner):
+        mapper = _mapper(compiled)
+        sources = [CustomerState(i) for i in range(10_000)]
+        mode = "compiled" if compiled else "interpreted"
+
+        benchmark_runner.run(f"mapper.{mode}.list_10k", lambda: [mapper.map(source, CustomerDto) for source in sources], min_time=1.0)
+
+    def test_large_list_map_many(self, compiled: bool, benchmark_runner):
+        mapper = _mapper(compiled)
+        sources = [CustomerState(i) for i in range(10_000)]
+        mode = "compiled" if compiled else "interpreted"
+
+        benchmark_runner.run(f"mapper.{mode}.map_many_10k", lambda: mapper.map_many(sources, CustomerDto), min_time=1.0)
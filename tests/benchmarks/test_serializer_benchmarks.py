@@ -0,0 +1,184 @@
+"""
+Micro-benchmarks for the JsonSerializer.
+
+Covers both serialization directions for:
+1. Flat DTOs
+2. Nested dataclasses
+3. Aggregates whose state results from 150 events
+4. Enum-heavy payloads, annotated and inferred through the TypeRegistry
+5. Lists of 10k items
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState
+from neuroglia.serialization.json import JsonSerializer
+
+pytestmark = pytest.mark.benchmark
+
+
+class PizzaSize(Enum):
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+
+class OrderStatus(Enum):
+    PENDING = "pending"
+    COOKING = "cooking"
+    READY = "ready"
+    DELIVERED = "delivered"
+
+
+class TransactionKind(Enum):
+    DEPOSIT = "deposit"
+    WITHDRAWAL = "withdrawal"
+
+
+@dataclass
+class CustomerDto:
+    id: str
+    name: str
+    email: str
+    phone: str
+    address: str
+    loyalty_points: int
+    is_active: bool
+    created_at: datetime
+    balance: Decimal
+    notes: Optional[str] = None
+
+
+@dataclass
+class ToppingDto:
+    name: str
+    price: Decimal
+
+
+@dataclass
+class PizzaDto:
+    name: str
+    size: PizzaSize
+    base_price: Decimal
+    toppings: list[ToppingDto] = field(default_factory=list)
+
+
+@dataclass
+class OrderDto:
+    id: str
+    customer: CustomerDto
+    status: OrderStatus
+    pizzas: list[PizzaDto]
+    placed_at: datetime
+
+
+@dataclass
+class Transaction:
+    id: str
+    kind: TransactionKind
+    amount: Decimal
+    recorded_at: datetime
+
+
+class BankAccountState(AggregateState[str]):
+    id: str
+    owner: str
+    balance: Decimal
+    transactions: list[Transaction]
+
+    def __init__(self):
+        super().__init__()
+        self.id = ""
+        self.owner = ""
+        self.balance = Decimal("0")
+        self.transactions = []
+
+
+class BankAccount(AggregateRoot[BankAccountState, str]):
+    def __init__(self, id: str = "account-1", events: int = 150):
+        super().__init__()
+        self.state.id = id
+        self.state.owner = "Mario"
+        started_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(events):
+            kind = TransactionKind.DEPOSIT if i % 3 else TransactionKind.WITHDRAWAL
+            amount = Decimal(f"{i}.25")
+            self.state.transactions.append(Transaction(f"tx-{i}", kind, amount, started_at + timedelta(minutes=i)))
+            self.state.balance += amount if kind == TransactionKind.DEPOSIT else -amount
+
+
+@dataclass
+class KitchenBoardDto:
+    sizes: list[PizzaSize]
+    statuses: list[OrderStatus]
+    primary_size: PizzaSize
+    primary_status: OrderStatus
+
+
+class UntypedKitchenBoard:
+    """Class without annotations: enums are resolved through type inference and the TypeRegistry"""
+
+
+def _customer(i: int) -> CustomerDto:
+    return CustomerDto(f"customer-{i}", f"Customer {i}", f"customer{i}@pizzeria.com", "+1-555-0100", "1 Pizza Street", i, True, datetime(2025, 1, 1, tzinfo=timezone.utc), Decimal(f"{i}.99"))
+
+
+def _order(i: int) -> OrderDto:
+    toppings = [ToppingDto(name, Decimal("1.50")) for name in ("cheese", "ham", "mushrooms")]
+    pizzas = [PizzaDto(f"Pizza {p}", PizzaSize.LARGE, Decimal("12.00"), list(toppings)) for p in range(4)]
+    return OrderDto(f"order-{i}", _customer(i), OrderStatus.COOKING, pizzas, datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+
+def _kitchen_board() -> KitchenBoardDto:
+    sizes = [size for _ in range(20) for size in PizzaSize]
+    statuses = [status for _ in range(15) for status in OrderStatus]
+    return KitchenBoardDto(sizes, statuses, PizzaSize.MEDIUM, OrderStatus.READY)
+
+
+@pytest.fixture(scope="module")
+def serializer() -> JsonSerializer:
+    return JsonSerializer()
+
+
+class TestSerializerBenchmarks:
+    def test_flat_dto(self, serializer: JsonSerializer, benchmark_runner):
+        customer = _customer(1)
+        payload = serializer.serialize_to_text(customer)
+
+        benchmark_runner.run("json.flat_dto.serialize", lambda: serializer.serialize_to_text(customer))
+        benchmark_runner.run("json.flat_dto.deserialize", lambda: serializer.deserialize_from_text(payload, CustomerDto))
+
+    def test_nested_dataclasses(self, serializer: JsonSerializer, benchmark_runner):
+        order = _order(1)
+        payload = serializer.serialize_to_text(order)
+
+        benchmark_runner.run("json.nested_dataclasses.serialize", lambda: serializer.serialize_to_text(order))
+        benchmark_runner.run("json.nested_dataclasses.deserialize", lambda: serializer.deserialize_from_text(payload, OrderDto))
+
+    def test_aggregate_state(self, serializer: JsonSerializer, benchmark_runner):
+        account = BankAccount()
+        payload = serializer.serialize_to_text(account)
+
+        benchmark_runner.run("json.aggregate_150_events.serialize", lambda: serializer.serialize_to_text(account))
+        benchmark_runner.run("json.aggregate_150_events.deserialize", lambda: serializer.deserialize_from_text(payload, BankAccount))
+
+    def test_enum_heavy_payload(self, serializer: JsonSerializer, benchmark_runner):
+        board = _kitchen_board()
+        payload = serializer.serialize_to_text(board)
+
+        benchmark_runner.run("json.enum_heavy.serialize", lambda: serializer.serialize_to_text(board))
+        benchmark_runner.run("json.enum_heavy.deserialize", lambda: serializer.deserialize_from_text(payload, KitchenBoardDto))
+        benchmark_runner.run("json.enum_heavy_inferred.deserialize", lambda: serializer.deserialize_from_text(payload, UntypedKitchenBoard))
+
+    def test_large_list(self, serializer: JsonSerializer, benchmark_runner):
+        customers = [_customer(i) for i in range(10_000)]
+        payload = serializer.serialize_to_text(customers)
+
+        benchmark_runner.run("json.list_10k.serialize", lambda: serializer.serialize_to_text(customers), min_time=1.0)
+        benchmark_runner.run("json.list_10k.deserialize", lambda: serializer.deserialize_from_text(payload, list[CustomerDto]), min_time=1.0)
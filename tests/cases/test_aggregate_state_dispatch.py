@@ -0,0 +1,128 @@
+"""
+Tests for the @applies event dispatch of aggregate states.
+
+This test suite verifies that:
+1. AggregateState.on dispatches events to the methods registered with @applies for their type
+2. Events without a registration of their own are dispatched to the method registered for their closest base type
+3. Subclasses inherit registrations, and overriding a method replaces its registrations
+4. Unregistered events are rejected
+5. The state type of aggregate roots is resolved once, and used by the Aggregator
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from neuroglia.data import AggregateRoot, AggregateState, DomainEvent, applies
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventRecord,
+)
+
+
+class AccountOpenedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str):
+        super().__init__(aggregate_id)
+
+
+class MoneyDepositedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, amount: Decimal):
+        super().__init__(aggregate_id)
+        self.amount = amount
+
+
+class InterestPaidDomainEvent(MoneyDepositedDomainEvent):
+    pass
+
+
+class MoneyWithdrawnDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, amount: Decimal):
+        super().__init__(aggregate_id)
+        self.amount = amount
+
+
+class AccountState(AggregateState[str]):
+    def __init__(self):
+        super().__init__()
+        self.balance = Decimal(0)
+        self.deposits = 0
+
+    @applies(AccountOpenedDomainEvent)
+    def _on_opened(self, e: AccountOpenedDomainEvent):
+        self.id = e.aggregate_id
+
+    @applies(MoneyDepositedDomainEvent)
+    def _on_deposited(self, e: MoneyDepositedDomainEvent):
+        self.balance += e.amount
+        self.deposits += 1
+
+
+class SavingsAccountState(AccountState):
+    @applies(MoneyWithdrawnDomainEvent)
+    def _on_withdrawn(self, e: MoneyWithdrawnDomainEvent):
+        self.balance -= e.amount
+
+    def _on_deposited(self, e: MoneyDepositedDomainEvent):
+        self.balance += e.amount
+
+
+class Account(AggregateRoot[AccountState, str]):
+    def __init__(self, account_id: str = "account-1"):
+        super().__init__()
+        self.state.on(self.register_event(AccountOpenedDomainEvent(account_id)))
+
+    def deposit(self, amount: Decimal) -> None:
+        self.state.on(self.register_event(MoneyDepositedDomainEvent(self.id(), amount)))
+
+
+class TestAppliesDispatch:
+    def test_dispatches_events_to_registered_methods(self):
+        account = Account()
+
+        account.deposit(Decimal("10"))
+        account.deposit(Decimal("2.5"))
+
+        assert account.id() == "account-1"
+        assert account.state.balance == Decimal("12.5")
+        assert account.state.deposits == 2
+
+    def test_dispatches_derived_events_to_base_registrations(self):
+        state = AccountState()
+
+        state.on(InterestPaidDomainEvent("account-1", Decimal("1")))
+
+        assert state.balance == Decimal("1")
+        assert AccountState.__event_handlers__[InterestPaidDomainEvent] is AccountState._on_deposited
+
+    def test_subclasses_inherit_registrations_unless_overridden(self):
+        state = SavingsAccountState()
+
+        state.on(AccountOpenedDomainEvent("savings-1"))
+        state.on(MoneyWithdrawnDomainEvent("savings-1", Decimal("3")))
+
+        assert state.id == "savings-1"
+        assert state.balance == Decimal("-3")
+        assert MoneyDepositedDomainEvent not in SavingsAccountState.__event_handlers__
+        assert MoneyWithdrawnDomainEvent not in AccountState.__event_handlers__
+
+    def test_rejects_unregistered_events(self):
+        with pytest.raises(NotImplementedError):
+            AccountState().on(MoneyWithdrawnDomainEvent("account-1", Decimal("1")))
+
+
+class TestStateTypeResolution:
+    def test_state_type_is_resolved_once(self):
+        assert Account._get_state_type() is AccountState
+        assert Account.__dict__["__state_type__"] is AccountState
+
+    def test_aggregator_replays_events_through_dispatch_table(self):
+        account = Account()
+        for amount in range(1, 101):
+            account.deposit(Decimal(amount))
+        records = [EventRecord("account-1", str(i), i, i, datetime.now(timezone.utc), type(e).__name__, e) for i, e in enumerate(account._pending_events)]
+
+        replayed = Aggregator().aggregate(records, Account)
+
+        assert replayed.state.balance == Decimal(5050)
+        assert replayed.state.state_version == 101
@@ -0,0 +1,147 @@
+"""
+Tests for the bulk loads of EventSourcingRepository.
+
+This test suite verifies that:
+1. get_many_async loads aggregates concurrently, with at most 'max_concurrency' reads in flight
+2. Missing aggregates are reported as None, in the order of the requested ids
+3. The replay of streams reaching the offload threshold is offloaded to the specified executor,
+   including process pools
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, DomainEvent, applies
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventStoreOptions,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
+    EventSourcingRepository,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import InMemoryEventStore
+
+
+class PaymentReceivedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, amount: Decimal):
+        super().__init__(aggregate_id)
+        self.amount = amount
+
+
+class LedgerState(AggregateState[str]):
+    def __init__(self):
+        super().__init__()
+        self.total = Decimal(0)
+
+    @applies(PaymentReceivedDomainEvent)
+    def _on_payment_received(self, e: PaymentReceivedDomainEvent):
+        self.id = e.aggregate_id
+        self.total += e.amount
+
+
+class Ledger(AggregateRoot[LedgerState, str]):
+    def __init__(self, ledger_id: str):
+        super().__init__()
+        self.state.id = ledger_id
+
+    def receive(self, amount: Decimal) -> None:
+        self.state.on(self.register_event(PaymentReceivedDomainEvent(self.id(), amount)))
+
+
+class SlowEventStore(InMemoryEventStore):
+    """In-memory event store simulating read round trips, recording the number of reads in flight"""
+
+    def __init__(self):
+        super().__init__(EventStoreOptions("test", "test-group"))
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def read_async(self, stream_id, read_direction: StreamReadDirection, offset: int, length=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return await super().read_async(stream_id, read_direction, offset, length)
+        finally:
+            self.in_flight -= 1
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the number of submitted tasks"""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+async def _seed_async(repository: EventSourcingRepository[Ledger, str], payments_per_ledger: dict[str, int]) -> None:
+    ledgers = []
+    for ledger_id, payments in payments_per_ledger.items():
+        ledger = Ledger(ledger_id)
+        for _ in range(payments):
+            ledger.receive(Decimal("1.5"))
+        ledgers.append(ledger)
+    await repository.add_many_async(ledgers)
+
+
+class TestGetMany:
+    @pytest.mark.asyncio
+    async def test_loads_aggregates_concurrently(self):
+        eventstore = SlowEventStore()
+        repository = EventSourcingRepository[Ledger, str](eventstore, Aggregator())
+        await _seed_async(repository, {f"ledger-{i}": 2 for i in range(30)})
+
+        ledgers = await repository.get_many_async([f"ledger-{i}" for i in range(30)], max_concurrency=5)
+
+        assert list(ledgers) == [f"ledger-{i}" for i in range(30)]
+        assert all(ledger.state.total == Decimal(3) for ledger in ledgers.values())
+        assert eventstore.max_in_flight == 5
+
+    @pytest.mark.asyncio
+    async def test_reports_missing_aggregates_as_none(self):
+        repository = EventSourcingRepository[Ledger, str](InMemoryEventStore(), Aggregator())
+        await _seed_async(repository, {"ledger-1": 1})
+
+        ledgers = await repository.get_many_async(["ledger-2", "ledger-1", "ledger-2"])
+
+        assert list(ledgers) == ["ledger-2", "ledger-1"]
+        assert ledgers["ledger-2"] is None
+        assert ledgers["ledger-1"].state.state_version == 1
+
+    @pytest.mark.asyncio
+    async def test_offloads_replay_of_long_streams(self):
+        repository = EventSourcingRepository[Ledger, str](InMemoryEventStore(), Aggregator())
+        await _seed_async(repository, {"ledger-short": 3, "ledger-long": 50})
+
+        with RecordingExecutor() as executor:
+            ledgers = await repository.get_many_async(["ledger-short", "ledger-long"], executor=executor, offload_threshold=10)
+
+        assert executor.submitted == 1
+        assert ledgers["ledger-long"].state.total == Decimal(75)
+        assert ledgers["ledger-short"].state.total == Decimal("4.5")
+
+    @pytest.mark.asyncio
+    async def test_offloads_replay_to_process_pool(self):
+        repository = EventSourcingRepository[Ledger, str](InMemoryEventStore(), Aggregator())
+        await _seed_async(repository, {f"ledger-{i}": 20 for i in range(4)})
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            ledgers = await repository.get_many_async([f"ledger-{i}" for i in range(4)], executor=executor, offload_threshold=1)
+
+        assert [ledger.state.total for ledger in ledgers.values()] == [Decimal(30)] * 4
+        assert all(ledger.state.state_version == 20 for ledger in ledgers.values())
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_concurrency(self):
+        repository = EventSourcingRepository[Ledger, str](InMemoryEventStore(), Aggregator())
+
+        with pytest.raises(ValueError):
+            await repository.get_many_async(["ledger-1"], max_concurrency=0)
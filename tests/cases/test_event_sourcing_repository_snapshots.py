@@ -0,0 +1,229 @@
+"""
+Tests for the aggregate snapshots of EventSourcingRepository.
+
+This test suite verifies that:
+1. Snapshots are taken according to the SnapshotPolicy (every N events, every T seconds)
+2. Aggregates are restored from their latest snapshot, replaying only the events recorded after it
+3. Snapshots with an incompatible schema version are discarded in favor of a full replay
+4. The in-memory and file snapshot stores persist, replace and delete snapshots, in the format of their serializer
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, DomainEvent
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventDescriptor,
+    EventRecord,
+    EventStore,
+    Snapshot,
+    SnapshotPolicy,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
+    EventSourcingRepository,
+    EventSourcingRepositoryOptions,
+)
+from neuroglia.data.infrastructure.event_sourcing.snapshot_store import (
+    FileSnapshotStore,
+    InMemorySnapshotStore,
+)
+
+
+class MoneyDepositedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, amount: Decimal):
+        super().__init__(aggregate_id)
+        self.amount = amount
+
+
+class AccountState(AggregateState[str]):
+    id: str
+    balance: Decimal
+
+    def __init__(self):
+        super().__init__()
+        self.id = ""
+        self.balance = Decimal("0")
+
+    def on(self, e: MoneyDepositedDomainEvent):
+        self.id = e.aggregate_id
+        self.balance += e.amount
+
+
+class Account(AggregateRoot[AccountState, str]):
+    def __init__(self, account_id: str = "account-1"):
+        super().__init__()
+        self.state.id = account_id
+
+    def deposit(self, amount: Decimal) -> None:
+        self.state.on(self.register_event(MoneyDepositedDomainEvent(self.id(), amount)))
+
+
+class RecordingEventStore(EventStore):
+    """Minimal event store keeping streams in memory and recording the offsets it is read from"""
+
+    def __init__(self):
+        self.streams: dict[str, list[EventRecord]] = {}
+        self.read_offsets: list[int] = []
+
+    async def contains_async(self, stream_id: str) -> bool:
+        return stream_id in self.streams
+
+    async def append_async(self, stream_id: str, events: list[EventDescriptor], expected_version: Optional[int] = None):
+        stream = self.streams.setdefault(stream_id, [])
+        for e in events:
+            stream.append(EventRecord(stream_id, str(len(stream)), len(stream), 0, datetime.now(timezone.utc), e.type, e.data))
+
+    async def get_async(self, stream_id: str):
+        raise NotImplementedError()
+
+    async def read_async(self, stream_id: str, read_direction: StreamReadDirection, offset: int, length: Optional[int] = None) -> list[EventRecord]:
+        self.read_offsets.append(offset)
+        return self.streams.get(stream_id, [])[offset:]
+
+    async def delete_async(self, stream_id: str) -> None:
+        self.streams.pop(stream_id, None)
+
+
+def _repository(eventstore: EventStore, snapshot_store, policy: SnapshotPolicy) -> EventSourcingRepository[Account, str]:
+    options = EventSourcingRepositoryOptions[Account, str](snapshot_policy=policy)
+    return EventSourcingRepository[Account, str](eventstore, Aggregator(), options=options, snapshot_store=snapshot_store)
+
+
+async def _deposit_async(repository: EventSourcingRepository[Account, str], count: int) -> Account:
+    account = Account()
+    account.deposit(Decimal("1.50"))
+    await repository.add_async(account)
+    for _ in range(count - 1):
+        account = await repository.get_async(account.id())
+        account.deposit(Decimal("1.50"))
+        await repository.update_async(account)
+    return account
+
+
+class TestSnapshotPolicy:
+    def test_every_events_is_due_when_version_crosses_a_multiple(self):
+        policy = SnapshotPolicy(every_events=10)
+
+        assert policy.is_due(9, 10)
+        assert policy.is_due(8, 12)
+        assert not policy.is_due(10, 19)
+
+    def test_every_seconds_is_due_when_interval_elapsed(self):
+        policy = SnapshotPolicy(every_seconds=60)
+
+        assert policy.is_due(1, 2, None)
+        assert policy.is_due(1, 2, datetime.now(timezone.utc) - timedelta(minutes=2))
+        assert not policy.is_due(1, 2, datetime.now(timezone.utc))
+
+    def test_is_not_due_without_new_events(self):
+        assert not SnapshotPolicy(every_events=1, every_seconds=0).is_due(5, 5)
+
+
+class TestEventSourcingRepositorySnapshots:
+    @pytest.mark.asyncio
+    async def test_snapshot_is_taken_every_n_events(self):
+        eventstore, snapshot_store = RecordingEventStore(), InMemorySnapshotStore()
+        repository = _repository(eventstore, snapshot_store, SnapshotPolicy(every_events=5))
+
+        await _deposit_async(repository, 12)
+
+        snapshot = await snapshot_store.get_async("account-account-1")
+        assert snapshot.version == 10
+        assert snapshot.schema_version == 1
+        assert snapshot.data["balance"] == "15.00"
+
+    @pytest.mark.asyncio
+    async def test_get_replays_only_events_after_snapshot(self):
+        eventstore, snapshot_store = RecordingEventStore(), InMemorySnapshotStore()
+        repository = _repository(eventstore, snapshot_store, SnapshotPolicy(every_events=5))
+        await _deposit_async(repository, 7)
+        eventstore.read_offsets.clear()
+
+        account = await repository.get_async("account-1")
+
+        assert eventstore.read_offsets == [5]
+        assert account.state.balance == Decimal("10.50")
+        assert account.state.state_version == 7
+        assert account._pending_events == []
+
+    @pytest.mark.asyncio
+    async def test_incompatible_schema_version_falls_back_to_full_replay(self):
+        eventstore, snapshot_store = RecordingEventStore(), InMemorySnapshotStore()
+        await _deposit_async(_repository(eventstore, snapshot_store, SnapshotPolicy(every_events=5)), 7)
+        repository = _repository(eventstore, snapshot_store, SnapshotPolicy(every_events=5, schema_version=2))
+        eventstore.read_offsets.clear()
+
+        account = await repository.get_async("account-1")
+
+        assert eventstore.read_offsets == [0]
+        assert account.state.balance == Decimal("10.50")
+        assert await snapshot_store.get_async("account-account-1") is None
+
+    @pytest.mark.asyncio
+    async def test_unreadable_snapshot_falls_back_to_full_replay(self):
+        eventstore, snapshot_store = RecordingEventStore(), InMemorySnapshotStore()
+        repository = _repository(eventstore, snapshot_store, SnapshotPolicy(every_events=100))
+        await _deposit_async(repository, 3)
+        await snapshot_store.save_async(Snapshot("account-account-1", 2, 1, "not json", datetime.now(timezone.utc)))
+
+        account = await repository.get_async("account-1")
+
+        assert account.state.balance == Decimal("4.50")
+        assert account.state.state_version == 3
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_disabled_without_policy(self):
+        eventstore, snapshot_store = RecordingEventStore(), InMemorySnapshotStore()
+        repository = EventSourcingRepository[Account, str](eventstore, Aggregator(), snapshot_store=snapshot_store)
+
+        await _deposit_async(repository, 3)
+
+        assert await snapshot_store.get_async("account-account-1") is None
+
+    @pytest.mark.asyncio
+    async def test_snapshot_times_are_remembered_for_most_recent_aggregates_only(self):
+        eventstore, snapshot_store = RecordingEventStore(), InMemorySnapshotStore()
+        options = EventSourcingRepositoryOptions[Account, str](snapshot_policy=SnapshotPolicy(every_seconds=3600), snapshot_time_cache_size=2)
+        repository = EventSourcingRepository[Account, str](eventstore, Aggregator(), options=options, snapshot_store=snapshot_store)
+
+        for account_id in ("account-1", "account-2", "account-3"):
+            account = Account(account_id)
+            account.deposit(Decimal("1.50"))
+            await repository.add_async(account)
+
+        assert list(repository._snapshots_taken_at) == ["account-account-2", "account-account-3"]
+        assert await snapshot_store.get_async("account-account-1") is not None
+
+
+class TestFileSnapshotStore:
+    @pytest.mark.asyncio
+    async def test_save_get_and_delete(self, tmp_path):
+        snapshot_store = FileSnapshotStore(str(tmp_path))
+        timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        await snapshot_store.save_async(Snapshot("account-1", 5, 1, {"balance": "7.50"}, timestamp))
+        await snapshot_store.save_async(Snapshot("account-1", 10, 1, {"balance": "15.00"}, timestamp))
+        snapshot = await snapshot_store.get_async("account-1")
+        await snapshot_store.delete_async("account-1")
+
+        assert snapshot == Snapshot("account-1", 10, 1, {"balance": "15.00"}, timestamp)
+        assert await snapshot_store.get_async("account-1") is None
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_stored_with_the_specified_serializer(self, tmp_path):
+        msgpack = pytest.importorskip("msgpack")
+        from neuroglia.serialization.message_pack import MessagePackSerializer
+
+        snapshot_store = FileSnapshotStore(str(tmp_path), MessagePackSerializer())
+        snapshot = Snapshot("account-1", 5, 1, {"balance": "7.50"}, datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+        await snapshot_store.save_async(snapshot)
+
+        assert [f.name for f in tmp_path.iterdir()] == ["account-1.snapshot"]
+        assert msgpack.unpackb((tmp_path / "account-1.snapshot").read_bytes())["data"] == {"balance": "7.50"}
+        assert await snapshot_store.get_async("account-1") == snapshot
@@ -0,0 +1,147 @@
+"""
+Tests for the batched appends of event stores and event sourcing repositories.
+
+This test suite verifies that:
+1. EventStore.append_many_async appends to many streams and reports the outcome of each append
+2. At most 'max_concurrency' appends are in flight at a time
+3. EventSourcingRepository.add_many_async and update_many_async complete the aggregates whose append succeeded,
+   and leave the others untouched
+"""
+
+import asyncio
+from typing import Optional
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, DomainEvent
+from neuroglia.data.exceptions import OptimisticConcurrencyException
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventDescriptor,
+    EventStoreOptions,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
+    EventSourcingRepository,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import InMemoryEventStore
+
+
+class StockReceivedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, quantity: int):
+        super().__init__(aggregate_id)
+        self.quantity = quantity
+
+
+class StockState(AggregateState[str]):
+    id: str
+    quantity: int
+
+    def __init__(self):
+        super().__init__()
+        self.id = ""
+        self.quantity = 0
+
+    def on(self, e: StockReceivedDomainEvent):
+        self.id = e.aggregate_id
+        self.quantity += e.quantity
+
+
+class Stock(AggregateRoot[StockState, str]):
+    def __init__(self, stock_id: str):
+        super().__init__()
+        self.state.id = stock_id
+
+    def receive(self, quantity: int) -> None:
+        self.state.on(self.register_event(StockReceivedDomainEvent(self.id(), quantity)))
+
+
+class SlowEventStore(InMemoryEventStore):
+    """In-memory event store simulating append round trips, recording the number of appends in flight"""
+
+    def __init__(self):
+        super().__init__(EventStoreOptions("test", "test-group"))
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def append_async(self, stream_id: str, events: list[EventDescriptor], expected_version: Optional[int] = None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            await super().append_async(stream_id, events, expected_version)
+        finally:
+            self.in_flight -= 1
+
+
+def _events(stock_id: str, *quantities: int) -> list[EventDescriptor]:
+    return [EventDescriptor("stockreceived", StockReceivedDomainEvent(stock_id, quantity)) for quantity in quantities]
+
+
+class TestAppendMany:
+    @pytest.mark.asyncio
+    async def test_reports_the_outcome_of_each_append(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("test", "test-group"))
+        await eventstore.append_async("stock-2", _events("2", 1))
+
+        results = await eventstore.append_many_async({"stock-1": (_events("1", 1, 2), None), "stock-2": (_events("2", 3), None), "stock-3": (_events("3", 4), None)})
+
+        assert list(results) == ["stock-1", "stock-2", "stock-3"]
+        assert [(r.succeeded, r.version) for r in results.values()] == [(True, 2), (False, None), (True, 1)]
+        assert isinstance(results["stock-2"].error, OptimisticConcurrencyException)
+        assert len(await eventstore.read_async("$ce-test", StreamReadDirection.FORWARDS, 0)) == 4
+
+    @pytest.mark.asyncio
+    async def test_bounds_the_number_of_appends_in_flight(self):
+        eventstore = SlowEventStore()
+
+        results = await eventstore.append_many_async({f"stock-{i}": (_events(str(i), 1), None) for i in range(50)}, max_concurrency=8)
+
+        assert all(r.succeeded for r in results.values())
+        assert eventstore.max_in_flight == 8
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            await InMemoryEventStore().append_many_async({}, max_concurrency=0)
+
+
+class TestEventSourcingRepositoryBatches:
+    @pytest.mark.asyncio
+    async def test_add_many_then_update_many(self):
+        eventstore = SlowEventStore()
+        repository = EventSourcingRepository[Stock, str](eventstore, Aggregator())
+        stocks = [Stock(f"stock-{i}") for i in range(20)]
+        for stock in stocks:
+            stock.receive(10)
+
+        added = await repository.add_many_async(stocks, max_concurrency=4)
+        stocks = [await repository.get_async(f"stock-{i}") for i in range(20)]
+        for stock in stocks:
+            stock.receive(5)
+        updated = await repository.update_many_async(stocks, max_concurrency=4)
+
+        assert list(added) == [f"stock-{i}" for i in range(20)]
+        assert all(r.succeeded for r in [*added.values(), *updated.values()])
+        stock = await repository.get_async("stock-7")
+        assert (stock.state.quantity, stock.state.state_version) == (15, 2)
+
+    @pytest.mark.asyncio
+    async def test_failed_appends_leave_aggregates_untouched(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("test", "test-group"))
+        repository = EventSourcingRepository[Stock, str](eventstore, Aggregator())
+        stock = Stock("stock-1")
+        stock.receive(10)
+        await repository.add_async(stock)
+        current, stale = await repository.get_async("stock-1"), await repository.get_async("stock-1")
+        current.receive(1)
+        await repository.update_async(current)
+        stale.receive(2)
+
+        with pytest.raises(ValueError):
+            await repository.update_many_async([stale, await repository.get_async("stock-1")])
+        results = await repository.update_many_async([stale])
+
+        assert isinstance(results["stock-1"].error, OptimisticConcurrencyException)
+        assert stale.state.state_version == 1
+        assert len(stale._pending_events) == 1
@@ -0,0 +1,234 @@
+"""
+Tests for the paged reads of event stores.
+
+This test suite verifies that:
+1. EventStore.read_stream_async pages through read_async, forwards and backwards, honoring the length
+2. ESEventStore.read_stream_async reads pages from KurrentDB, positioning resolved links by their link
+3. InMemoryEventStore.read_stream_async enumerates streams and category streams without copying them
+4. Aggregator.aggregate_async and EventSourcingRepository fold events as they are read
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from kurrentdbclient import RecordedEvent
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, DomainEvent
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventDescriptor,
+    EventRecord,
+    EventStore,
+    EventStoreOptions,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
+    EventSourcingRepository,
+    EventSourcingRepositoryOptions,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import InMemoryEventStore
+from neuroglia.data.infrastructure.event_sourcing.event_store.event_store import (
+    ESEventStore,
+)
+from neuroglia.serialization import JsonSerializer
+
+
+class AsyncIteratorMock:
+    """Mock async iterator for testing async for loops"""
+
+    def __init__(self, items):
+        self.items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class PointsEarnedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, points: int):
+        super().__init__(aggregate_id)
+        self.points = points
+
+
+class LoyaltyCardState(AggregateState[str]):
+    id: str
+    points: int
+
+    def __init__(self):
+        super().__init__()
+        self.id = ""
+        self.points = 0
+
+    def on(self, e: PointsEarnedDomainEvent):
+        self.id = e.aggregate_id
+        self.points += e.points
+
+
+class LoyaltyCard(AggregateRoot[LoyaltyCardState, str]):
+    def __init__(self, card_id: str = "card-1"):
+        super().__init__()
+        self.state.id = card_id
+
+    def earn(self, points: int) -> None:
+        self.state.on(self.register_event(PointsEarnedDomainEvent(self.id(), points)))
+
+
+@dataclass
+class PointsEarnedEvent:
+    points: int
+
+
+class PagingEventStore(EventStore):
+    """Minimal event store relying on the default paged read, recording the reads it serves"""
+
+    def __init__(self, count: int):
+        self.records = [EventRecord("card-1", str(i), i, i, datetime.now(timezone.utc), "points-earned", i) for i in range(count)]
+        self.reads: list[tuple[int, Optional[int]]] = []
+
+    async def contains_async(self, stream_id: str) -> bool:
+        return True
+
+    async def append_async(self, stream_id: str, events: list[EventDescriptor], expected_version: Optional[int] = None):
+        raise NotImplementedError()
+
+    async def get_async(self, stream_id: str):
+        raise NotImplementedError()
+
+    async def read_async(self, stream_id: str, read_direction: StreamReadDirection, offset: int, length: Optional[int] = None) -> list[EventRecord]:
+        self.reads.append((offset, length))
+        records = self.records[offset::-1] if read_direction == StreamReadDirection.BACKWARDS else self.records[offset:]
+        return records[:length]
+
+    async def delete_async(self, stream_id: str) -> None:
+        raise NotImplementedError()
+
+
+def _recorded_event(serializer: JsonSerializer, position: int, link_position: Optional[int] = None) -> RecordedEvent:
+    e = Mock(spec=RecordedEvent)
+    e.id = uuid4()
+    e.type = "points-earned"
+    e.stream_position = position
+    e.commit_position = position
+    e.recorded_at = None
+    e.data = serializer.serialize_to_text(PointsEarnedEvent(position)).encode()
+    e.metadata = serializer.serialize_to_text({"type": f"{PointsEarnedEvent.__module__}.{PointsEarnedEvent.__name__}"}).encode()
+    e.link = None
+    if link_position is not None:
+        e.link = Mock(spec=RecordedEvent)
+        e.link.stream_position = link_position
+    return e
+
+
+async def _collect_async(events) -> list:
+    return [e async for e in events]
+
+
+class TestDefaultPagedRead:
+    @pytest.mark.asyncio
+    async def test_reads_forwards_page_by_page(self):
+        eventstore = PagingEventStore(5)
+
+        records = await _collect_async(eventstore.read_stream_async("card-1", page_size=2))
+
+        assert [r.offset for r in records] == [0, 1, 2, 3, 4]
+        assert eventstore.reads == [(0, 2), (2, 2), (4, 2)]
+
+    @pytest.mark.asyncio
+    async def test_reads_backwards_up_to_length(self):
+        eventstore = PagingEventStore(10)
+
+        records = await _collect_async(eventstore.read_stream_async("card-1", StreamReadDirection.BACKWARDS, 8, length=5, page_size=2))
+
+        assert [r.offset for r in records] == [8, 7, 6, 5, 4]
+        assert eventstore.reads == [(8, 2), (6, 2), (4, 1)]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            await _collect_async(PagingEventStore(1).read_stream_async("card-1", page_size=0))
+
+
+class TestESEventStorePagedRead:
+    @pytest.mark.asyncio
+    async def test_reads_pages_of_limited_size(self):
+        serializer = JsonSerializer()
+        client = Mock()
+        pages = [[_recorded_event(serializer, 0), _recorded_event(serializer, 1)], [_recorded_event(serializer, 2)]]
+        client.read_stream = AsyncMock(side_effect=[AsyncIteratorMock(page) for page in pages])
+        eventstore = ESEventStore(EventStoreOptions("test_app", "test_group"), client, serializer)
+
+        records = await _collect_async(eventstore.read_stream_async("card-1", page_size=2))
+
+        assert [r.data.points for r in records] == [0, 1, 2]
+        assert [call.kwargs["stream_position"] for call in client.read_stream.call_args_list] == [0, 2]
+        assert client.read_stream.call_args.kwargs["stream_name"] == "test_app-card-1"
+        assert client.read_stream.call_args.kwargs["limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_positions_resolved_links_by_link(self):
+        serializer = JsonSerializer()
+        client = Mock()
+        pages = [[_recorded_event(serializer, 7, link_position=0), _recorded_event(serializer, 3, link_position=1)], []]
+        client.read_stream = AsyncMock(side_effect=[AsyncIteratorMock(page) for page in pages])
+        eventstore = ESEventStore(EventStoreOptions("test_app", "test_group"), client, serializer)
+
+        records = await _collect_async(eventstore.read_stream_async("$ce-test_app", page_size=2))
+
+        assert [(r.offset, r.link_offset) for r in records] == [(7, 0), (3, 1)]
+        assert [call.kwargs["stream_position"] for call in client.read_stream.call_args_list] == [0, 2]
+
+
+class TestInMemoryEventStorePagedRead:
+    @pytest.mark.asyncio
+    async def test_reads_category_streams_without_deleted_streams(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("test", "test-group"))
+        for card_id in ("card-1", "card-2", "card-3"):
+            await eventstore.append_async(card_id, [EventDescriptor("points-earned", PointsEarnedDomainEvent(card_id, points)) for points in (1, 2)])
+        await eventstore.delete_async("card-2")
+
+        forwards = await _collect_async(eventstore.read_stream_async("$ce-test", offset=1, page_size=1))
+        backwards = await _collect_async(eventstore.read_stream_async("$ce-test", StreamReadDirection.BACKWARDS, -1, length=3))
+
+        assert [(r.stream_id, r.offset, r.link_offset) for r in forwards] == [("card-1", 1, 1), ("card-3", 0, 4), ("card-3", 1, 5)]
+        assert [(r.stream_id, r.offset, r.link_offset) for r in backwards] == [("card-3", 1, 5), ("card-3", 0, 4), ("card-1", 1, 1)]
+        assert [r.link_offset for r in await eventstore.read_async("$ce-test", StreamReadDirection.FORWARDS, 3)] == [4, 5]
+        assert (await eventstore.read_async("card-3", StreamReadDirection.FORWARDS, 0))[0].link_offset is None
+
+
+class TestStreamedAggregation:
+    @pytest.mark.asyncio
+    async def test_aggregate_async_folds_events(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("test", "test-group"))
+        card = LoyaltyCard()
+        for points in range(1, 11):
+            card.earn(points)
+        await eventstore.append_async("loyaltycard-card-1", [EventDescriptor("points-earned", e) for e in card._pending_events])
+
+        card = await Aggregator().aggregate_async(eventstore.read_stream_async("loyaltycard-card-1", page_size=3), LoyaltyCard)
+
+        assert card.state.points == 55
+        assert card.state.state_version == 10
+
+    @pytest.mark.asyncio
+    async def test_repository_folds_paged_reads(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("test", "test-group"))
+        repository = EventSourcingRepository[LoyaltyCard, str](eventstore, Aggregator(), options=EventSourcingRepositoryOptions[LoyaltyCard, str](read_page_size=2))
+        card = LoyaltyCard()
+        for points in (5, 10, 15):
+            card.earn(points)
+        await repository.add_async(card)
+
+        card = await repository.get_async("card-1")
+
+        assert card.state.points == 30
+        assert card.state.state_version == 3
+        assert await repository.get_async("card-2") is None
@@ -0,0 +1,150 @@
+"""
+Tests for the stream head lookups of the ESEventStore.
+
+This test suite verifies that:
+1. get_async describes a stream from a single backwards read of its last event
+2. contains_async and get_stream_head_async resolve the stream head once, then serve it from the cache
+3. Appends update the cached stream head, while concurrency conflicts and deletions evict it
+4. The cache evicts the least recently used stream heads
+5. EventSourcingRepository.contains_async checks the existence of the aggregate's stream
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from kurrentdbclient import RecordedEvent, StreamState
+from kurrentdbclient.exceptions import NotFoundError, WrongCurrentVersionError
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventDescriptor,
+    EventStoreOptions,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
+    EventSourcingRepository,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import InMemoryEventStore
+from neuroglia.data.infrastructure.event_sourcing.event_store.event_store import (
+    ESEventStore,
+)
+from neuroglia.serialization import JsonSerializer
+from tests.data import User
+
+
+class AsyncIteratorMock:
+    """Mock async iterator for testing async for loops"""
+
+    def __init__(self, items):
+        self.items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@dataclass
+class ParcelShippedEvent:
+    parcel_id: str
+
+
+def _eventstore(client: Mock, stream_head_cache_size: int = 10_000) -> ESEventStore:
+    return ESEventStore(EventStoreOptions("test_app", "test_group"), client, JsonSerializer(), stream_head_cache_size)
+
+
+class TestESEventStoreStreamHeads:
+    @pytest.mark.asyncio
+    async def test_get_async_reads_last_event_only(self):
+        recorded_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        last_event = Mock(spec=RecordedEvent, stream_position=4, recorded_at=recorded_at)
+        client = Mock()
+        client.read_stream = AsyncMock(return_value=AsyncIteratorMock([last_event]))
+        eventstore = _eventstore(client)
+
+        descriptor = await eventstore.get_async("parcel-1")
+
+        client.read_stream.assert_awaited_once_with(stream_name="test_app-parcel-1", backwards=True, limit=1)
+        assert (descriptor.id, descriptor.length, descriptor.last_event_at) == ("parcel-1", 5, recorded_at)
+        assert await eventstore.get_stream_head_async("parcel-1") == 4
+
+    @pytest.mark.asyncio
+    async def test_get_async_returns_none_when_stream_does_not_exist(self):
+        client = Mock()
+        client.read_stream = AsyncMock(side_effect=NotFoundError())
+
+        assert await _eventstore(client).get_async("parcel-1") is None
+
+    @pytest.mark.asyncio
+    async def test_contains_async_caches_stream_heads(self):
+        client = Mock()
+        client.get_current_version = AsyncMock(side_effect=[2, StreamState.NO_STREAM])
+        eventstore = _eventstore(client)
+
+        assert await eventstore.contains_async("parcel-1")
+        assert await eventstore.contains_async("parcel-1")
+        assert not await eventstore.contains_async("parcel-2")
+
+        assert [call.kwargs["stream_name"] for call in client.get_current_version.await_args_list] == ["test_app-parcel-1", "test_app-parcel-2"]
+
+    @pytest.mark.asyncio
+    async def test_appends_update_stream_heads(self):
+        client = Mock()
+        client.append_to_stream = AsyncMock()
+        client.get_current_version = AsyncMock()
+        eventstore = _eventstore(client)
+
+        await eventstore.append_async("parcel-1", [EventDescriptor("shipped", ParcelShippedEvent("1"))] * 2)
+        await eventstore.append_async("parcel-1", [EventDescriptor("shipped", ParcelShippedEvent("1"))] * 3, expected_version=2)
+
+        assert await eventstore.get_stream_head_async("parcel-1") == 4
+        client.get_current_version.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_conflicts_and_deletions_evict_stream_heads(self):
+        client = Mock()
+        client.append_to_stream = AsyncMock(side_effect=[None, WrongCurrentVersionError(), None])
+        client.delete_stream = AsyncMock()
+        client.get_current_version = AsyncMock(return_value=StreamState.NO_STREAM)
+        eventstore = _eventstore(client)
+        events = [EventDescriptor("shipped", ParcelShippedEvent("1"))]
+
+        await eventstore.append_async("parcel-1", events)
+        with pytest.raises(WrongCurrentVersionError):
+            await eventstore.append_async("parcel-1", events, expected_version=5)
+        assert not await eventstore.contains_async("parcel-1")
+        await eventstore.append_async("parcel-2", events)
+        await eventstore.delete_async("parcel-2")
+
+        assert not await eventstore.contains_async("parcel-2")
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_stream_heads_are_evicted(self):
+        client = Mock()
+        client.append_to_stream = AsyncMock()
+        client.get_current_version = AsyncMock(return_value=0)
+        eventstore = _eventstore(client, stream_head_cache_size=2)
+        events = [EventDescriptor("shipped", ParcelShippedEvent("1"))]
+
+        await eventstore.append_async("parcel-1", events)
+        await eventstore.append_async("parcel-2", events)
+        await eventstore.contains_async("parcel-1")
+        await eventstore.append_async("parcel-3", events)
+
+        assert list(eventstore._stream_heads) == ["test_app-parcel-1", "test_app-parcel-3"]
+
+
+class TestEventSourcingRepositoryContains:
+    @pytest.mark.asyncio
+    async def test_contains_async_checks_stream_existence(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("test", "test-group"))
+        repository = EventSourcingRepository[User, str](eventstore, Aggregator())
+        await eventstore.append_async("user-1", [EventDescriptor("shipped", ParcelShippedEvent("1"))])
+
+        assert await repository.contains_async("1")
+        assert not await repository.contains_async("2")
@@ -0,0 +1,78 @@
+"""
+Tests for the event type resolution of the ESEventStore.
+
+This test suite verifies that:
+1. Recorded events are decoded into instances of the type named by their metadata
+2. The module of an event type is imported only the first time the type is decoded
+3. Event types appended by the store are decoded without importing their module
+"""
+
+import builtins
+from dataclasses import dataclass
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from kurrentdbclient import RecordedEvent
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import EventStoreOptions
+from neuroglia.data.infrastructure.event_sourcing.event_store.event_store import (
+    ESEventStore,
+)
+from neuroglia.serialization import JsonSerializer
+
+
+@dataclass
+class ItemAddedEvent:
+    item_id: str
+    quantity: int
+
+
+def _recorded_event(store: ESEventStore, offset: int, type_name: str) -> RecordedEvent:
+    e = Mock(spec=RecordedEvent)
+    e.id = uuid4()
+    e.type = "item-added"
+    e.stream_name = "test_app-cart-1"
+    e.stream_position = offset
+    e.commit_position = offset
+    e.recorded_at = None
+    e.data = store._serializer.serialize_to_text(ItemAddedEvent(f"item-{offset}", offset)).encode()
+    e.metadata = store._serializer.serialize_to_text({store._metadata_type: type_name}).encode()
+    return e
+
+
+def _decode_all(store: ESEventStore, events: list[RecordedEvent]) -> tuple[list, list[str]]:
+    imported_modules: list[str] = []
+    real_import = builtins.__import__
+
+    def tracking_import(name, *args, **kwargs):
+        imported_modules.append(name)
+        return real_import(name, *args, **kwargs)
+
+    with patch("builtins.__import__", side_effect=tracking_import):
+        records = [store._decode_recorded_event("cart-1", e) for e in events]
+    return records, imported_modules
+
+
+class TestESEventStoreTypeResolution:
+    def setup_method(self):
+        self.store = ESEventStore(EventStoreOptions("test_app", "test_group"), Mock(), JsonSerializer())
+        self.type_name = f"{ItemAddedEvent.__module__}.{ItemAddedEvent.__name__}"
+
+    def test_event_type_module_is_imported_once(self):
+        events = [_recorded_event(self.store, offset, self.type_name) for offset in range(50)]
+
+        records, imported_modules = _decode_all(self.store, events)
+
+        assert [type(r.data) for r in records] == [ItemAddedEvent] * 50
+        assert records[49].data == ItemAddedEvent("item-49", 49)
+        assert imported_modules.count(ItemAddedEvent.__module__) == 1
+
+    def test_appended_event_types_are_resolved_without_import(self):
+        metadata = self.store._build_event_metadata(ItemAddedEvent("item-1", 1), {"correlation_id": "abc"})
+        events = [_recorded_event(self.store, offset, metadata[self.store._metadata_type]) for offset in range(3)]
+
+        records, imported_modules = _decode_all(self.store, events)
+
+        assert metadata == {self.store._metadata_type: self.type_name, "correlation_id": "abc"}
+        assert ItemAddedEvent.__module__ not in imported_modules
+        assert records[0].data == ItemAddedEvent("item-0", 0)
@@ -0,0 +1,137 @@
+"""
+Tests for the upcasting of recorded events.
+
+This test suite verifies that:
+1. EventUpcasterRegistry composes the upcasters bringing a recorded version up to the current one, once per type and version
+2. Up-to-date events are not upcast, and missing or duplicate upcasters are rejected
+3. ESEventStore records the current version of appended events, and upcasts events recorded with previous versions when decoding them
+4. FileEventStore upcasts events recorded with previous versions when replaying its segments
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from kurrentdbclient import RecordedEvent
+
+from neuroglia.data.infrastructure.event_sourcing import (
+    EventDescriptor,
+    EventStoreOptions,
+    EventUpcasterRegistry,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import FileEventStore
+from neuroglia.data.infrastructure.event_sourcing.event_store.event_store import (
+    ESEventStore,
+)
+from neuroglia.serialization import JsonSerializer
+
+
+@dataclass
+class OrderPlacedEvent:
+    order_id: str
+    total: Decimal
+    currency: str
+
+
+ORDER_PLACED = f"{OrderPlacedEvent.__module__}.{OrderPlacedEvent.__name__}"
+
+
+class CountingUpcaster:
+    def __init__(self, transform):
+        self.transform = transform
+        self.calls = 0
+
+    def __call__(self, data: dict) -> dict:
+        self.calls += 1
+        return self.transform(data)
+
+
+def _upcasters() -> EventUpcasterRegistry:
+    # v1: {"id", "amount"} -> v2: {"order_id", "amount"} -> v3: {"order_id", "total", "currency"}
+    return EventUpcasterRegistry().register(OrderPlacedEvent, 1, lambda data: {"order_id": data["id"], "amount": data["amount"]}).register(ORDER_PLACED, 2, lambda data: {"order_id": data["order_id"], "total": data["amount"], "currency": "EUR"})
+
+
+def _recorded_event(store: ESEventStore, data: dict, metadata: dict) -> RecordedEvent:
+    e = Mock(spec=RecordedEvent)
+    e.id = uuid4()
+    e.type = "order-placed"
+    e.stream_position = 0
+    e.commit_position = 0
+    e.recorded_at = None
+    e.data = store._serializer.serialize_to_text(data).encode()
+    e.metadata = store._serializer.serialize_to_text(metadata).encode()
+    return e
+
+
+class TestEventUpcasterRegistry:
+    def test_composes_and_caches_chains(self):
+        first, second = CountingUpcaster(lambda data: {**data, "v": 2}), CountingUpcaster(lambda data: {**data, "v": 3})
+        upcasters = EventUpcasterRegistry().register(OrderPlacedEvent, 1, first).register(OrderPlacedEvent, 2, second)
+
+        chain = upcasters.get_chain(ORDER_PLACED, 1)
+
+        assert upcasters.get_version(OrderPlacedEvent) == 3
+        assert upcasters.get_chain(ORDER_PLACED, 1) is chain
+        assert upcasters.get_chain(ORDER_PLACED, 2) is second
+        assert upcasters.upcast(ORDER_PLACED, 1, {"v": 1}) == {"v": 3}
+        assert (first.calls, second.calls) == (1, 1)
+
+    def test_up_to_date_events_are_not_upcast(self):
+        upcasters = _upcasters()
+
+        assert upcasters.get_chain(ORDER_PLACED, 3) is None
+        assert upcasters.get_chain("orders.OrderCancelledEvent", 1) is None
+        assert upcasters.get_version("orders.OrderCancelledEvent") == 1
+
+    def test_rejects_missing_and_duplicate_upcasters(self):
+        upcasters = EventUpcasterRegistry().register(OrderPlacedEvent, 2, lambda data: data)
+
+        with pytest.raises(ValueError):
+            upcasters.get_chain(ORDER_PLACED, 1)
+        with pytest.raises(ValueError):
+            upcasters.register(ORDER_PLACED, 2, lambda data: data)
+        with pytest.raises(ValueError):
+            upcasters.register(ORDER_PLACED, 0, lambda data: data)
+
+
+class TestESEventStoreUpcasting:
+    def setup_method(self):
+        self.store = ESEventStore(EventStoreOptions("test_app", "test_group"), Mock(), JsonSerializer(), upcasters=_upcasters())
+
+    def test_appended_events_record_current_version(self):
+        metadata = self.store._build_event_metadata(OrderPlacedEvent("order-1", Decimal("10.5"), "EUR"), None)
+
+        assert metadata == {self.store._metadata_type: ORDER_PLACED, self.store._metadata_schema_version: 3}
+
+    def test_decodes_previous_versions_into_current_type(self):
+        v1 = _recorded_event(self.store, {"id": "order-1", "amount": "10.5"}, {self.store._metadata_type: ORDER_PLACED})
+        v2 = _recorded_event(self.store, {"order_id": "order-2", "amount": "4"}, {self.store._metadata_type: ORDER_PLACED, self.store._metadata_schema_version: 2})
+        v3 = _recorded_event(self.store, {"order_id": "order-3", "total": "7", "currency": "USD"}, self.store._build_event_metadata(OrderPlacedEvent("order-3", Decimal(7), "USD"), None))
+
+        records = [self.store._decode_recorded_event("order", e) for e in (v1, v2, v3)]
+
+        assert [r.data for r in records] == [OrderPlacedEvent("order-1", Decimal("10.5"), "EUR"), OrderPlacedEvent("order-2", Decimal(4), "EUR"), OrderPlacedEvent("order-3", Decimal(7), "USD")]
+
+
+class TestFileEventStoreUpcasting:
+    @pytest.mark.asyncio
+    async def test_replays_previous_versions_into_current_type(self):
+        options = EventStoreOptions("test", "test-group")
+        legacy_entry = {"stream_name": "test-order-1", "stream_id": "order-1", "id": "1", "offset": 0, "position": 0, "timestamp": "2024-01-01T00:00:00+00:00", "type": "order-placed", "data_type": ORDER_PLACED, "data": {"id": "order-1", "amount": 3}, "metadata": None}
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(f"{directory}/segments")
+            with open(f"{directory}/segments/00000000.jsonl", "w", encoding="utf-8") as file:
+                file.write(json.dumps(legacy_entry) + "\n")
+
+            store = FileEventStore(options, directory, upcasters=_upcasters())
+            await store.append_async("order-2", [EventDescriptor("order-placed", OrderPlacedEvent("order-2", Decimal(5), "USD"))])
+            reopened_store = FileEventStore(options, directory, upcasters=_upcasters())
+            records = await reopened_store.read_async("$ce-test", StreamReadDirection.FORWARDS, 0)
+
+        assert [r.data for r in records] == [OrderPlacedEvent("order-1", Decimal(3), "EUR"), OrderPlacedEvent("order-2", Decimal(5), "USD")]
@@ -0,0 +1,111 @@
+"""
+Tests for the strict schema mode and inference counters of JsonSerializer.
+
+This test suite verifies that:
+1. Types marked with @strict_schema skip heuristic inference for unannotated fields
+2. The global strict_schema option disables inference for all types
+3. Annotated fields are still deserialized according to their type hints
+4. Inference hits are counted per type and field, up to a maximum number of fields, and can be reset
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from neuroglia.serialization.json import JsonSerializer, strict_schema
+
+
+class InvoiceStatus(Enum):
+    DRAFT = "draft"
+    SENT = "sent"
+
+
+class UntypedInvoice:
+    """Class without annotations for its dynamic fields - relies on inference."""
+
+    id: str
+
+
+@strict_schema
+class StrictInvoice:
+    """Class marked as strict - undeclared fields are kept as plain JSON values."""
+
+    id: str
+    status: InvoiceStatus
+
+
+PAYLOAD = json.dumps({"id": "inv-1", "status": "SENT", "total": "12.50", "issued_at": "2025-01-01T10:00:00"})
+
+
+class TestStrictSchema:
+    @pytest.fixture
+    def serializer(self) -> JsonSerializer:
+        return JsonSerializer()
+
+    def test_inference_applies_to_non_strict_types(self, serializer: JsonSerializer):
+        invoice = serializer.deserialize_from_text(PAYLOAD, UntypedInvoice)
+
+        assert invoice.total == Decimal("12.50")
+        assert isinstance(invoice.issued_at, datetime)
+
+    def test_strict_type_skips_inference(self, serializer: JsonSerializer):
+        invoice = serializer.deserialize_from_text(PAYLOAD, StrictInvoice)
+
+        assert invoice.status == InvoiceStatus.SENT
+        assert invoice.total == "12.50"
+        assert invoice.issued_at == "2025-01-01T10:00:00"
+
+    def test_global_strict_schema_skips_inference(self):
+        serializer = JsonSerializer(strict_schema=True)
+
+        invoice = serializer.deserialize_from_text(PAYLOAD, UntypedInvoice)
+
+        assert invoice.id == "inv-1"
+        assert invoice.total == "12.50"
+        assert invoice.issued_at == "2025-01-01T10:00:00"
+        assert serializer.get_inference_statistics() == {}
+
+
+class TestInferenceStatistics:
+    def test_inference_hits_are_counted_per_field(self):
+        serializer = JsonSerializer()
+
+        serializer.deserialize_from_text(PAYLOAD, UntypedInvoice)
+        serializer.deserialize_from_text(PAYLOAD, UntypedInvoice)
+
+        statistics = serializer.get_inference_statistics()
+        prefix = f"{UntypedInvoice.__module__}.{UntypedInvoice.__qualname__}"
+        assert statistics[f"{prefix}.total"] == 2
+        assert statistics[f"{prefix}.issued_at"] == 2
+        assert statistics[f"{prefix}.status"] == 2
+        assert f"{prefix}.id" not in statistics
+
+    def test_number_of_tracked_fields_is_bounded(self):
+        serializer = JsonSerializer()
+        serializer.max_inference_statistics = 2
+
+        serializer.deserialize_from_text(PAYLOAD, UntypedInvoice)
+        serializer.deserialize_from_text(json.dumps({f"key_{i}": str(i) for i in range(50)}), UntypedInvoice)
+
+        statistics = serializer.get_inference_statistics()
+        assert len(statistics) == 3
+        assert sum(statistics.values()) == 53
+        assert statistics["<other>"] == 51
+
+    def test_strict_types_are_not_counted(self):
+        serializer = JsonSerializer()
+
+        serializer.deserialize_from_text(PAYLOAD, StrictInvoice)
+
+        assert serializer.get_inference_statistics() == {}
+
+    def test_reset_inference_statistics(self):
+        serializer = JsonSerializer()
+        serializer.deserialize_from_text(PAYLOAD, UntypedInvoice)
+
+        serializer.reset_inference_statistics()
+
+        assert serializer.get_inference_statistics() == {}
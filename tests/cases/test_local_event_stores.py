@@ -0,0 +1,286 @@
+"""
+Tests for the InMemoryEventStore and FileEventStore.
+
+This test suite verifies that:
+1. Events are appended with optimistic concurrency checks
+2. Streams and '$ce-' category streams are read forwards and backwards from an offset
+3. Catch-up subscriptions replay recorded events then tail live ones
+4. Consumer groups share events between consumers, and redeliver nacked events
+5. The FileEventStore reloads segments, stream deletions and consumer group checkpoints, truncating a torn last entry
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, DomainEvent
+from neuroglia.data.exceptions import OptimisticConcurrencyException
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    Aggregator,
+    EventDescriptor,
+    EventStoreOptions,
+    StreamReadDirection,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_sourcing_repository import (
+    EventSourcingRepository,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import (
+    FileEventStore,
+    InMemoryEventStore,
+)
+
+
+class CounterIncrementedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, amount: int):
+        super().__init__(aggregate_id)
+        self.amount = amount
+
+
+class CounterState(AggregateState[str]):
+    id: str
+    value: int
+
+    def __init__(self):
+        super().__init__()
+        self.id = ""
+        self.value = 0
+
+    def on(self, e: CounterIncrementedDomainEvent):
+        self.id = e.aggregate_id
+        self.value += e.amount
+
+
+class Counter(AggregateRoot[CounterState, str]):
+    def __init__(self, counter_id: str = "counter-1"):
+        super().__init__()
+        self.state.id = counter_id
+
+    def increment(self, amount: int = 1) -> None:
+        self.state.on(self.register_event(CounterIncrementedDomainEvent(self.id(), amount)))
+
+
+def _events(aggregate_id: str, *amounts: int) -> list[EventDescriptor]:
+    return [EventDescriptor("counterincremented", CounterIncrementedDomainEvent(aggregate_id, amount)) for amount in amounts]
+
+
+async def _collect_async(observable, count: int, on_next=None) -> list[Any]:
+    received: list[Any] = []
+    done = asyncio.Event()
+
+    def handle(e):
+        received.append(e)
+        if on_next is not None:
+            on_next(e)
+        if len(received) >= count:
+            done.set()
+
+    subscription = observable.subscribe(handle)
+    await asyncio.wait_for(done.wait(), timeout=2)
+    subscription.dispose()
+    return received
+
+
+@pytest.fixture(params=["memory", "file"])
+def eventstore(request, tmp_path) -> InMemoryEventStore:
+    options = EventStoreOptions("test", "test-group")
+    return InMemoryEventStore(options) if request.param == "memory" else FileEventStore(options, str(tmp_path), segment_size=3)
+
+
+class TestLocalEventStores:
+    @pytest.mark.asyncio
+    async def test_append_and_read_forwards(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1, 2, 3))
+
+        records = await eventstore.read_async("counter-1", StreamReadDirection.FORWARDS, 1)
+
+        assert [r.offset for r in records] == [1, 2]
+        assert [r.data.amount for r in records] == [2, 3]
+        assert records[0].stream_id == "counter-1"
+
+    @pytest.mark.asyncio
+    async def test_read_backwards_from_offset(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1, 2, 3, 4))
+
+        records = await eventstore.read_async("counter-1", StreamReadDirection.BACKWARDS, 2, 2)
+
+        assert [r.offset for r in records] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_append_checks_expected_version(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1))
+
+        with pytest.raises(OptimisticConcurrencyException):
+            await eventstore.append_async("counter-1", _events("1", 2))
+        with pytest.raises(OptimisticConcurrencyException):
+            await eventstore.append_async("counter-1", _events("1", 2), expected_version=0)
+        await eventstore.append_async("counter-1", _events("1", 2), expected_version=1)
+
+        descriptor = await eventstore.get_async("counter-1")
+        assert descriptor.length == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_check_expected_version(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1))
+
+        results = await asyncio.gather(*(eventstore.append_async("counter-1", _events("1", amount), expected_version=1) for amount in (2, 3)), return_exceptions=True)
+
+        assert results[0] is None and isinstance(results[1], OptimisticConcurrencyException)
+        records = await eventstore.read_async("counter-1", StreamReadDirection.FORWARDS, 0)
+        assert [(r.offset, r.data.amount) for r in records] == [(0, 1), (1, 2)]
+
+    @pytest.mark.asyncio
+    async def test_read_category_stream(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1))
+        await eventstore.append_async("counter-2", _events("2", 2))
+        await eventstore.append_async("counter-1", _events("1", 3), expected_version=1)
+
+        records = await eventstore.read_async("$ce-test", StreamReadDirection.FORWARDS, 0)
+
+        assert [(r.stream_id, r.data.amount) for r in records] == [("counter-1", 1), ("counter-2", 2), ("counter-1", 3)]
+        assert [r.position for r in records] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_deleted_streams_are_excluded_from_category_streams(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1))
+        await eventstore.append_async("counter-2", _events("2", 2))
+
+        await eventstore.delete_async("counter-1")
+
+        assert not await eventstore.contains_async("counter-1")
+        assert [r.stream_id for r in await eventstore.read_async("$ce-test", StreamReadDirection.FORWARDS, 0)] == ["counter-2"]
+
+    @pytest.mark.asyncio
+    async def test_catch_up_subscription_tails_live_events(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1, 2))
+        observable = await eventstore.observe_async("counter-1", offset=1)
+
+        collecting = asyncio.ensure_future(_collect_async(observable, 3))
+        await asyncio.sleep(0.01)
+        await eventstore.append_async("counter-1", _events("1", 3, 4), expected_version=2)
+        received = await collecting
+
+        assert [e.data.amount for e in received] == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_redelivers_nacked_events(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", 1, 2))
+        observable = await eventstore.observe_async("$ce-test", "projections")
+        nacked = []
+
+        def on_next(e):
+            if e.data.amount == 1 and not nacked:
+                nacked.append(e)
+                asyncio.ensure_future(e.nack_async())
+            else:
+                asyncio.ensure_future(e.ack_async())
+
+        received = await _collect_async(observable, 3, on_next)
+
+        assert [(e.data.amount, e.replayed) for e in received] == [(1, False), (2, False), (1, True)]
+        await asyncio.sleep(0)
+        assert eventstore.get_consumer_group("$ce-test", "projections").checkpoint == 2
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_shares_events_between_consumers(self, eventstore: InMemoryEventStore):
+        await eventstore.append_async("counter-1", _events("1", *range(10)))
+        first = await eventstore.observe_async("$ce-test", "projections")
+        second = await eventstore.observe_async("$ce-test", "projections")
+        eventstore.get_consumer_group("$ce-test", "projections").buffer_size = 1
+        received: list[int] = []
+
+        def on_next(e):
+            received.append(e.data.amount)
+            asyncio.ensure_future(e.ack_async())
+
+        subscriptions = [first.subscribe(on_next), second.subscribe(on_next)]
+        for _ in range(100):
+            if len(received) == 10:
+                break
+            await asyncio.sleep(0.001)
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        assert sorted(received) == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_event_sourcing_repository_round_trip(self, eventstore: InMemoryEventStore):
+        repository = EventSourcingRepository[Counter, str](eventstore, Aggregator())
+        counter = Counter()
+        counter.increment(2)
+        await repository.add_async(counter)
+
+        counter = await repository.get_async("counter-1")
+        counter.increment(3)
+        await repository.update_async(counter)
+        counter = await repository.get_async("counter-1")
+
+        assert counter.state.value == 5
+        assert counter.state.state_version == 2
+
+
+class TestFileEventStore:
+    @pytest.mark.asyncio
+    async def test_events_and_deletions_are_reloaded(self, tmp_path):
+        options = EventStoreOptions("test", "test-group")
+        eventstore = FileEventStore(options, str(tmp_path), segment_size=2)
+        await eventstore.append_async("counter-1", _events("1", 1, 2, 3))
+        await eventstore.append_async("counter-2", _events("2", 4))
+        await eventstore.delete_async("counter-2")
+
+        reloaded = FileEventStore(options, str(tmp_path), segment_size=2)
+        await reloaded.append_async("counter-1", _events("1", 5), expected_version=3)
+
+        records = await reloaded.read_async("counter-1", StreamReadDirection.FORWARDS, 0)
+        assert [(r.offset, r.data.amount) for r in records] == [(0, 1), (1, 2), (2, 3), (3, 5)]
+        assert isinstance(records[0].data, CounterIncrementedDomainEvent)
+        assert not await reloaded.contains_async("counter-2")
+        assert records[-1].position == 4
+        assert len(list((tmp_path / "segments").glob("*.jsonl"))) == 3
+
+    @pytest.mark.asyncio
+    async def test_torn_last_entry_is_truncated(self, tmp_path, caplog):
+        options = EventStoreOptions("test", "test-group")
+        eventstore = FileEventStore(options, str(tmp_path), segment_size=2)
+        await eventstore.append_async("counter-1", _events("1", 1, 2, 3))
+        segment_file = tmp_path / "segments" / "00000001.jsonl"
+        size = segment_file.stat().st_size
+        with open(segment_file, "a", encoding="utf-8") as file:
+            file.write('{"stream_name": "test-counter-1", "stream_id": "coun')
+
+        reloaded = FileEventStore(options, str(tmp_path), segment_size=2)
+        await reloaded.append_async("counter-1", _events("1", 4), expected_version=3)
+        records = await FileEventStore(options, str(tmp_path), segment_size=2).read_async("counter-1", StreamReadDirection.FORWARDS, 0)
+
+        assert "torn last entry" in caplog.text
+        assert segment_file.stat().st_size > size
+        assert [(r.offset, r.data.amount) for r in records] == [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+    @pytest.mark.asyncio
+    async def test_corrupted_entries_are_not_truncated(self, tmp_path):
+        options = EventStoreOptions("test", "test-group")
+        eventstore = FileEventStore(options, str(tmp_path), segment_size=2)
+        await eventstore.append_async("counter-1", _events("1", 1, 2, 3))
+        segment_file = tmp_path / "segments" / "00000000.jsonl"
+        segment_file.write_text("corrupted\n" + segment_file.read_text(encoding="utf-8"), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="line 1 is corrupted"):
+            FileEventStore(options, str(tmp_path), segment_size=2)
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_resumes_from_checkpoint(self, tmp_path):
+        options = EventStoreOptions("test", "test-group")
+        eventstore = FileEventStore(options, str(tmp_path))
+        await eventstore.append_async("counter-1", _events("1", 1, 2, 3))
+
+        def ack(e):
+            if e.data.amount < 3:
+                asyncio.ensure_future(e.ack_async())
+
+        await _collect_async(await eventstore.observe_async("$ce-test", "projections"), 3, ack)
+        await asyncio.sleep(0.01)
+
+        reloaded = FileEventStore(options, str(tmp_path))
+        received = await _collect_async(await reloaded.observe_async("$ce-test", "projections"), 1)
+
+        assert received[0].data.amount == 3
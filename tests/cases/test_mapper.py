@@ -206,5 +206,224 @@ class TestMapper(unittest.TestCase):
         self.assertIsInstance(destination.status, TestEnum)
 
 
+class TestMapperPlans(unittest.TestCase):
+    """Test cases for the compiled type map plans of the Mapper"""
+
+    def test_plan_is_compiled_once(self):
+        """Test that mapping many instances reuses the same compiled plan"""
+        # Arrange
+        config = MapperConfiguration()
+        config.create_map(SourceClass, DestinationClass)
+        mapper = Mapper(config)
+        type_map = mapper.get_type_map(SourceClass, DestinationClass)
+
+        # Act
+        mapper.map(SourceClass(), DestinationClass)
+        plan = type_map.get_plan()
+        destinations = [mapper.map(SourceClass(name=f"name {i}"), DestinationClass) for i in range(100)]
+
+        # Assert
+        self.assertIs(plan, type_map.get_plan())
+        self.assertEqual(plan.declared_attributes, frozenset({"id", "name", "value"}))
+        self.assertEqual(destinations[42].name, "name 42")
+
+    def test_plan_is_recompiled_when_members_are_configured(self):
+        """Test that configuring a member after a first mapping is taken into account"""
+        # Arrange
+        config = MapperConfiguration()
+        mapping = config.create_map(SourceClass, DestinationClass)
+        mapper = Mapper(config)
+        mapper.map(SourceClass(), DestinationClass)
+
+        # Act
+        mapping.for_member("name", lambda ctx: ctx.source_member_value.upper()).ignore_member("value")
+        destination = mapper.map(SourceClass(name="mario"), DestinationClass)
+
+        # Assert
+        self.assertEqual(destination.name, "MARIO")
+        self.assertFalse(hasattr(destination, "value"))
+
+    def test_type_maps_added_after_first_mapping_are_indexed(self):
+        """Test that type maps created after the mapper was first used are found"""
+        # Arrange
+        config = MapperConfiguration()
+        mapper = Mapper(config)
+        with self.assertRaises(Exception):
+            mapper.map(SourceClass(), DestinationClass)
+
+        # Act
+        config.create_map(SourceClass, DestinationClass)
+        destination = mapper.map(SourceClass(name="luigi"), DestinationClass)
+
+        # Assert
+        self.assertEqual(destination.name, "luigi")
+
+
+class SlottedSource:
+    """Source class without __dict__, which cannot use the compiled path"""
+
+    __slots__ = ("id", "name", "value")
+
+    def __init__(self):
+        self.id = "slotted"
+        self.name = "slotted name"
+        self.value = 7
+
+
+class TestCompiledMapper(unittest.TestCase):
+    """Test cases for the code-generated mapping functions"""
+
+    def _map_both_ways(self, configure, source):
+        results = []
+        for compiled in (False, True):
+            config = MapperConfiguration()
+            mapping = config.create_map(type(source), DestinationClass)
+            configure(mapping)
+            if compiled:
+                mapping.compile()
+            results.append(Mapper(config).map(source, DestinationClass))
+        return results
+
+    def test_compiled_map_is_generated(self):
+        """Test that compiling a type map generates a mapping function"""
+        # Arrange
+        config = MapperConfiguration()
+        config.create_map(SourceClass, DestinationClass).compile()
+        mapper = Mapper(config)
+
+        # Act
+        destination = mapper.map(SourceClass(name="mario"), DestinationClass)
+
+        # Assert
+        self.assertIsNotNone(mapper.get_type_map(SourceClass, DestinationClass).get_plan().compiled_map)
+        self.assertEqual(destination.name, "mario")
+
+    def test_compiled_map_matches_interpreted_map(self):
+        """Test that compiled and interpreted mappings produce the same attributes"""
+        # Arrange
+        source = SourceClass(name="mario")
+        source.extra = "not declared"
+        source._private = "hidden"
+
+        def configure(mapping):
+            mapping.for_member("name", lambda ctx: ctx.source_member_value.upper())
+            mapping.for_member("computed", lambda ctx: f"{ctx.source.name}-{ctx.source.value}")
+            mapping.ignore_member("value")
+
+        # Act
+        interpreted, compiled = self._map_both_ways(configure, source)
+
+        # Assert
+        self.assertEqual(interpreted.__dict__, compiled.__dict__)
+        self.assertEqual(compiled.name, "MARIO")
+        self.assertEqual(compiled.computed, "mario-42")
+        self.assertFalse(hasattr(compiled, "value"))
+
+    def test_compiled_map_is_regenerated_when_converter_changes(self):
+        """Test that replacing a member converter after a first mapping is taken into account"""
+        # Arrange
+        config = MapperConfiguration()
+        mapping = config.create_map(SourceClass, DestinationClass).compile()
+        mapping.for_member("name", lambda ctx: ctx.source_member_value.upper())
+        mapper = Mapper(config)
+        mapper.map(SourceClass(), DestinationClass)
+
+        # Act
+        mapping.for_member("name", lambda ctx: ctx.source_member_value.title())
+        destination = mapper.map(SourceClass(name="luigi mario"), DestinationClass)
+
+        # Assert
+        self.assertEqual(destination.name, "Luigi Mario")
+
+    def test_compiled_map_falls_back_for_sources_without_dict(self):
+        """Test that sources without __dict__ use the interpreted path"""
+        # Arrange
+        config = MapperConfiguration()
+        config.create_map(SlottedSource, DestinationClass).compile()
+
+        # Act
+        destination = Mapper(config).map(SlottedSource(), DestinationClass)
+
+        # Assert
+        self.assertEqual(destination.__dict__, {})
+
+    def test_compile_from_profile(self):
+        """Test that compiling a map declared in a mapping profile is applied to the mapper configuration"""
+
+        # Arrange
+        class CompiledProfile(MappingProfile):
+            def __init__(self):
+                super().__init__()
+                self.create_map(SourceClass, DestinationClass).compile()
+
+        config = CompiledProfile().apply_to(MapperConfiguration())
+
+        # Act
+        mapper = Mapper(config)
+        destination = mapper.map(SourceClass(name="peach"), DestinationClass)
+
+        # Assert
+        self.assertTrue(mapper.get_type_map(SourceClass, DestinationClass).compiled)
+        self.assertEqual(destination.name, "peach")
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestMapperBatches(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the batch mapping API of the Mapper"""
+
+    def setUp(self):
+        config = MapperConfiguration()
+        config.create_map(SourceClass, DestinationClass)
+        self.mapper = Mapper(config)
+
+    def test_map_many_matches_map(self):
+        """Test that mapping a batch yields the same results as mapping each item"""
+        # Arrange
+        sources = [SourceClass(name=f"name {i}", value=i + 1) for i in range(50)]
+
+        # Act
+        destinations = self.mapper.map_many(sources, DestinationClass)
+
+        # Assert
+        self.assertEqual([d.__dict__ for d in destinations], [self.mapper.map(s, DestinationClass).__dict__ for s in sources])
+
+    def test_map_many_handles_heterogeneous_items(self):
+        """Test that None, instances of the destination type and mapped sources can be mixed"""
+        # Arrange
+        existing = DestinationClass()
+
+        # Act
+        destinations = self.mapper.map_many([None, existing, SourceClass(name="mario")], DestinationClass)
+
+        # Assert
+        self.assertIsNone(destinations[0])
+        self.assertIs(destinations[1], existing)
+        self.assertEqual(destinations[2].name, "mario")
+
+    def test_map_many_raises_for_unmapped_types(self):
+        """Test that a missing type map is reported like map() does"""
+        with self.assertRaises(Exception):
+            self.mapper.map_many([SourceWithEnum("1", "test", TestEnum.FIRST)], DestinationClass)
+
+    def test_map_to_parameterized_list(self):
+        """Test that lists are mapped to parameterized list types"""
+        # Act
+        destinations = self.mapper.map([SourceClass(name="luigi")], list[DestinationClass])
+
+        # Assert
+        self.assertIsInstance(destinations[0], DestinationClass)
+        self.assertEqual(destinations[0].name, "luigi")
+
+    async def test_map_many_async_maps_chunks_in_order(self):
+        """Test that large batches are mapped in chunks while preserving the order of items"""
+        # Arrange
+        sources = [SourceClass(name=f"name {i}") for i in range(25)]
+
+        # Act
+        destinations = await self.mapper.map_many_async(iter(sources), DestinationClass, chunk_size=4)
+
+        # Assert
+        self.assertEqual([d.name for d in destinations], [f"name {i}" for i in range(25)])
@@ -0,0 +1,96 @@
+"""
+Test suite for the MessagePackSerializer.
+
+This test suite validates that the MessagePackSerializer round-trips values with the
+same type plan as the JsonSerializer (enums, datetimes, Decimals, nested dataclasses,
+aggregates) while producing smaller payloads.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState
+from neuroglia.serialization.json import JsonSerializer
+from neuroglia.serialization.message_pack import MessagePackSerializer
+
+
+class ResourceStatus(Enum):
+    PENDING = "pending"
+    READY = "ready"
+
+
+@dataclass
+class ResourceSlot:
+    name: str
+    capacity: int
+    cost: Decimal
+
+
+class LabResourceState(AggregateState[str]):
+    id: str
+    status: ResourceStatus
+    provisioned_at: datetime
+    slots: list[ResourceSlot]
+
+    def __init__(self):
+        super().__init__()
+        self.id = ""
+        self.status = ResourceStatus.PENDING
+        self.provisioned_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.slots = []
+
+
+class LabResource(AggregateRoot[LabResourceState, str]):
+    def __init__(self, id: str = "lab-1"):
+        super().__init__()
+        self.state.id = id
+        self.state.status = ResourceStatus.READY
+        self.state.slots = [ResourceSlot(f"slot-{i}", i, Decimal(f"{i}.50")) for i in range(50)]
+
+
+class TestMessagePackSerializer:
+    @pytest.fixture
+    def serializer(self) -> MessagePackSerializer:
+        return MessagePackSerializer()
+
+    def test_round_trip_dataclass(self, serializer: MessagePackSerializer):
+        slot = ResourceSlot("slot-1", 4, Decimal("12.50"))
+
+        restored = serializer.deserialize(serializer.serialize(slot), ResourceSlot)
+
+        assert restored == slot
+        assert isinstance(restored.cost, Decimal)
+
+    def test_round_trip_aggregate(self, serializer: MessagePackSerializer):
+        resource = LabResource()
+
+        restored = serializer.deserialize(serializer.serialize(resource), LabResource)
+
+        assert isinstance(restored, LabResource)
+        assert restored.state.id == "lab-1"
+        assert restored.state.status == ResourceStatus.READY
+        assert restored.state.provisioned_at == resource.state.provisioned_at
+        assert restored.state.slots == resource.state.slots
+        assert restored.domain_events == []
+
+    def test_payload_matches_json_type_plan(self, serializer: MessagePackSerializer):
+        resource = LabResource()
+        json_serializer = JsonSerializer()
+
+        restored = serializer.deserialize(serializer.serialize(resource), None)
+
+        assert restored == json_serializer.deserialize_from_text(json_serializer.serialize_to_text(resource))
+
+    def test_payload_is_smaller_than_json(self, serializer: MessagePackSerializer):
+        resource = LabResource()
+
+        assert len(serializer.serialize(resource)) < len(JsonSerializer().serialize(resource))
+
+    def test_deserialize_without_expected_type_returns_plain_values(self, serializer: MessagePackSerializer):
+        assert serializer.deserialize(serializer.serialize({"a": [1, 2, 3]}), None) == {"a": [1, 2, 3]}
@@ -0,0 +1,174 @@
+"""
+Tests for the translation of queryable predicates into native MongoDB query filters.
+
+This test suite verifies that:
+1. MongoExpressionTranslator translates comparisons, membership tests, boolean operators and string methods
+   on (nested) fields into native MongoDB query operators
+2. Constants are encoded the way entities are stored, and fields stored as strings, such as Decimals, are not compared natively
+3. MotorQueryBuilder combines the translated where clauses, and falls back to a logged '$where' clause
+   for predicates that cannot be translated natively
+"""
+
+import ast
+import logging
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from neuroglia.data.infrastructure.mongo.motor_query import (
+    MotorQueryBuilder,
+    MotorQueryProvider,
+)
+from neuroglia.expressions import MongoExpressionTranslator
+from neuroglia.expressions.javascript_expression_translator import (
+    JavaScriptExpressionTranslator,
+)
+from neuroglia.serialization.json import JsonSerializer
+
+
+class OrderStatus(Enum):
+    PENDING = "PENDING"
+    SHIPPED = "SHIPPED"
+
+
+@dataclass
+class Address:
+    city: str
+
+
+@dataclass
+class Order:
+    id: str
+    customer: str
+    status: OrderStatus
+    total: float
+    tags: list[str]
+    address: Optional[Address] = None
+    price: Optional[Decimal] = None
+
+
+def _lambda(source: str) -> ast.Lambda:
+    return ast.parse(source).body[0].value
+
+
+def _translate(source: str) -> dict:
+    return MongoExpressionTranslator(Order).translate(_lambda(source))
+
+
+class TestMongoExpressionTranslator:
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("lambda o: o.total > 10", {"total": {"$gt": 10}}),
+            ("lambda o: 10 <= o.total", {"total": {"$gte": 10}}),
+            ("lambda o: o.customer != 'bob'", {"customer": {"$ne": "bob"}}),
+            ("lambda o: o.address is None", {"address": {"$eq": None}}),
+            ("lambda o: o.address.city == 'Paris'", {"address.city": {"$eq": "Paris"}}),
+            ("lambda o: o.tags[0] == 'new'", {"tags.0": {"$eq": "new"}}),
+            ("lambda o: 0 < o.total < 10", {"$and": [{"total": {"$gt": 0}}, {"total": {"$lt": 10}}]}),
+            ("lambda o: o.total > -1", {"total": {"$gt": -1}}),
+        ],
+    )
+    def test_comparisons_and_field_paths(self, source, expected):
+        assert _translate(source) == expected
+
+    def test_membership(self):
+        assert _translate("lambda o: o.customer in ['a', 'b']") == {"customer": {"$in": ["a", "b"]}}
+        assert _translate("lambda o: o.customer not in ('a',)") == {"customer": {"$nin": ["a"]}}
+        assert _translate("lambda o: 'new' in o.tags") == {"tags": {"$eq": "new"}}
+        assert _translate("lambda o: 'a.b' in o.customer") == {"customer": {"$regex": re.escape("a.b")}}
+        assert _translate("lambda o: 'a' not in o.customer") == {"customer": {"$not": re.compile("a")}}
+
+    def test_boolean_operators_are_flattened(self):
+        assert _translate("lambda o: o.total > 1 and (o.customer == 'a' and o.address.city == 'b')") == {"$and": [{"total": {"$gt": 1}}, {"customer": {"$eq": "a"}}, {"address.city": {"$eq": "b"}}]}
+        assert _translate("lambda o: o.total > 1 or not o.tags") == {"$or": [{"total": {"$gt": 1}}, {"$nor": [{"tags": {"$eq": True}}]}]}
+
+    def test_string_methods_and_lengths(self):
+        assert _translate("lambda o: o.customer.startswith('Mr.')") == {"customer": {"$regex": "^Mr\\."}}
+        assert _translate("lambda o: o.customer.endswith('son')") == {"customer": {"$regex": "son$"}}
+        assert _translate("lambda o: o.customer.lower() == 'bob'") == {"customer": {"$regex": "^bob$", "$options": "i"}}
+        assert _translate("lambda o: len(o.tags) == 2") == {"tags": {"$size": 2}}
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "lambda o: o.total * 2 > 10",
+            "lambda o: o.customer.lower() == 'Bob'",
+            "lambda o: 'x' in o.address",
+            "lambda o: o.total > threshold",
+            "lambda o: o.tags[-1] == 'x'",
+        ],
+    )
+    def test_unsupported_expressions_raise(self, source):
+        with pytest.raises(NotImplementedError):
+            _translate(source)
+
+    def test_constants_are_encoded(self):
+        translator = MongoExpressionTranslator(Order, lambda value: value.value if isinstance(value, OrderStatus) else value)
+        lambda_expression = _lambda("lambda o: o.status in [OrderStatus.PENDING]")
+        lambda_expression.body.comparators[0] = ast.List(elts=[ast.Constant(OrderStatus.PENDING)], ctx=ast.Load())
+
+        assert translator.translate(lambda_expression) == {"status": {"$in": ["PENDING"]}}
+
+    @pytest.mark.parametrize("source", ["lambda o: o.price > 10", "lambda o: 9.5 <= o.price", "lambda o: o.price == 10", "lambda o: o.price in [1, 2]"])
+    def test_decimal_fields_are_not_compared_natively(self, source):
+        with pytest.raises(NotImplementedError):
+            _translate(source)
+
+    def test_decimal_constants_are_not_compared_natively(self):
+        for source in ("lambda o: o.price > value", "lambda o: o.total > value"):
+            lambda_expression = _lambda(source)
+            lambda_expression.body.comparators[0] = ast.Constant(Decimal("9"))
+
+            with pytest.raises(NotImplementedError):
+                MongoExpressionTranslator(Order, JsonSerializer().serialize_to_text).translate(lambda_expression)
+
+    def test_decimal_fields_can_be_tested_for_none(self):
+        assert _translate("lambda o: o.price is not None") == {"price": {"$ne": None}}
+
+    def test_provider_encodes_values_with_serializer(self):
+        provider = MotorQueryProvider(MagicMock(), Order, JsonSerializer())
+
+        assert provider._encode_value(OrderStatus.SHIPPED) == "SHIPPED"
+        assert provider._encode_value(12.5) == 12.5
+
+
+class TestMotorQueryBuilderFilters:
+    def _builder(self) -> MotorQueryBuilder:
+        return MotorQueryBuilder(MagicMock(), JavaScriptExpressionTranslator(), MongoExpressionTranslator(Order))
+
+    def test_where_clauses_are_combined(self):
+        builder = self._builder()
+
+        builder.visit(_lambda("lambda q: q.where(lambda o: o.total > 10).where(lambda o: o.customer == 'a')").body)
+
+        assert builder.build_filter() == {"$and": [{"total": {"$gt": 10}}, {"customer": {"$eq": "a"}}]}
+
+    def test_untranslatable_predicates_fall_back_to_where(self, caplog):
+        builder = self._builder()
+
+        with caplog.at_level(logging.WARNING, logger="neuroglia.data.infrastructure.mongo.motor_query"):
+            builder.visit(_lambda("lambda q: q.where(lambda o: o.total > o.customer)").body)
+
+        assert list(builder.build_filter().keys()) == ["$where"]
+        assert "$where" in caplog.text
+
+    def test_decimal_comparisons_fall_back_to_where(self):
+        builder = self._builder()
+
+        builder.visit(_lambda("lambda q: q.where(lambda o: o.price > 10)").body)
+
+        assert list(builder.build_filter().keys()) == ["$where"]
+
+    def test_build_passes_filter_to_find(self):
+        collection = MagicMock()
+        builder = MotorQueryBuilder(collection, JavaScriptExpressionTranslator())
+
+        builder.build(_lambda("lambda q: q.where(lambda o: o.total >= 5)").body)
+
+        collection.find.assert_called_once_with({"total": {"$gte": 5}}, projection=None)
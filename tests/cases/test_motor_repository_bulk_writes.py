@@ -0,0 +1,174 @@
+"""
+Tests for the bulk writes of MotorRepository.
+
+This test suite verifies that:
+1. add_many_async inserts entities with a single bulk write, reporting duplicates as conflicts
+2. update_many_async guards each aggregate with its state_version, reporting per-entity conflicts
+   and restoring the version of the aggregates that have not been written
+3. The domain events of the written aggregates are published in a single batch afterwards
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState, DomainEvent
+from neuroglia.data.exceptions import (
+    DuplicateEntityException,
+    EntityNotFoundException,
+    OptimisticConcurrencyException,
+)
+from neuroglia.data.infrastructure.mongo import MotorRepository
+from neuroglia.serialization.json import JsonSerializer
+
+
+class OrderPlacedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, total: int):
+        super().__init__(aggregate_id)
+        self.total = total
+
+
+class OrderState(AggregateState[str]):
+    def __init__(self):
+        super().__init__()
+        self.total = 0
+
+
+class Order(AggregateRoot[OrderState, str]):
+    def __init__(self, id: str, total: int):
+        super().__init__()
+        self.state.id = id
+        self.state.total = total
+        self.register_event(OrderPlacedDomainEvent(id, total))
+
+
+class FakeCollection:
+    """Represents an in-memory collection supporting the operations used by bulk writes"""
+
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+        self.bulk_writes = 0
+
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes += 1
+        write_errors, matched, upserted = [], 0, []
+        for index, operation in enumerate(operations):
+            document = operation._doc
+            if not hasattr(operation, "_filter"):
+                if document["id"] in self.documents:
+                    write_errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error", "keyPattern": {"id": 1}})
+                else:
+                    self.documents[document["id"]] = dict(document)
+                continue
+            stored = self.documents.get(operation._filter["id"])
+            if stored is not None and self._matches(operation._filter, stored):
+                matched += 1
+                self.documents[stored["id"]] = dict(document)
+            elif operation._upsert and stored is not None:
+                # the unique index on 'id' rejects the upserted document
+                write_errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error", "keyPattern": {"id": 1}})
+            elif operation._upsert:
+                self.documents[document["id"]] = dict(document, _id=f"upserted-{document['id']}")
+                upserted.append({"index": index, "_id": f"upserted-{document['id']}"})
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "writeConcernErrors": [], "nMatched": matched, "upserted": upserted})
+        return Mock(matched_count=matched, upserted_ids={u["index"]: u["_id"] for u in upserted})
+
+    async def find(self, filter, projection=None):
+        for document in list(self.documents.values()):
+            if document["id"] in filter["id"]["$in"]:
+                yield {key: value for key, value in document.items() if projection.get(key)}
+
+    async def delete_many(self, filter):
+        ids = filter["_id"]["$in"]
+        self.documents = {key: document for key, document in self.documents.items() if document.get("_id") not in ids}
+
+    def _matches(self, filter: dict, document: dict) -> bool:
+        for key, value in filter.items():
+            if key == "$or":
+                if not any(self._matches(f, document) for f in value):
+                    return False
+            elif isinstance(value, dict) and "$exists" in value:
+                if (key in document) != value["$exists"]:
+                    return False
+            elif document.get(key) != value:
+                return False
+        return True
+
+
+def _repository() -> tuple[MotorRepository, FakeCollection, Mock]:
+    mediator = Mock()
+    mediator.publish_batch_async = AsyncMock()
+    repository = MotorRepository[Order, str](Mock(), "shop", "orders", JsonSerializer(), Order, mediator)
+    collection = FakeCollection()
+    repository._collection = collection
+    return repository, collection, mediator
+
+
+class TestMotorRepositoryBulkWrites:
+    @pytest.mark.asyncio
+    async def test_add_many_reports_duplicates_and_publishes_events_once(self):
+        repository, collection, mediator = _repository()
+        await repository.add_many_async([Order("1", 10)])
+        mediator.publish_batch_async.reset_mock()
+        orders = [Order("2", 20), Order("1", 30), Order("3", 40)]
+
+        result = await repository.add_many_async(orders)
+
+        assert collection.bulk_writes == 2
+        assert result.written == [orders[0], orders[2]]
+        assert [(o, type(ex)) for o, ex in result.conflicts] == [(orders[1], DuplicateEntityException)]
+        assert [e.total for e in mediator.publish_batch_async.await_args.args[0]] == [20, 40]
+        assert orders[0].get_uncommitted_events() == [] and len(orders[1].get_uncommitted_events()) == 1
+        assert collection.documents["2"]["state_version"] == 0
+
+    @pytest.mark.asyncio
+    async def test_update_many_reports_per_entity_conflicts(self):
+        repository, collection, mediator = _repository()
+        orders = [Order(str(i), i) for i in range(3)]
+        await repository.add_many_async(orders)
+        collection.documents["1"]["state_version"] = 1  # modified concurrently
+        missing = Order("404", 0)
+        for order in orders:
+            order.register_event(OrderPlacedDomainEvent(order.id(), 100))
+        last_modified = orders[1].state.last_modified
+
+        result = await repository.update_many_async([*orders, missing])
+
+        assert collection.bulk_writes == 2
+        assert result.written == [orders[0], orders[2]]
+        assert not result.succeeded
+        conflict, not_found = result.conflicts
+        assert conflict[0] is orders[1] and isinstance(conflict[1], OptimisticConcurrencyException)
+        assert (conflict[1].expected_version, conflict[1].actual_version) == (0, 1)
+        assert not_found[0] is missing and isinstance(not_found[1], EntityNotFoundException)
+        assert [o.state.state_version for o in orders] == [1, 0, 1]
+        assert orders[1].state.last_modified == last_modified
+        assert [collection.documents[str(i)]["state_version"] for i in range(3)] == [1, 1, 1]
+        assert "404" not in collection.documents
+        assert [e.aggregate_id for e in mediator.publish_batch_async.await_args.args[0]] == ["0", "2"]
+
+    @pytest.mark.asyncio
+    async def test_update_many_does_not_mistake_concurrent_writes_for_its_own(self):
+        repository, collection, _ = _repository()
+        order = Order("1", 10)
+        await repository.add_many_async([order])
+        # another process wrote version 1 first
+        collection.documents["1"].update(state_version=1, total=20)
+
+        result = await repository.update_many_async([order])
+
+        assert result.written == []
+        assert isinstance(result.conflicts[0][1], OptimisticConcurrencyException)
+        assert result.conflicts[0][1].actual_version == 1
+        assert collection.documents["1"]["total"] == 20
+
+    @pytest.mark.asyncio
+    async def test_empty_bulk_writes_do_nothing(self):
+        repository, collection, mediator = _repository()
+
+        assert (await repository.add_many_async([])).succeeded
+        assert (await repository.update_many_async([])).succeeded
+        assert collection.bulk_writes == 0
+        mediator.publish_batch_async.assert_not_awaited()
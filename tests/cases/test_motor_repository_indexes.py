@@ -0,0 +1,141 @@
+"""
+Tests for the declaration and provisioning of the indexes of MotorRepository collections.
+
+This test suite verifies that:
+1. Indexes are declared with @mongo_index on entity and aggregate state types, after the unique index on 'id'
+2. MotorIndexProvisioner creates the missing indexes only, recognizing indexes created by hand under another name
+3. Existing indexes that differ from their declaration, or that are not declared, are reported as drifts
+4. MotorRepository.configure registers a provisioner, unless told not to
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState
+from neuroglia.data.infrastructure.mongo import (
+    MongoIndex,
+    MotorIndexProvisioner,
+    MotorRepository,
+    mongo_index,
+)
+from neuroglia.data.infrastructure.mongo.motor_indexes import get_declared_indexes
+from neuroglia.hosting.abstractions import HostedService
+
+
+@mongo_index("customer_id", "-created_at")
+@mongo_index("expires_at", expire_after_seconds=3600)
+class OrderState(AggregateState[str]):
+    customer_id: str
+    created_at: datetime
+    expires_at: Optional[datetime]
+
+
+class Order(AggregateRoot[OrderState, str]):
+    pass
+
+
+@mongo_index("sku", unique=True)
+@dataclass
+class Product:
+    id: str
+    sku: str
+
+
+def _provisioner(existing_indexes: dict, indexes: list[MongoIndex]) -> tuple[MotorIndexProvisioner, MagicMock]:
+    collection = MagicMock()
+    collection.index_information = AsyncMock(return_value={"_id_": {"key": [("_id", 1)]}, **existing_indexes})
+    collection.create_indexes = AsyncMock()
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = collection
+    return MotorIndexProvisioner(client, "shop", "orders", indexes), collection
+
+
+class TestIndexDeclaration:
+    def test_indexes_are_declared_on_aggregate_state_types(self):
+        indexes = get_declared_indexes(Order)
+
+        assert [(i.name, i.keys) for i in indexes] == [
+            ("id_1", [("id", 1)]),
+            ("customer_id_1_created_at_-1", [("customer_id", 1), ("created_at", -1)]),
+            ("expires_at_1", [("expires_at", 1)]),
+        ]
+        assert indexes[0].unique and indexes[2].expire_after_seconds == 3600
+
+    def test_indexes_are_declared_on_entity_types(self):
+        assert [(i.name, i.unique) for i in get_declared_indexes(Product)] == [("id_1", True), ("sku_1", True)]
+
+    def test_invalid_ttl_indexes_are_rejected(self):
+        with pytest.raises(ValueError):
+            MongoIndex.create("a", "b", expire_after_seconds=10)
+
+
+class TestMotorIndexProvisioner:
+    @pytest.mark.asyncio
+    async def test_creates_missing_indexes_only(self):
+        existing = {"by_customer": {"key": [("customer_id", 1), ("created_at", -1)]}}
+        provisioner, collection = _provisioner(existing, get_declared_indexes(Order))
+
+        drifts = await provisioner.ensure_indexes_async()
+
+        assert drifts == []
+        created = [call.args[0][0].document for call in collection.create_indexes.await_args_list]
+        assert [(c["name"], c.get("unique"), c.get("expireAfterSeconds")) for c in created] == [("id_1", True, None), ("expires_at_1", None, 3600)]
+
+    @pytest.mark.asyncio
+    async def test_ensuring_indexes_is_idempotent(self):
+        existing = {"id_1": {"key": [("id", 1)], "unique": True}, "status_1": {"key": [("status", 1)]}}
+        provisioner, collection = _provisioner(existing, [MongoIndex.create("id", unique=True), MongoIndex.create("status")])
+
+        assert await provisioner.ensure_indexes_async() == []
+        assert await provisioner.ensure_indexes_async() == []
+        collection.create_indexes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reports_drifted_and_undeclared_indexes(self, caplog):
+        existing = {"id_1": {"key": [("id", 1)]}, "legacy_1": {"key": [("legacy", 1)]}}
+        provisioner, collection = _provisioner(existing, [MongoIndex.create("id", unique=True)])
+
+        drifts = await provisioner.ensure_indexes_async()
+
+        assert [(d.index_name, d.reason) for d in drifts] == [("id_1", "unique=False"), ("legacy_1", "not declared")]
+        assert provisioner.drifts == drifts
+        assert "drifted" in caplog.text
+        collection.create_indexes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reports_indexes_that_cannot_be_created(self):
+        provisioner, collection = _provisioner({}, [MongoIndex.create("id", unique=True)])
+        collection.create_indexes.side_effect = Exception("E11000 duplicate key error")
+
+        await provisioner.start_async()
+
+        assert [(d.index_name, d.reason) for d in provisioner.drifts] == [("id_1", "missing, and could not be created: E11000 duplicate key error")]
+
+
+class TestMotorRepositoryConfigureIndexes:
+    def _builder(self) -> Mock:
+        builder = Mock()
+        builder.settings.connection_strings = {"mongo": "mongodb://localhost:27017"}
+        return builder
+
+    def test_registers_index_provisioner(self):
+        builder = self._builder()
+        with patch("neuroglia.data.infrastructure.mongo.motor_repository.AsyncIOMotorClient"):
+            MotorRepository.configure(builder, Order, str, "shop", collection_name="orders", indexes=[MongoIndex.create("status"), MongoIndex.create("customer_id", name="id_1")])
+
+        call = builder.services.add_singleton.call_args
+        assert call.args[0] is HostedService
+        provisioner = call.kwargs["implementation_factory"](Mock())
+        assert [i.name for i in provisioner.indexes] == ["status_1", "id_1", "customer_id_1_created_at_-1", "expires_at_1"]
+        assert provisioner.indexes[1].keys == [("customer_id", 1)]
+
+    def test_provisioning_can_be_disabled(self):
+        builder = self._builder()
+        with patch("neuroglia.data.infrastructure.mongo.motor_repository.AsyncIOMotorClient"):
+            MotorRepository.configure(builder, Order, str, "shop", ensure_indexes=False)
+
+        builder.services.add_singleton.assert_not_called()
@@ -0,0 +1,106 @@
+"""
+Tests for the projected reads of MotorRepository.
+
+This test suite verifies that:
+1. find_projected_async only fetches the fields annotated on the projection type
+2. Documents are mapped straight onto the projection type, with sorting and pagination applied to the cursor
+3. Projection types that do not declare any field are rejected
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import ClassVar
+from unittest.mock import Mock
+
+import pytest
+
+from neuroglia.data.abstractions import AggregateRoot, AggregateState
+from neuroglia.data.infrastructure.mongo import MotorRepository
+from neuroglia.serialization.json import JsonSerializer
+
+
+class OrderStatus(Enum):
+    PENDING = "PENDING"
+    DELIVERED = "DELIVERED"
+
+
+class OrderState(AggregateState[str]):
+    def __init__(self):
+        super().__init__()
+        self.customer_id = ""
+        self.status = OrderStatus.PENDING
+        self.total_amount = Decimal(0)
+        self.items: list[dict] = []
+
+
+class Order(AggregateRoot[OrderState, str]):
+    pass
+
+
+@dataclass
+class OrderSummaryDto:
+    id: str
+    status: OrderStatus
+    total_amount: Decimal
+    created_at: datetime
+
+    kind: ClassVar[str] = "summary"
+
+
+class EmptyDto:
+    pass
+
+
+class FakeCursor:
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+        self.calls: list[tuple] = []
+
+    def sort(self, sort):
+        self.calls.append(("sort", sort))
+        return self
+
+    def skip(self, skip):
+        self.calls.append(("skip", skip))
+        return self
+
+    def limit(self, limit):
+        self.calls.append(("limit", limit))
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+def _repository(documents: list[dict]) -> tuple[MotorRepository, Mock, FakeCursor]:
+    repository = MotorRepository[Order, str](Mock(), "shop", "orders", JsonSerializer(), Order)
+    cursor = FakeCursor(documents)
+    repository._collection = Mock()
+    repository._collection.find = Mock(return_value=cursor)
+    return repository, repository._collection, cursor
+
+
+class TestMotorRepositoryProjections:
+    @pytest.mark.asyncio
+    async def test_documents_are_mapped_onto_projection_type(self):
+        documents = [{"id": "o1", "status": "DELIVERED", "total_amount": "12.50", "created_at": datetime(2024, 5, 1, 12, 0)}]
+        repository, collection, cursor = _repository(documents)
+
+        summaries = await repository.find_projected_async({"customer_id": "c1"}, OrderSummaryDto, sort=[("created_at", -1)], skip=20, limit=10)
+
+        collection.find.assert_called_once_with({"customer_id": "c1"}, {"_id": 0, "id": 1, "status": 1, "total_amount": 1, "created_at": 1})
+        assert cursor.calls == [("sort", [("created_at", -1)]), ("skip", 20), ("limit", 10)]
+        assert summaries == [OrderSummaryDto("o1", OrderStatus.DELIVERED, Decimal("12.50"), datetime(2024, 5, 1, 12, 0))]
+
+    @pytest.mark.asyncio
+    async def test_projection_types_must_declare_fields(self):
+        repository, _, _ = _repository([])
+
+        with pytest.raises(TypeError):
+            await repository.find_projected_async({}, EmptyDto)
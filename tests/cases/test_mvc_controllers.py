@@ -1,5 +1,9 @@
+import json
 from unittest.mock import Mock
+
+import pytest
 from fastapi import Response
+from fastapi.responses import StreamingResponse
 
 from neuroglia.core import OperationResult
 from neuroglia.dependency_injection.service_provider import ServiceCollection
@@ -374,3 +378,79 @@ class TestControllerHelperPatterns:
         assert controller.common_method() == "common functionality"
         assert isinstance(controller, ControllerBase)
         assert isinstance(controller, BaseApiController)
+
+
+class TestControllerStreaming:
+    """Test streaming of iterable operation results"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.mock_service_provider = Mock()
+        self.mock_service_provider.get_required_service.return_value = JsonSerializer()
+        self.controller = SimpleController(self.mock_service_provider, Mock(spec=Mapper), Mock(spec=Mediator))
+        self.controller.streaming_batch_size = 2
+
+    def _ok(self, data) -> OperationResult:
+        operation_result = OperationResult("OK", 200)
+        operation_result.data = data
+        return operation_result
+
+    def _request(self, accept: str) -> Mock:
+        request = Mock()
+        request.headers = {"accept": accept}
+        return request
+
+    async def _read_body(self, response: StreamingResponse) -> str:
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    @pytest.mark.asyncio
+    async def test_process_streams_iterator_as_json_array(self):
+        # act
+        response = self.controller.process(self._ok(UserDto(str(i), f"User {i}", f"user{i}@example.com") for i in range(5)))
+
+        # assert
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/json"
+        users = json.loads(await self._read_body(response))
+        assert [user["id"] for user in users] == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_process_streams_async_iterator_as_ndjson(self):
+        # arrange
+        async def users():
+            for i in range(3):
+                yield UserDto(str(i), f"User {i}", f"user{i}@example.com")
+
+        # act
+        response = self.controller.process(self._ok(users()), self._request("application/x-ndjson"))
+
+        # assert
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/x-ndjson"
+        lines = (await self._read_body(response)).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_process_streams_empty_iterator(self):
+        # act
+        response = self.controller.process(self._ok(iter([])))
+
+        # assert
+        assert json.loads(await self._read_body(response)) == []
+
+    @pytest.mark.asyncio
+    async def test_process_streams_list_when_ndjson_is_accepted(self):
+        # act
+        response = self.controller.process(self._ok([UserDto("1", "John", "john@example.com")]), self._request("application/x-ndjson"))
+
+        # assert
+        assert isinstance(response, StreamingResponse)
+        assert json.loads(await self._read_body(response))["id"] == "1"
+
+    def test_process_does_not_stream_list_by_default(self):
+        # act
+        response = self.controller.process(self._ok([UserDto("1", "John", "john@example.com")]))
+
+        # assert
+        assert not isinstance(response, StreamingResponse)
+        assert json.loads(response.body)[0]["id"] == "1"
@@ -0,0 +1,266 @@
+"""
+Tests for the rebuild of projections from the event store.
+
+This test suite verifies that:
+1. ProjectionRebuilder replays the category stream to the mediator, preserving the order of each aggregate's events
+2. The offset following each batch is checkpointed after it, and an interrupted rebuild resumes from its last checkpoint
+3. Rebuilds into a shadow copy prepare it, redirect dispatched writes to it, then swap it in and replay the events
+   recorded before the swap into it
+4. MotorShadowCollection redirects the collection of MotorRepository instances in the rebuild's context only, and
+   creates the shadow collection with the live or declared indexes, which it always renames over the live collection
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from neuroglia.data.abstractions import DomainEvent
+from neuroglia.data.infrastructure.event_sourcing import (
+    EventDescriptor,
+    EventStoreOptions,
+    ProjectionRebuilder,
+    ProjectionRebuildOptions,
+    ProjectionRebuildTarget,
+)
+from neuroglia.data.infrastructure.event_sourcing.checkpoint_store import (
+    InMemoryProjectionCheckpointStore,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import InMemoryEventStore
+from neuroglia.data.infrastructure.mongo import (
+    MongoIndex,
+    MotorRepository,
+    MotorShadowCollection,
+)
+from neuroglia.serialization.json import JsonSerializer
+from tests.data import User
+
+rebuilding: ContextVar[bool] = ContextVar("rebuilding", default=False)
+
+
+class BalanceChangedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, sequence: int):
+        super().__init__(aggregate_id)
+        self.sequence = sequence
+
+
+class RecordingMediator:
+    """Mediator recording the published events, optionally failing once on a given event"""
+
+    def __init__(self, fail_on: Optional[tuple[str, int]] = None):
+        self.published: list[BalanceChangedDomainEvent] = []
+        self.redirected: list[bool] = []
+        self.fail_on = fail_on
+
+    async def publish_async(self, notification: BalanceChangedDomainEvent):
+        if self.fail_on == (notification.aggregate_id, notification.sequence):
+            self.fail_on = None
+            raise RuntimeError("Handler failure")
+        await asyncio.sleep(0)
+        self.published.append(notification)
+        self.redirected.append(rebuilding.get())
+
+
+class RecordingTarget(ProjectionRebuildTarget):
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def prepare_async(self, resume: bool) -> None:
+        self.calls.append(f"prepare(resume={resume})")
+
+    @contextmanager
+    def redirect(self):
+        token = rebuilding.set(True)
+        try:
+            yield
+        finally:
+            rebuilding.reset(token)
+
+    async def swap_async(self) -> None:
+        self.calls.append("swap")
+
+
+async def _seed_async(accounts: int, events_per_account: int) -> InMemoryEventStore:
+    eventstore = InMemoryEventStore(EventStoreOptions("bank", "bank-group"))
+    for sequence in range(events_per_account):
+        for account in range(accounts):
+            await eventstore.append_async(f"account-{account}", [EventDescriptor("balancechanged", BalanceChangedDomainEvent(str(account), sequence))], None if sequence == 0 else sequence)
+    return eventstore
+
+
+def _rebuilder(eventstore, mediator, checkpoint_store, target=None, batch_size=10) -> ProjectionRebuilder:
+    return ProjectionRebuilder(mediator, EventStoreOptions("bank", "bank-group"), eventstore, checkpoint_store, ProjectionRebuildOptions("accounts", page_size=7, batch_size=batch_size), target)
+
+
+class TestProjectionRebuilder:
+    @pytest.mark.asyncio
+    async def test_replays_category_stream_in_aggregate_order(self):
+        eventstore = await _seed_async(accounts=5, events_per_account=6)
+        mediator = RecordingMediator()
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+
+        dispatched = await _rebuilder(eventstore, mediator, checkpoint_store).rebuild_async()
+
+        assert dispatched == 30
+        for account in range(5):
+            assert [e.sequence for e in mediator.published if e.aggregate_id == str(account)] == list(range(6))
+        assert await checkpoint_store.get_async("accounts") is None
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_last_checkpoint(self):
+        eventstore = await _seed_async(accounts=5, events_per_account=6)
+        mediator = RecordingMediator(fail_on=("2", 4))
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        rebuilder = _rebuilder(eventstore, mediator, checkpoint_store)
+
+        with pytest.raises(RuntimeError):
+            await rebuilder.rebuild_async()
+        checkpoint = await checkpoint_store.get_async("accounts")
+        dispatched = await rebuilder.rebuild_async()
+
+        assert checkpoint.position == 20
+        assert dispatched == 10
+        assert sorted((e.aggregate_id, e.sequence) for e in mediator.published[-10:]) == sorted((str(a), s) for a in range(5) for s in (4, 5))
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_offsets_of_category_stream_with_deleted_streams(self):
+        eventstore = await _seed_async(accounts=3, events_per_account=2)
+        await eventstore.delete_async("account-0")
+        mediator = RecordingMediator(fail_on=("2", 1))
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        rebuilder = _rebuilder(eventstore, mediator, checkpoint_store, batch_size=2)
+
+        with pytest.raises(RuntimeError):
+            await rebuilder.rebuild_async()
+        checkpoint = await checkpoint_store.get_async("accounts")
+        dispatched = await rebuilder.rebuild_async()
+
+        # the first batch holds the events at offsets 1 and 2 of the category stream, whose offset 0 has been deleted
+        assert checkpoint.position == 3
+        assert dispatched == 2
+        assert sorted((e.aggregate_id, e.sequence) for e in mediator.published[-2:]) == [("1", 1), ("2", 1)]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_without_resume_ignores_checkpoint(self):
+        eventstore = await _seed_async(accounts=2, events_per_account=3)
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        rebuilder = _rebuilder(eventstore, RecordingMediator(fail_on=("1", 2)), checkpoint_store, batch_size=2)
+        with pytest.raises(RuntimeError):
+            await rebuilder.rebuild_async()
+
+        assert await rebuilder.rebuild_async(resume=False) == 6
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_into_shadow_copy(self):
+        eventstore = await _seed_async(accounts=3, events_per_account=2)
+        mediator = RecordingMediator(fail_on=("0", 1))
+        target = RecordingTarget()
+        rebuilder = _rebuilder(eventstore, mediator, InMemoryProjectionCheckpointStore(), target, batch_size=3)
+
+        with pytest.raises(RuntimeError):
+            await rebuilder.rebuild_async()
+        await rebuilder.rebuild_async()
+
+        assert target.calls == ["prepare(resume=False)", "prepare(resume=True)", "swap"]
+        assert all(mediator.redirected)
+        assert not rebuilding.get()
+
+    @pytest.mark.asyncio
+    async def test_replays_events_recorded_before_swap_into_swapped_in_copy(self):
+        eventstore = await _seed_async(accounts=2, events_per_account=2)
+        mediator = RecordingMediator()
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        target = RecordingTarget()
+
+        async def swap_async():
+            # the live projection handles an event recorded after the last page, writing it to the replaced collection
+            await eventstore.append_async("account-1", [EventDescriptor("balancechanged", BalanceChangedDomainEvent("1", 2))], 2)
+            target.calls.append("swap")
+
+        target.swap_async = swap_async
+
+        dispatched = await _rebuilder(eventstore, mediator, checkpoint_store, target, batch_size=3).rebuild_async()
+
+        assert dispatched == 5
+        assert (mediator.published[-1].aggregate_id, mediator.published[-1].sequence) == ("1", 2)
+        assert mediator.redirected == [True] * 4 + [False]
+        assert await checkpoint_store.get_async("accounts") is None
+
+    def test_rejects_invalid_options(self):
+        with pytest.raises(ValueError):
+            ProjectionRebuilder(RecordingMediator(), EventStoreOptions("bank", "bank-group"), InMemoryEventStore(), InMemoryProjectionCheckpointStore(), ProjectionRebuildOptions("accounts", batch_size=0))
+
+
+class TestMotorShadowCollection:
+    @pytest.mark.asyncio
+    async def test_redirects_repositories_in_current_context_only(self):
+        live, shadow = object(), object()
+        client = {"bank": {"users": live, "users_rebuild": shadow}}
+        repository = MotorRepository[User, str](client, "bank", "users", JsonSerializer())
+        target = MotorShadowCollection(client, "bank", "users")
+        outside = asyncio.Event()
+
+        async def read_outside_redirect():
+            await outside.wait()
+            return repository.collection
+
+        async def read_collection():
+            await asyncio.sleep(0)
+            return repository.collection
+
+        concurrent_read = asyncio.create_task(read_outside_redirect())
+        with target.redirect():
+            redirected = repository.collection
+            redirected_in_task = await asyncio.create_task(read_collection())
+            outside.set()
+            concurrent = await concurrent_read
+
+        assert (redirected, redirected_in_task, concurrent, repository.collection) == (shadow, shadow, live, live)
+
+    def _database(self, collection_names: list[str]) -> tuple[MagicMock, MagicMock, MagicMock]:
+        live, shadow = MagicMock(), MagicMock()
+        live.index_information = AsyncMock(
+            return_value={
+                "_id_": {"v": 2, "key": [("_id", 1)]},
+                "email_1": {"v": 2, "key": [("email", 1)], "unique": True},
+                "bio_text": {"v": 2, "key": [("_fts", "text"), ("_ftsx", 1)], "weights": {"bio": 1}, "default_language": "english"},
+            }
+        )
+        shadow.create_indexes = AsyncMock()
+        shadow.rename = AsyncMock()
+        database = MagicMock()
+        database.drop_collection = AsyncMock()
+        database.create_collection = AsyncMock()
+        database.list_collection_names = AsyncMock(return_value=collection_names)
+        database.__getitem__.side_effect = {"users": live, "users_rebuild": shadow}.__getitem__
+        return database, live, shadow
+
+    @pytest.mark.asyncio
+    async def test_prepare_creates_shadow_with_live_indexes_and_swap_renames_it(self):
+        database, _, shadow = self._database(["users"])
+        target = MotorShadowCollection({"bank": database}, "bank", "users")
+
+        await target.prepare_async(resume=False)
+        await target.swap_async()
+
+        database.drop_collection.assert_awaited_once_with("users_rebuild")
+        database.create_collection.assert_awaited_once_with("users_rebuild")
+        created = [model.document for model in shadow.create_indexes.await_args.args[0]]
+        assert [(c["name"], list(c["key"].items())) for c in created] == [("email_1", [("email", 1)]), ("bio_text", [("bio", "text")])]
+        assert created[0]["unique"] and created[1]["weights"] == {"bio": 1}
+        shadow.rename.assert_awaited_once_with("users", dropTarget=True)
+
+    @pytest.mark.asyncio
+    async def test_prepare_resumes_with_declared_indexes(self):
+        database, live, shadow = self._database(["users", "users_rebuild"])
+        target = MotorShadowCollection({"bank": database}, "bank", "users", indexes=[MongoIndex.create("id", unique=True)])
+
+        await target.prepare_async(resume=True)
+
+        database.drop_collection.assert_not_awaited()
+        database.create_collection.assert_not_awaited()
+        live.index_information.assert_not_awaited()
+        assert [model.document["name"] for model in shadow.create_indexes.await_args.args[0]] == ["id_1"]
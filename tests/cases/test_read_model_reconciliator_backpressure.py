@@ -0,0 +1,176 @@
+"""
+Tests for the sharded, bounded sequential processing of the ReadModelReconciliator.
+
+This test suite verifies that:
+1. AggregateEventQueue processes events with a fixed number of worker shards, regardless of the number of aggregates,
+   preserving the order of each aggregate's events
+2. Enqueueing waits while the queue of the aggregate's shard is full
+3. Queue depth and lag are reported, including through the OpenTelemetry gauges
+4. ReadModelReconciliator sizes its queue from its options
+5. ReadModelReconciliator hands delivered events over to a single dispatcher through a bounded queue, which stops
+   dispatching while a shard is full, hands the surplus back to the subscription, and bounds parallel handling
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    EventStore,
+    EventStoreOptions,
+)
+from neuroglia.data.infrastructure.event_sourcing.read_model_reconciliator import (
+    AggregateEventQueue,
+    ReadModelConciliationOptions,
+    ReadModelReconciliator,
+)
+from neuroglia.reactive import AsyncRx
+
+
+class StockEventRecord:
+    def __init__(self, aggregate_id: str, sequence: int):
+        self.stream_id = f"stock-{aggregate_id}"
+        self.data = None
+        self.sequence = sequence
+
+
+class AckableStockEventRecord(StockEventRecord):
+    def __init__(self, aggregate_id: str, sequence: int):
+        super().__init__(aggregate_id, sequence)
+        self.data = sequence
+        self.ack_async = AsyncMock()
+        self.nack_async = AsyncMock()
+
+
+class BlockingMediator:
+    def __init__(self):
+        self.published: list[int] = []
+        self.released = asyncio.Event()
+
+    async def publish_async(self, notification: int):
+        await self.released.wait()
+        self.published.append(notification)
+
+
+class TestAggregateEventQueueSharding:
+    @pytest.mark.asyncio
+    async def test_fixed_worker_pool_preserves_aggregate_order(self):
+        queue = AggregateEventQueue(worker_count=4, capacity=10)
+        processed: dict[str, list[int]] = {}
+
+        async def process(e: StockEventRecord):
+            await asyncio.sleep(0)
+            processed.setdefault(e.stream_id, []).append(e.sequence)
+
+        for sequence in range(5):
+            for aggregate in range(200):
+                await queue.enqueue(str(aggregate), StockEventRecord(str(aggregate), sequence), process)
+        await queue.drain_async()
+
+        assert len(queue._workers) == 4
+        assert len(processed) == 200
+        assert all(sequences == list(range(5)) for sequences in processed.values())
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_waits_while_shard_is_full(self):
+        queue = AggregateEventQueue(worker_count=1, capacity=2, name="stocks")
+        release = asyncio.Event()
+
+        async def process(e: StockEventRecord):
+            await release.wait()
+
+        for sequence in range(3):
+            await queue.enqueue("1", StockEventRecord("1", sequence), process)
+        await asyncio.sleep(0.01)
+        blocked = asyncio.create_task(queue.enqueue("2", StockEventRecord("2", 0), process))
+        await asyncio.sleep(0.01)
+
+        assert not blocked.done()
+        assert queue.depth == 2
+        assert queue.lag >= 0.01
+        assert [(o.value, o.attributes) for o in AggregateEventQueue._observe_depth(None) if o.attributes["queue"] == "stocks"] == [(2, {"queue": "stocks"})]
+
+        release.set()
+        await blocked
+        await queue.drain_async()
+
+        assert (queue.depth, queue.lag) == (0, 0.0)
+        await queue.shutdown()
+        assert queue not in AggregateEventQueue._instances
+
+    def test_rejects_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            AggregateEventQueue(worker_count=0)
+        with pytest.raises(ValueError):
+            AggregateEventQueue(capacity=0)
+
+
+class TestReadModelReconciliatorQueueOptions:
+    @pytest.mark.asyncio
+    async def test_queue_is_sized_from_options(self):
+        event_store = MagicMock(spec=EventStore)
+        event_store.observe_async = AsyncMock(return_value=MagicMock())
+        options = ReadModelConciliationOptions(consumer_group="stocks", worker_count=3, queue_capacity=7)
+
+        reconciliator = ReadModelReconciliator(MagicMock(), MagicMock(), EventStoreOptions("test-db", "stocks"), event_store, options)
+
+        assert len(reconciliator._event_queue._queues) == 3
+        assert reconciliator._event_queue._queues[0].maxsize == 7
+        assert reconciliator._event_queue.name == "stocks"
+        await reconciliator.stop_async()
+
+
+class TestReadModelReconciliatorDispatch:
+    async def _start_async(self, monkeypatch, mediator: BlockingMediator, options: ReadModelConciliationOptions):
+        event_store = MagicMock(spec=EventStore)
+        event_store.observe_async = AsyncMock(return_value=MagicMock())
+        subscriptions = []
+        monkeypatch.setattr(AsyncRx, "subscribe", lambda observable, on_next: subscriptions.append(on_next) or MagicMock())
+        reconciliator = ReadModelReconciliator(MagicMock(), mediator, EventStoreOptions("test-db", "stocks"), event_store, options)
+        await reconciliator.start_async()
+        return reconciliator, subscriptions[0]
+
+    @pytest.mark.asyncio
+    async def test_full_shard_stops_dispatching(self, monkeypatch):
+        mediator = BlockingMediator()
+        options = ReadModelConciliationOptions(consumer_group="stocks", worker_count=1, queue_capacity=1)
+        reconciliator, on_next = await self._start_async(monkeypatch, mediator, options)
+        records = [AckableStockEventRecord("1", sequence) for sequence in range(5)]
+
+        for record in records:
+            on_next(record)
+            await asyncio.sleep(0.01)
+
+        # one event is being handled, one is queued in the shard, one waits for room in it, and one waits to be dispatched
+        assert (reconciliator.in_flight, reconciliator._event_queue.depth, reconciliator._handoff.qsize()) == (1, 1, 1)
+        assert [r.nack_async.await_count for r in records] == [0, 0, 0, 0, 1]
+
+        mediator.released.set()
+        await reconciliator._handoff.join()
+        await reconciliator._event_queue.drain_async()
+
+        assert mediator.published == [0, 1, 2, 3]
+        assert all(r.ack_async.await_count == 1 for r in records[:4])
+        await reconciliator.stop_async()
+        assert reconciliator._dispatcher is None
+
+    @pytest.mark.asyncio
+    async def test_parallel_handling_is_bounded(self, monkeypatch):
+        mediator = BlockingMediator()
+        options = ReadModelConciliationOptions(consumer_group="stocks", sequential_processing=False, queue_capacity=2)
+        reconciliator, on_next = await self._start_async(monkeypatch, mediator, options)
+
+        for sequence in range(5):
+            on_next(AckableStockEventRecord(str(sequence), sequence))
+            await asyncio.sleep(0.01)
+
+        assert (reconciliator.in_flight, len(reconciliator._parallel_tasks), reconciliator._handoff.qsize()) == (2, 2, 2)
+
+        mediator.released.set()
+        await reconciliator._handoff.join()
+        await asyncio.gather(*reconciliator._parallel_tasks)
+
+        assert sorted(mediator.published) == [0, 1, 2, 3, 4]
+        await reconciliator.stop_async()
@@ -0,0 +1,207 @@
+"""
+Tests for the batched processing of the ReadModelReconciliator.
+
+This test suite verifies that:
+1. Mediator.publish_batch_async passes each handler the notifications it handles in a single handle_batch_async call,
+   and that handlers default to handling notifications one after another
+2. Pipeline behaviors still wrap the handling of each notification of a batch, and can short-circuit it
+3. EventBatchQueue processes events in batches bounded by their size and window, in the order they have been enqueued
+4. ReadModelReconciliator publishes batches when configured with a batch size, acknowledging them once handled
+"""
+
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from neuroglia.data.infrastructure.event_sourcing.abstractions import (
+    EventStore,
+    EventStoreOptions,
+)
+from neuroglia.data.infrastructure.event_sourcing.read_model_reconciliator import (
+    EventBatchQueue,
+    ReadModelConciliationOptions,
+    ReadModelReconciliator,
+)
+from neuroglia.dependency_injection import ServiceCollection
+from neuroglia.mediation import Mediator, NotificationHandler, PipelineBehavior
+
+
+@dataclass
+class StockChangedEvent:
+    product_id: str
+    quantity: int
+
+
+@dataclass
+class PriceChangedEvent:
+    product_id: str
+    price: float
+
+
+class StockBulkHandler(NotificationHandler[StockChangedEvent]):
+    batches: list[list[StockChangedEvent]] = []
+
+    async def handle_async(self, notification: StockChangedEvent) -> None:
+        raise AssertionError("Batches must be handled at once")
+
+    async def handle_batch_async(self, notifications: list[StockChangedEvent]) -> None:
+        StockBulkHandler.batches.append(notifications)
+
+
+class PriceHandler(NotificationHandler[PriceChangedEvent]):
+    handled: list[PriceChangedEvent] = []
+
+    async def handle_async(self, notification: PriceChangedEvent) -> None:
+        await asyncio.sleep(0)
+        PriceHandler.handled.append(notification)
+
+
+class FailingBulkHandler(NotificationHandler[StockChangedEvent]):
+    async def handle_async(self, notification: StockChangedEvent) -> None:
+        raise RuntimeError("Handler failure")
+
+
+class AuditBehavior(PipelineBehavior):
+    calls: list[str] = []
+
+    async def handle_async(self, request, next):
+        if getattr(request, "quantity", None) == 0:
+            AuditBehavior.calls.append(f"skip:{request.product_id}")
+            return None
+        AuditBehavior.calls.append(f"before:{request.product_id}")
+        result = await next()
+        AuditBehavior.calls.append(f"after:{request.product_id}")
+        return result
+
+
+class FakeEventRecord:
+    def __init__(self, data):
+        self.stream_id = f"stock-{data.product_id}"
+        self.data = data
+        self.ack_async = AsyncMock()
+        self.nack_async = AsyncMock()
+
+
+def _mediator(behaviors: bool = False) -> Mediator:
+    StockBulkHandler.batches, PriceHandler.handled, AuditBehavior.calls = [], [], []
+    services = ServiceCollection()
+    services.add_singleton(Mediator, Mediator)
+    services.add_transient(NotificationHandler, StockBulkHandler)
+    services.add_transient(NotificationHandler, PriceHandler)
+    if behaviors:
+        services.add_transient(PipelineBehavior, AuditBehavior)
+    return services.build().get_required_service(Mediator)
+
+
+class TestMediatorPublishBatch:
+    @pytest.mark.asyncio
+    async def test_handlers_receive_the_notifications_they_handle(self):
+        mediator = _mediator()
+        events = [StockChangedEvent("a", 1), PriceChangedEvent("a", 2.5), StockChangedEvent("b", 3), PriceChangedEvent("b", 4.0)]
+
+        await mediator.publish_batch_async(events)
+
+        assert StockBulkHandler.batches == [[events[0], events[2]]]
+        assert PriceHandler.handled == [events[1], events[3]]
+
+    @pytest.mark.asyncio
+    async def test_behaviors_wrap_each_notification(self):
+        mediator = _mediator(behaviors=True)
+        events = [StockChangedEvent("a", 1), StockChangedEvent("b", 0), StockChangedEvent("c", 3)]
+
+        await mediator.publish_batch_async(events)
+
+        assert StockBulkHandler.batches == [[events[0], events[2]]]
+        assert sorted(AuditBehavior.calls[:3]) == ["before:a", "before:c", "skip:b"]
+        assert sorted(AuditBehavior.calls[3:]) == ["after:a", "after:c"]
+
+    @pytest.mark.asyncio
+    async def test_handler_failures_propagate_through_behaviors(self):
+        services = ServiceCollection()
+        services.add_singleton(Mediator, Mediator)
+        services.add_transient(NotificationHandler, FailingBulkHandler)
+        services.add_transient(PipelineBehavior, AuditBehavior)
+        mediator = services.build().get_required_service(Mediator)
+        AuditBehavior.calls = []
+
+        with pytest.raises(RuntimeError):
+            await mediator.publish_batch_async([StockChangedEvent("a", 1), StockChangedEvent("b", 2)])
+
+        assert sorted(AuditBehavior.calls) == ["before:a", "before:b"]
+
+
+class TestEventBatchQueue:
+    @pytest.mark.asyncio
+    async def test_batches_are_bounded_by_size_and_window(self):
+        queue = EventBatchQueue(batch_size=3, window=0.05, capacity=10)
+        batches: list[list[int]] = []
+
+        async def process(batch: list[int]):
+            batches.append(batch)
+
+        for e in range(7):
+            await queue.enqueue(e, process)
+        await queue.drain_async()
+
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_do_not_stop_processing(self):
+        queue = EventBatchQueue(batch_size=2, window=0)
+        batches: list[list[int]] = []
+
+        async def process(batch: list[int]):
+            batches.append(batch)
+            if 0 in batch:
+                raise RuntimeError("Handler failure")
+
+        await queue.enqueue(0, process)
+        await queue.drain_async()
+        await queue.enqueue(1, process)
+        await queue.drain_async()
+
+        assert batches == [[0], [1]]
+        await queue.shutdown()
+
+    def test_rejects_invalid_options(self):
+        with pytest.raises(ValueError):
+            EventBatchQueue(batch_size=0)
+        with pytest.raises(ValueError):
+            EventBatchQueue(batch_size=1, window=-1)
+
+
+class TestReadModelReconciliatorBatching:
+    def _reconciliator(self, mediator) -> ReadModelReconciliator:
+        event_store = MagicMock(spec=EventStore)
+        options = ReadModelConciliationOptions(consumer_group="stocks", batch_size=2, batch_window=0.01)
+        return ReadModelReconciliator(MagicMock(), mediator, EventStoreOptions("test-db", "stocks"), event_store, options)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_acknowledged_once_handled(self):
+        mediator = _mediator()
+        reconciliator = self._reconciliator(mediator)
+        records = [FakeEventRecord(StockChangedEvent(str(i), i)) for i in range(3)]
+
+        for record in records:
+            await reconciliator._handle_event_async(record)
+        await reconciliator._batch_queue.drain_async()
+
+        assert reconciliator._event_queue is None
+        assert StockBulkHandler.batches == [[records[0].data, records[1].data], [records[2].data]]
+        assert all(record.ack_async.await_count == 1 and record.nack_async.await_count == 0 for record in records)
+        await reconciliator.stop_async()
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_negatively_acknowledged(self):
+        mediator = MagicMock()
+        mediator.publish_batch_async = AsyncMock(side_effect=RuntimeError("bulk write failed"))
+        reconciliator = self._reconciliator(mediator)
+        records = [FakeEventRecord(StockChangedEvent(str(i), i)) for i in range(2)]
+
+        await reconciliator.on_event_record_batch_async(records)
+
+        assert all(record.ack_async.await_count == 0 and record.nack_async.await_count == 1 for record in records)
+        await reconciliator.stop_async()
@@ -0,0 +1,203 @@
+"""
+Tests for the catch-up and live modes of the ReadModelReconciliator.
+
+This test suite verifies that:
+1. Catching up projects the events recorded since the last checkpoint in pages, checkpointing after each of them
+2. Catching up runs in the background, without holding back the start of the host, and is cancelled on stop
+3. Once caught up, the live subscription acknowledges the events already projected without publishing them again,
+   and checkpoints the offset following the contiguous run of events it settled
+4. The lag and in-flight gauges, and the projected events counter, report the state of the reconciliator
+5. Catching up requires a projection checkpoint store
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from neuroglia.data.abstractions import DomainEvent
+from neuroglia.data.infrastructure.event_sourcing import (
+    EventDescriptor,
+    EventRecord,
+    EventStoreOptions,
+    ProjectionCheckpoint,
+    ReadModelConciliationOptions,
+    ReadModelReconciliator,
+)
+from neuroglia.data.infrastructure.event_sourcing.checkpoint_store import (
+    InMemoryProjectionCheckpointStore,
+)
+from neuroglia.data.infrastructure.event_sourcing.event_store import InMemoryEventStore
+
+
+class DepositedDomainEvent(DomainEvent):
+    def __init__(self, aggregate_id: str, amount: int):
+        super().__init__(aggregate_id)
+        self.amount = amount
+
+
+class RecordingMediator:
+    def __init__(self):
+        self.batches: list[list[DepositedDomainEvent]] = []
+        self.published: list[DepositedDomainEvent] = []
+
+    async def publish_batch_async(self, notifications: list[DepositedDomainEvent]):
+        self.batches.append(notifications)
+
+    async def publish_async(self, notification: DepositedDomainEvent):
+        self.published.append(notification)
+
+
+class BlockingMediator(RecordingMediator):
+    def __init__(self, blocked_amount: int):
+        super().__init__()
+        self.blocked_amount = blocked_amount
+        self.released = asyncio.Event()
+
+    async def publish_batch_async(self, notifications: list[DepositedDomainEvent]):
+        await self.released.wait()
+        await super().publish_batch_async(notifications)
+
+    async def publish_async(self, notification: DepositedDomainEvent):
+        if notification.amount == self.blocked_amount:
+            await self.released.wait()
+        await super().publish_async(notification)
+
+
+class FailingMediator(RecordingMediator):
+    async def publish_async(self, notification: DepositedDomainEvent):
+        if notification.amount == 3:
+            raise Exception("projection failed")
+        await super().publish_async(notification)
+
+
+async def _seed_async(eventstore: InMemoryEventStore, amounts: range) -> None:
+    for amount in amounts:
+        await eventstore.append_async(f"account-{amount}", [EventDescriptor("deposited", DepositedDomainEvent(str(amount), amount))])
+
+
+def _reconciliator(eventstore, mediator, checkpoint_store, page_size: int = 4, consumer_group: str = "accounts") -> ReadModelReconciliator:
+    options = ReadModelConciliationOptions(consumer_group=consumer_group, catch_up=True, catch_up_page_size=page_size, checkpoint_interval=1)
+    return ReadModelReconciliator(None, mediator, EventStoreOptions("bank", "accounts"), eventstore, options, checkpoint_store)
+
+
+class TestReadModelReconciliatorCatchUp:
+    @pytest.mark.asyncio
+    async def test_catches_up_from_last_checkpoint_in_pages(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("bank", "accounts"))
+        await _seed_async(eventstore, range(10))
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        await checkpoint_store.save_async(ProjectionCheckpoint("accounts", 4, datetime.now(timezone.utc)))
+        mediator = RecordingMediator()
+        reconciliator = _reconciliator(eventstore, mediator, checkpoint_store)
+
+        projected = await reconciliator.catch_up_async()
+
+        assert projected == 6
+        assert [[e.amount for e in batch] for batch in mediator.batches] == [[4, 5, 6, 7], [8, 9]]
+        assert (await checkpoint_store.get_async("accounts")).position == 10
+        assert (reconciliator.mode, reconciliator.lag, reconciliator.in_flight) == ("live", 0, 0)
+        await reconciliator.stop_async()
+
+    @pytest.mark.asyncio
+    async def test_live_subscription_skips_events_projected_while_catching_up(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("bank", "accounts"))
+        await _seed_async(eventstore, range(5))
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        mediator = RecordingMediator()
+        reconciliator = _reconciliator(eventstore, mediator, checkpoint_store)
+
+        await reconciliator.start_async()
+        await reconciliator._catch_up_task
+        await _seed_async(eventstore, range(5, 7))
+        for _ in range(100):
+            if len(mediator.published) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await reconciliator.stop_async()
+
+        assert sum(len(batch) for batch in mediator.batches) == 5
+        assert sorted(e.amount for e in mediator.published) == [5, 6]
+        assert (await checkpoint_store.get_async("accounts")).position == 7
+        assert eventstore.get_consumer_group("$ce-bank", "accounts").checkpoint == 7
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_wait_for_catching_up(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("bank", "accounts"))
+        await _seed_async(eventstore, range(5))
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        mediator = BlockingMediator(blocked_amount=-1)
+        reconciliator = _reconciliator(eventstore, mediator, checkpoint_store)
+
+        await reconciliator.start_async()
+        await asyncio.sleep(0.01)
+
+        assert (reconciliator.mode, reconciliator.in_flight, reconciliator._subscription) == ("catch-up", 4, None)
+        await reconciliator.stop_async()
+        assert reconciliator._catch_up_task is None and reconciliator._subscription is None
+        assert await checkpoint_store.get_async("accounts") is None
+
+    @pytest.mark.asyncio
+    async def test_live_checkpoint_follows_contiguously_settled_events(self):
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        mediator = BlockingMediator(blocked_amount=0)
+        options = ReadModelConciliationOptions(consumer_group="accounts", sequential_processing=False, checkpoint_interval=1)
+        reconciliator = ReadModelReconciliator(None, mediator, EventStoreOptions("bank", "accounts"), InMemoryEventStore(), options, checkpoint_store)
+        records = [EventRecord(f"account-{i}", str(i), 0, i, datetime.now(timezone.utc), "deposited", DepositedDomainEvent(str(i), i), link_offset=i) for i in range(2)]
+
+        blocked = asyncio.create_task(reconciliator._handle_event_async(records[0]))
+        await asyncio.sleep(0)
+        await reconciliator._handle_event_async(records[1])
+
+        assert [e.amount for e in mediator.published] == [1]
+        assert await checkpoint_store.get_async("accounts") is None
+        mediator.released.set()
+        await blocked
+        assert (await checkpoint_store.get_async("accounts")).position == 2
+
+    @pytest.mark.asyncio
+    async def test_live_checkpoint_skips_failed_and_deleted_events(self):
+        eventstore = InMemoryEventStore(EventStoreOptions("bank", "accounts"))
+        await _seed_async(eventstore, range(6))
+        await eventstore.delete_async("account-1")
+        checkpoint_store = InMemoryProjectionCheckpointStore()
+        mediator = FailingMediator()
+        options = ReadModelConciliationOptions(consumer_group="accounts", checkpoint_interval=1)
+        reconciliator = ReadModelReconciliator(None, mediator, EventStoreOptions("bank", "accounts"), eventstore, options, checkpoint_store)
+
+        await reconciliator.start_async()
+        for _ in range(100):
+            if eventstore.get_consumer_group("$ce-bank", "accounts").checkpoint == 6:
+                break
+            await asyncio.sleep(0.01)
+        await reconciliator.stop_async()
+
+        # event 1 has been deleted, and event 3, whose projection failed, has been handed back to the subscription, which parked it
+        assert sorted(e.amount for e in mediator.published) == [0, 2, 4, 5]
+        assert eventstore.get_consumer_group("$ce-bank", "accounts").parked == [3]
+        assert (await checkpoint_store.get_async("accounts")).position == 6
+
+    @pytest.mark.asyncio
+    async def test_gauges_report_lag_and_in_flight_handlers(self, monkeypatch):
+        eventstore = InMemoryEventStore(EventStoreOptions("bank", "accounts"))
+        await _seed_async(eventstore, range(3))
+        counter = Mock()
+        monkeypatch.setattr(ReadModelReconciliator, "_projected_events_counter", counter)
+        reconciliator = _reconciliator(eventstore, RecordingMediator(), InMemoryProjectionCheckpointStore(), consumer_group="gauges")
+        await reconciliator.catch_up_async()
+        reconciliator._head_position += 5
+        reconciliator._in_flight = 2
+
+        def observe(callback):
+            return [o.value for o in callback(None) if o.attributes == {"consumer_group": "gauges", "mode": "live"}]
+
+        assert observe(ReadModelReconciliator._observe_lag) == [5]
+        assert observe(ReadModelReconciliator._observe_in_flight) == [2]
+        counter.add.assert_called_once_with(3, {"consumer_group": "gauges", "mode": "catch-up"})
+        await reconciliator.stop_async()
+        assert reconciliator not in ReadModelReconciliator._instances
+
+    def test_catching_up_requires_checkpoint_store(self):
+        with pytest.raises(ValueError):
+            ReadModelReconciliator(None, RecordingMediator(), EventStoreOptions("bank", "accounts"), InMemoryEventStore(), ReadModelConciliationOptions("accounts", catch_up=True))
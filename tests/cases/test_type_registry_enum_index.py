@@ -0,0 +1,79 @@
+"""
+Tests for the indexed enum lookup of TypeRegistry.
+
+This test suite verifies that:
+1. Enum members are resolved by value, lower-cased value, name and upper-cased name
+2. Enums declared in the target type's module take precedence over registered modules
+3. Module indexes are built once and reused across lookups
+4. Registering a module invalidates the indexes
+"""
+
+from enum import Enum
+from unittest.mock import patch
+
+from neuroglia.core.type_finder import TypeFinder
+from neuroglia.core.type_registry import EnumIndex, TypeRegistry
+
+
+class ShipmentStatus(Enum):
+    IN_TRANSIT = "in_transit"
+    DELIVERED = "delivered"
+
+
+class Priority(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+class Shipment:
+    id: str
+
+
+class TestEnumIndex:
+    def test_find_by_exact_value(self):
+        assert EnumIndex([ShipmentStatus]).find("delivered") == ShipmentStatus.DELIVERED
+
+    def test_find_by_lower_cased_value(self):
+        assert EnumIndex([ShipmentStatus]).find("DELIVERED") == ShipmentStatus.DELIVERED
+
+    def test_find_by_name(self):
+        assert EnumIndex([Priority]).find("HIGH") == Priority.HIGH
+
+    def test_find_by_upper_cased_name(self):
+        assert EnumIndex([Priority]).find("low") == Priority.LOW
+
+    def test_find_returns_none_when_no_member_matches(self):
+        assert EnumIndex([ShipmentStatus, Priority]).find("unknown") is None
+
+
+class TestTypeRegistryEnumLookup:
+    def test_find_enum_in_target_type_module(self):
+        registry = TypeRegistry()
+
+        assert registry.find_enum_for_value("in_transit", Shipment) == ShipmentStatus.IN_TRANSIT
+
+    def test_find_enum_in_registered_modules(self):
+        registry = TypeRegistry()
+        registry.register_module(__name__)
+
+        assert registry.find_enum_for_value("HIGH") == Priority.HIGH
+
+    def test_module_index_is_built_once(self):
+        registry = TypeRegistry()
+
+        with patch.object(TypeFinder, "get_types", wraps=TypeFinder.get_types) as get_types:
+            for _ in range(10):
+                registry.find_enum_for_value("delivered", Shipment)
+
+        assert get_types.call_count == 1
+
+    def test_register_module_invalidates_indexes(self):
+        registry = TypeRegistry()
+        registry.find_enum_for_value("delivered", Shipment)
+
+        registry.register_module(__name__)
+
+        with patch.object(TypeFinder, "get_types", wraps=TypeFinder.get_types) as get_types:
+            registry.find_enum_for_value("delivered", Shipment)
+
+        assert get_types.call_count == 2
@@ -59,8 +59,9 @@ def pytest_configure(config):
         - pytest -m unit: Run only unit tests
         - pytest -m "not slow": Skip slow tests
         - pytest -m "integration and database": Run database integration tests
+        - NEUROGLIA_BENCHMARKS=1 pytest -m benchmark: Run micro-benchmarks
     """
-    markers = ["unit: marks tests as unit tests (fast, isolated, no external dependencies)", "integration: marks tests as integration tests (requires databases, services)", "slow: marks tests as slow running (> 1 second)", "database: marks tests that require MongoDB or other databases", "eventstore: marks tests that require EventStoreDB", "external: marks tests that require external services (Redis, HTTP APIs)", "e2e: marks tests as end-to-end (complete workflows across all layers)"]
+    markers = ["unit: marks tests as unit tests (fast, isolated, no external dependencies)", "integration: marks tests as integration tests (requires databases, services)", "slow: marks tests as slow running (> 1 second)", "database: marks tests that require MongoDB or other databases", "eventstore: marks tests that require EventStoreDB", "external: marks tests that require external services (Redis, HTTP APIs)", "e2e: marks tests as end-to-end (complete workflows across all layers)", "benchmark: marks micro-benchmarks (skipped unless NEUROGLIA_BENCHMARKS=1)"]
     for marker in markers:
         config.addinivalue_line("markers", marker)
 